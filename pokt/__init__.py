@@ -1,3 +1,3 @@
-from .providers import PoktRPCDataProvider
+from .providers import PoktRPCDataProvider, AsyncPoktRPCDataProvider
 from .wallet import create_new_ppk, address_from_pubkey
 from .views import name_from_chain_id, chain_id_from_name
@@ -0,0 +1,276 @@
+"""
+Ingestion of blocks and their contained transactions from RPC with asyncio.
+"""
+
+import asyncio
+from collections import deque
+from functools import wraps
+from typing import Optional
+
+import aiohttp
+
+from ..rpc.async_utils import make_async_session
+from ..rpc.data.async_block import async_get_block, async_get_block_transactions
+from ..rpc.errors import PoktHTTPError, PoktRPCError, PortalRPCError
+from ..rpc.models import BlockHeader
+from ..rpc.models.projection import prune
+from ..rpc.retry import RetryPolicy
+from .ingest import (
+    INDEX_TX_EXCLUDE,
+    TXS_PER_PAGE,
+    EmptyBlockError,
+    QueueT,
+    RetriesExceededError,
+    MAX_PAGE_WORKERS,
+    _BlockGroup,
+    _block_response,
+    _has_more_pages,
+    ingest_retry_policy,
+    planned_pages,
+    txs_to_tables,
+)
+from .manifest import RangeManifest
+from .schema import flatten_header
+from .store import BlockStore
+
+
+def _reporting_errors(fn, progress_queue: Optional[QueueT], *error_info):
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except Exception:
+            if progress_queue:
+                progress_queue.put(("error",) + error_info)
+            raise
+
+    return wrapper
+
+
+async def _call_with_retries(retry_policy: RetryPolicy, fn, *args, **kwargs):
+    try:
+        return await retry_policy.call_async(fn, *args, **kwargs)
+    except (PoktHTTPError, PoktRPCError, PortalRPCError, EmptyBlockError) as e:
+        raise RetriesExceededError(str(e)) from e
+
+
+async def _get_block_transactions_data(
+    rpc_url: str,
+    height: int,
+    page: int,
+    session: Optional[aiohttp.ClientSession] = None,
+    block_store: Optional[BlockStore] = None,
+) -> dict:
+    if block_store is not None:
+        data = await asyncio.to_thread(
+            block_store.get_block_transactions, height, page, TXS_PER_PAGE
+        )
+        if data is not None:
+            # Pages stored by earlier versions hold the whole transactions.
+            return prune(data, INDEX_TX_EXCLUDE)
+    data = await async_get_block_transactions(
+        rpc_url,
+        height=height,
+        page=page,
+        per_page=TXS_PER_PAGE,
+        prove=False,
+        order="desc",
+        session=session,
+        raw=True,
+        exclude=INDEX_TX_EXCLUDE,
+    )
+    if block_store is not None:
+        await asyncio.to_thread(
+            block_store.put_block_transactions, height, page, TXS_PER_PAGE, data
+        )
+    return data
+
+
+async def _get_block_header(
+    rpc_url: str,
+    height: int,
+    session: Optional[aiohttp.ClientSession] = None,
+    block_store: Optional[BlockStore] = None,
+) -> BlockHeader:
+    if block_store is not None:
+        data = await asyncio.to_thread(block_store.get_block, height)
+        if data is not None:
+            return _block_response(data).block.header
+    data = await async_get_block(rpc_url, height=height, session=session, raw=True)
+    block = _block_response(data)
+    if block.block is None:
+        raise EmptyBlockError(height)
+    if block_store is not None:
+        await asyncio.to_thread(block_store.put_block, height, data)
+    return block.block.header
+
+
+async def async_ingest_tx_data_by_block(
+    block_no: int,
+    rpc_url: str,
+    session: Optional[aiohttp.ClientSession] = None,
+    retries: int = 100,
+    progress_queue: Optional[QueueT] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    block_store: Optional[BlockStore] = None,
+    num_txs: Optional[int] = None,
+) -> list[dict]:
+    if retry_policy is None:
+        retry_policy = ingest_retry_policy(retries)
+    semaphore = asyncio.Semaphore(MAX_PAGE_WORKERS)
+
+    async def fetch_page(page):
+        fetch = _reporting_errors(
+            _get_block_transactions_data, progress_queue, "txs", block_no, page
+        )
+        async with semaphore:
+            return await _call_with_retries(
+                retry_policy, fetch, rpc_url, block_no, page, session, block_store
+            )
+
+    txs = []
+    page = 1
+    if num_txs is not None:
+        pages = planned_pages(num_txs)
+        data_pages = await asyncio.gather(*(fetch_page(p) for p in range(1, pages + 1)))
+        for data in data_pages:
+            if data.get("txs"):
+                txs.extend(data["txs"])
+        if not data_pages or not _has_more_pages(data_pages[-1]):
+            return txs
+        page = pages + 1
+    while True:
+        data = await fetch_page(page)
+        if not data.get("txs"):
+            break
+        txs.extend(data["txs"])
+        page += 1
+    return txs
+
+
+async def async_ingest_block_header(
+    block_no: int,
+    rpc_url: str,
+    session: Optional[aiohttp.ClientSession] = None,
+    retries: int = 100,
+    progress_queue: Optional[QueueT] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    block_store: Optional[BlockStore] = None,
+) -> BlockHeader:
+    if retry_policy is None:
+        retry_policy = ingest_retry_policy(retries)
+    fetch = _reporting_errors(_get_block_header, progress_queue, "block", block_no)
+    return await _call_with_retries(
+        retry_policy, fetch, rpc_url, block_no, session, block_store
+    )
+
+
+async def async_ingest_block(
+    block_no: int,
+    rpc_url: str,
+    session: Optional[aiohttp.ClientSession] = None,
+    progress_queue: Optional[QueueT] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    block_store: Optional[BlockStore] = None,
+):
+    header = await async_ingest_block_header(
+        block_no,
+        rpc_url,
+        session,
+        progress_queue=progress_queue,
+        retry_policy=retry_policy,
+        block_store=block_store,
+    )
+    txs = await async_ingest_tx_data_by_block(
+        block_no,
+        rpc_url,
+        session,
+        progress_queue=progress_queue,
+        retry_policy=retry_policy,
+        block_store=block_store,
+        num_txs=header.num_txs,
+    )
+    # Building the tables is CPU bound, so it runs on a thread while the other blocks keep fetching.
+    txs_table, msgs_tables = await asyncio.to_thread(txs_to_tables, txs)
+    return txs_table, flatten_header(header), msgs_tables
+
+
+async def async_ingest_block_range(
+    starting_block: int,
+    ending_block: int,
+    rpc_url: str,
+    block_parquet,
+    tx_parquet,
+    msgs_parquet,
+    batch_size=1000,
+    concurrency: int = 64,
+    session: Optional[aiohttp.ClientSession] = None,
+    progress_queue: Optional[QueueT] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    block_store: Optional[BlockStore] = None,
+    manifest: Optional[RangeManifest] = None,
+):
+    """
+    Ingest the blocks from starting_block to ending_block into the parquet directories,
+    as ingest_block_range does, with up to concurrency blocks fetched at once.
+    """
+    own_session = session is None
+    if own_session:
+        session = make_async_session(
+            limit=2 * concurrency, limit_per_host=2 * concurrency
+        )
+    if retry_policy is None:
+        retry_policy = ingest_retry_policy()
+    pending = deque()
+    next_block = starting_block
+    group = _BlockGroup(starting_block)
+    block_no = starting_block
+    writing = None
+    try:
+        i = 0
+        while pending or next_block <= ending_block:
+            while len(pending) < concurrency and next_block <= ending_block:
+                block = async_ingest_block(
+                    next_block,
+                    rpc_url,
+                    session=session,
+                    retry_policy=retry_policy,
+                    block_store=block_store,
+                )
+                pending.append((next_block, asyncio.ensure_future(block)))
+                next_block += 1
+            block_no, task = pending.popleft()
+            if i != 0 and i % batch_size == 0:
+                # Only one group is written at a time, holding back the next if the disk falls behind.
+                if writing is not None:
+                    await writing
+                writing = asyncio.ensure_future(
+                    asyncio.to_thread(
+                        group.write,
+                        block_parquet,
+                        tx_parquet,
+                        msgs_parquet,
+                        block_no - 1,
+                        progress_queue,
+                        manifest,
+                    )
+                )
+                group = _BlockGroup(block_no)
+            group.add(*await task)
+            i += 1
+        if writing is not None:
+            await writing
+        await asyncio.to_thread(
+            group.write,
+            block_parquet,
+            tx_parquet,
+            msgs_parquet,
+            block_no,
+            progress_queue,
+            manifest,
+        )
+    finally:
+        for _, task in pending:
+            task.cancel()
+        if own_session:
+            await session.close()
@@ -0,0 +1,342 @@
+"""
+Columnar decoding of block transactions, from the decoded JSON straight into Arrow.
+"""
+
+from typing import Callable, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .schema import MSG_TABLES, tx_schema
+
+_str = pa.string()
+_int = pa.int64()
+
+_coin = pa.struct([("amount", _str), ("denom", _str)])
+_pub_key = pa.struct([("type", _str), ("value", _str)])
+_hash_range = pa.struct(
+    [
+        ("merkleHash", _str),
+        ("range", pa.struct([("lower", _str), ("upper", _str)])),
+    ]
+)
+_relay_proof = pa.struct(
+    [
+        ("request_hash", _str),
+        ("entropy", _int),
+        ("session_block_height", _int),
+        ("servicer_pub_key", _str),
+        ("blockchain", _str),
+        (
+            "aat",
+            pa.struct(
+                [
+                    ("version", _str),
+                    ("app_pub_key", _str),
+                    ("client_pub_key", _str),
+                    ("signature", _str),
+                ]
+            ),
+        ),
+        ("signature", _str),
+    ]
+)
+
+# The union of the fields of every message's value, each message only filling in its own.
+_msg_value = pa.struct(
+    [
+        ("address", _str),
+        ("signer_address", _str),
+        ("validator_address", _str),
+        ("application_address", _str),
+        ("from_address", _str),
+        ("to_address", _str),
+        ("amount", _str),
+        ("action", _str),
+        ("param_key", _str),
+        (
+            "upgrade",
+            pa.struct(
+                [
+                    ("Height", _int),
+                    ("Version", _str),
+                    ("OldUpgradeHeight", _int),
+                ]
+            ),
+        ),
+        ("pubkey", _pub_key),
+        ("public_key", _pub_key),
+        ("chains", pa.list_(_str)),
+        ("value", _str),
+        ("service_url", _str),
+        ("output_address", _str),
+        (
+            "header",
+            pa.struct(
+                [
+                    ("app_public_key", _str),
+                    ("chain", _str),
+                    ("session_height", _int),
+                ]
+            ),
+        ),
+        ("merkle_root", _hash_range),
+        ("total_proofs", _int),
+        ("expiration_height", _int),
+        ("evidence_type", _int),
+        (
+            "merkle_proofs",
+            pa.struct(
+                [
+                    ("index", _int),
+                    ("hash_ranges", pa.list_(_hash_range)),
+                    ("target_range", _hash_range),
+                ]
+            ),
+        ),
+        ("leaf", pa.struct([("type", _str), ("value", _relay_proof)])),
+    ]
+)
+
+TX_TYPE = pa.struct(
+    [
+        ("hash", _str),
+        ("height", _int),
+        ("index", _int),
+        (
+            "tx_result",
+            pa.struct(
+                [
+                    ("code", _int),
+                    ("codespace", _str),
+                    ("signer", _str),
+                    ("recipient", _str),
+                    ("message_type", _str),
+                ]
+            ),
+        ),
+        (
+            "stdTx",
+            pa.struct(
+                [
+                    ("entropy", _int),
+                    ("fee", pa.list_(_coin)),
+                    ("msg", pa.struct([("type", _str), ("value", _msg_value)])),
+                    ("signature", pa.struct([("pub_key", _str)])),
+                ]
+            ),
+        ),
+    ]
+)
+
+ColumnT = Union[tuple, Callable[[pa.Array, list], pa.Array]]
+
+
+def _path(array: pa.Array, *names: str) -> pa.Array:
+    for name in names:
+        array = pc.struct_field(array, name)
+    return array
+
+
+def _first(array: pa.ListArray) -> pa.Array:
+    # The first item of every list, null for empty lists.
+    indices = pc.if_else(
+        pc.greater(pc.list_value_length(array), 0),
+        array.offsets[:-1],
+        pa.scalar(None, array.offsets.type),
+    )
+    return array.values.take(indices)
+
+
+def _hash_ranges(values: pa.Array, txs: list) -> pa.Array:
+    ranges = _path(values, "merkle_proofs", "hash_ranges")
+    items = ranges.values
+    flat = pa.StructArray.from_arrays(
+        [
+            _path(items, "merkleHash"),
+            _path(items, "range", "lower"),
+            _path(items, "range", "upper"),
+        ],
+        names=["merkle_hash", "range_lower", "range_upper"],
+    )
+    return pa.ListArray.from_arrays(ranges.offsets, flat, mask=ranges.is_null())
+
+
+def _aat(name: str) -> Callable[[pa.Array, list], pa.Array]:
+    def column(values: pa.Array, txs: list) -> pa.Array:
+        aat = _path(values, "leaf", "value", "aat")
+        return pc.if_else(pc.is_null(aat), "Empty", _path(aat, name))
+
+    return column
+
+
+def _old_upgrade_height(values: pa.Array, txs: list) -> pa.Array:
+    # Upgrades from before the field was added default to 1, as in the Upgrade model.
+    return pc.fill_null(_path(values, "upgrade", "OldUpgradeHeight"), 1)
+
+
+def _param_value(values: pa.Array, txs: list) -> pa.Array:
+    # Parameter values can be any JSON, so they're taken from the transactions as decoded.
+    return pa.array(
+        [str(tx["stdTx"]["msg"]["value"].get("param_value")) for tx in txs], _str
+    )
+
+
+# The columns of every message table, as paths into the message's value or functions of it.
+_MSG_COLUMNS: dict[tuple[str, str], dict[str, ColumnT]] = {
+    ("pocketcore", "proof"): {
+        "merkle_proof_index": ("merkle_proofs", "index"),
+        "target_merkle_hash": ("merkle_proofs", "target_range", "merkleHash"),
+        "target_merkle_lower": ("merkle_proofs", "target_range", "range", "lower"),
+        "target_merkle_upper": ("merkle_proofs", "target_range", "range", "upper"),
+        "hash_ranges": _hash_ranges,
+        "request_hash": ("leaf", "value", "request_hash"),
+        "entropy": ("leaf", "value", "entropy"),
+        "session_block_height": ("leaf", "value", "session_block_height"),
+        "servicer_pub_key": ("leaf", "value", "servicer_pub_key"),
+        "blockchain": ("leaf", "value", "blockchain"),
+        "aat_version": _aat("version"),
+        "aat_app_pub_key": _aat("app_pub_key"),
+        "aat_client_pub_key": _aat("client_pub_key"),
+        "aat_signature": _aat("signature"),
+        "signature": ("leaf", "value", "signature"),
+        "evidence_type": ("evidence_type",),
+    },
+    ("pocketcore", "claim"): {
+        "from_address": ("from_address",),
+        "total_proofs": ("total_proofs",),
+        "expiration_height": ("expiration_height",),
+        "evidence_type": ("evidence_type",),
+        "app_pub_key": ("header", "app_public_key"),
+        "chain": ("header", "chain"),
+        "session_height": ("header", "session_height"),
+        "merkle_hash": ("merkle_root", "merkleHash"),
+        "merkle_root_lower": ("merkle_root", "range", "lower"),
+        "merkle_root_upper": ("merkle_root", "range", "upper"),
+    },
+    ("pos", "MsgStake"): {
+        "public_key": ("public_key", "value"),
+        "public_key_type": ("public_key", "type"),
+        "chains": ("chains",),
+        "value": ("value",),
+        "service_url": ("service_url",),
+        "output_address": ("output_address",),
+    },
+    ("pos", "MsgBeginUnstake"): {
+        "validator_address": ("validator_address",),
+        "signer_address": ("signer_address",),
+    },
+    ("pos", "MsgUnjail"): {
+        "address": ("address",),
+        "signer_address": ("signer_address",),
+    },
+    ("pos", "Send"): {
+        "from_address": ("from_address",),
+        "to_address": ("to_address",),
+        "amount": ("amount",),
+    },
+    ("apps", "MsgAppStake"): {
+        "pubkey": ("pubkey", "value"),
+        "pubkey_type": ("pubkey", "type"),
+        "chains": ("chains",),
+        "value": ("value",),
+    },
+    ("apps", "MsgAppBeginUnstake"): {
+        "application_address": ("application_address",),
+    },
+    ("apps", "MsgAppUnjail"): {
+        "address": ("address",),
+    },
+    ("gov", "msg_dao_transfer"): {
+        "from_address": ("from_address",),
+        "to_address": ("to_address",),
+        "amount": ("amount",),
+        "action": ("action",),
+    },
+    ("gov", "msg_change_param"): {
+        "address": ("address",),
+        "param_key": ("param_key",),
+        "param_value": _param_value,
+    },
+    ("gov", "msg_upgrade"): {
+        "address": ("address",),
+        "upgrade_height": ("upgrade", "Height"),
+        "version": ("upgrade", "Version"),
+        "old_upgrade_height": _old_upgrade_height,
+    },
+}
+
+# The message types stored in each table, e.g. both pos/MsgStake and pos/8.0MsgStake in pos/MsgStake.
+_TABLE_TYPES: dict[tuple[str, str], list[str]] = {}
+for _type, (_module, _name, _, _) in MSG_TABLES.items():
+    _TABLE_TYPES.setdefault((_module, _name), []).append(_type)
+
+
+def _tx_batch(array: pa.StructArray) -> pa.RecordBatch:
+    std_tx = _path(array, "stdTx")
+    fee = _first(_path(std_tx, "fee"))
+    columns = {
+        "height": _path(array, "height"),
+        "hash_": _path(array, "hash"),
+        "index": _path(array, "index"),
+        "result_code": _path(array, "tx_result", "code"),
+        "codespace": _path(array, "tx_result", "codespace"),
+        "signer": _path(array, "tx_result", "signer"),
+        "recipient": _path(array, "tx_result", "recipient"),
+        "msg_type": _path(array, "tx_result", "message_type"),
+        "entropy": _path(std_tx, "entropy"),
+        "fee_amount": _path(fee, "amount"),
+        "fee_denom": _path(fee, "denom"),
+        "signer_pubkey": _path(std_tx, "signature", "pub_key"),
+        "empty_msg": pc.is_null(_path(std_tx, "msg")),
+    }
+    return pa.RecordBatch.from_arrays(
+        [columns[field.name].cast(field.type) for field in tx_schema],
+        schema=tx_schema,
+    )
+
+
+def _msg_batch(
+    schema: pa.Schema, columns: dict, array: pa.StructArray, txs: list
+) -> pa.RecordBatch:
+    values = _path(array, "stdTx", "msg", "value")
+    arrays = []
+    for field in schema:
+        if field.name in ("height", "index"):
+            column = _path(array, field.name)
+        elif field.name == "hash_":
+            column = _path(array, "hash")
+        else:
+            column = columns[field.name]
+            if callable(column):
+                column = column(values, txs)
+            else:
+                column = _path(values, *column)
+        arrays.append(column.cast(field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def decode_txs(
+    txs: list[dict],
+) -> tuple[pa.RecordBatch, dict[str, dict[str, pa.RecordBatch]]]:
+    """
+    Decode the transactions of a blocktxs response into a record batch of tx_schema,
+    along with the record batches of their messages by module and type, as laid out in
+    the index.
+    """
+    array = pa.array(txs, type=TX_TYPE)
+    msg_types = _path(array, "stdTx", "msg", "type")
+    msgs: dict[str, dict[str, pa.RecordBatch]] = {}
+    for (module, name), types in _TABLE_TYPES.items():
+        mask = pc.is_in(msg_types, value_set=pa.array(types, _str))
+        if not pc.any(mask).as_py():
+            continue
+        indices = pc.indices_nonzero(mask)
+        schema = MSG_TABLES[types[0]][3]
+        msgs.setdefault(module, {})[name] = _msg_batch(
+            schema,
+            _MSG_COLUMNS[(module, name)],
+            array.take(indices),
+            [txs[i] for i in indices.to_pylist()],
+        )
+    return _tx_batch(array), msgs
@@ -2,6 +2,8 @@
 Ingestion of blocks and their contained transactions from RPC.
 """
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 import multiprocessing as mp
 import os
 import queue
@@ -12,9 +14,26 @@ import pyarrow.parquet as pq
 from requests import Session
 
 
-from ..rpc.utils import PoktRPCError, PortalRPCError
-from ..rpc.models import BlockHeader, Transaction
-from ..rpc.data.block import get_block_transactions, get_block
+from ..rpc.data import get_block, get_block_transactions
+from ..rpc.errors import EmptyBlockError
+from ..rpc.retry import RetryBudget, RetryPolicy
+from ..rpc.utils import (
+    PoktHTTPError,
+    PoktRPCError,
+    PortalRPCError,
+    make_session,
+)
+from ..rpc.models.projection import prune, tx_exclude
+from ..rpc.models.trusted import construct_trusted
+from ..rpc.models import (
+    BlockHeader,
+    QueryBlockResponse,
+    QueryBlockTXsResponse,
+    Transaction,
+)
+from .columnar import decode_txs
+from .manifest import HEADERS, MSGS, TXS, RangeManifest
+from .store import BlockStore
 from .schema import (
     block_header_schema,
     tx_schema,
@@ -26,11 +45,121 @@ from .schema import (
 
 QueueT = Union[queue.Queue, mp.Queue]
 
+TXS_PER_PAGE = 1000
+# The most pages of a block's transactions requested at once.
+MAX_PAGE_WORKERS = 8
+
+# The parts of the transactions that aren't written to the index, skipped over while decoding the pages.
+INDEX_TX_EXCLUDE = tx_exclude("txs")
+
 
 class RetriesExceededError(Exception):
     pass
 
 
+def ingest_retry_policy(
+    retries: int = 100, budget: Optional[RetryBudget] = None
+) -> RetryPolicy:
+    """
+    The retry policy used while ingesting, retrying any RPC error with a backoff capped at 30 seconds.
+    """
+    return RetryPolicy(
+        max_attempts=retries + 1,
+        backoff_base=0.5,
+        backoff_max=30.0,
+        retry_pokt_codes=None,
+        retry_exceptions=(EmptyBlockError,),
+        budget=(
+            RetryBudget(ratio=0.5, min_retries=retries, max_tokens=10 * retries)
+            if budget is None
+            else budget
+        ),
+    )
+
+
+def _reporting_errors(fn, progress_queue: Optional[QueueT], *error_info):
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            if progress_queue:
+                progress_queue.put(("error",) + error_info)
+            raise
+
+    return wrapper
+
+
+def _call_with_retries(retry_policy: RetryPolicy, fn, *args, **kwargs):
+    try:
+        return retry_policy.call(fn, *args, **kwargs)
+    except (PoktHTTPError, PoktRPCError, PortalRPCError, EmptyBlockError) as e:
+        raise RetriesExceededError(str(e)) from e
+
+
+def _get_block_transactions_data(
+    rpc_url: str,
+    height: int,
+    page: int,
+    session: Optional[Session] = None,
+    block_store: Optional[BlockStore] = None,
+) -> dict:
+    if block_store is not None:
+        data = block_store.get_block_transactions(height, page, TXS_PER_PAGE)
+        if data is not None:
+            # Pages stored by earlier versions hold the whole transactions.
+            return prune(data, INDEX_TX_EXCLUDE)
+    data = get_block_transactions(
+        rpc_url,
+        height=height,
+        page=page,
+        per_page=TXS_PER_PAGE,
+        prove=False,
+        order="desc",
+        session=session,
+        raw=True,
+        exclude=INDEX_TX_EXCLUDE,
+    )
+    if block_store is not None:
+        block_store.put_block_transactions(height, page, TXS_PER_PAGE, data)
+    return data
+
+
+def _get_block_transactions_page(
+    rpc_url: str,
+    height: int,
+    page: int,
+    session: Optional[Session] = None,
+    block_store: Optional[BlockStore] = None,
+) -> QueryBlockTXsResponse:
+    data = _get_block_transactions_data(rpc_url, height, page, session, block_store)
+    return QueryBlockTXsResponse(**data)
+
+
+def _block_response(data: dict) -> QueryBlockResponse:
+    # The indexer reads from a node it trusts, so the block is built without validation.
+    return construct_trusted(QueryBlockResponse, data)
+
+
+def _get_block_header(
+    rpc_url: str,
+    height: int,
+    session: Optional[Session] = None,
+    block_store: Optional[BlockStore] = None,
+) -> BlockHeader:
+    if block_store is not None:
+        data = block_store.get_block(height)
+        if data is not None:
+            return _block_response(data).block.header
+    data = get_block(rpc_url, height=height, session=session, raw=True)
+    block = _block_response(data)
+    if block.block is None:
+        raise EmptyBlockError(height)
+    if block_store is not None:
+        block_store.put_block(height, data)
+    return block.block.header
+
+
 def ingest_txs_by_block(
     block_no: int,
     rpc_url: str,
@@ -39,56 +168,86 @@ def ingest_txs_by_block(
     retries: int = 100,
     txs: Optional[list[Transaction]] = None,
     progress_queue: Optional[QueueT] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    block_store: Optional[BlockStore] = None,
 ) -> list[Transaction]:
     if txs is None:
         txs = []
-    try:
-        block_txs = get_block_transactions(
-            rpc_url, height=block_no, per_page=1000, page=page, session=session
+    if retry_policy is None:
+        retry_policy = ingest_retry_policy(retries)
+    while True:
+        fetch = _reporting_errors(
+            _get_block_transactions_page, progress_queue, "txs", block_no, page
         )
-    except (PoktRPCError, PortalRPCError):
-        if progress_queue:
-            progress_queue.put(("error", "txs", block_no, page))
-        if retries < 0:
-            raise RetriesExceededError(
-                "Out of retries getting block {} transactions page {}".format(
-                    block_no, page
-                )
-            )
-        return ingest_txs_by_block(
-            block_no,
-            rpc_url,
-            session=session,
-            page=page,
-            retries=retries - 1,
-            txs=txs,
-            progress_queue=progress_queue,
+        block_txs = _call_with_retries(
+            retry_policy, fetch, rpc_url, block_no, page, session, block_store
         )
-    while block_txs.txs:
+        if not block_txs.txs:
+            break
         txs.extend(block_txs.txs)
         page += 1
-        try:
-            block_txs = get_block_transactions(
-                rpc_url, height=block_no, per_page=1000, page=page, session=session
-            )
-        except (PoktRPCError, PortalRPCError):
-            if progress_queue:
-                progress_queue.put(("error", "txs", block_no, page))
-            if retries < 0:
-                raise RetriesExceededError(
-                    "Out of retries getting block {} transactions page {}".format(
-                        block_no, page
-                    )
-                )
-            return ingest_txs_by_block(
-                block_no,
-                rpc_url,
-                session=session,
-                page=page,
-                retries=retries - 1,
-                txs=txs,
-                progress_queue=progress_queue,
-            )
+    return txs
+
+
+def planned_pages(num_txs: int) -> int:
+    """
+    The number of blocktxs pages holding the num_txs transactions of a block.
+    """
+    return -(-num_txs // TXS_PER_PAGE)
+
+
+def _has_more_pages(data: dict) -> bool:
+    # A full last page may not be the last, when the header undercounts.
+    return len(data.get("txs") or []) >= TXS_PER_PAGE
+
+
+def ingest_tx_data_by_block(
+    block_no: int,
+    rpc_url: str,
+    session: Optional[Session] = None,
+    retries: int = 100,
+    progress_queue: Optional[QueueT] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    block_store: Optional[BlockStore] = None,
+    num_txs: Optional[int] = None,
+) -> list[dict]:
+    """
+    Like ingest_txs_by_block, but returning the transactions as decoded from JSON, without validating them into models or their payloads that aren't indexed.
+
+    Given the num_txs of the block's header, only the pages holding them are requested, at once, rather than paging until an empty page.
+    """
+    if retry_policy is None:
+        retry_policy = ingest_retry_policy(retries)
+
+    def fetch_page(page):
+        fetch = _reporting_errors(
+            _get_block_transactions_data, progress_queue, "txs", block_no, page
+        )
+        return _call_with_retries(
+            retry_policy, fetch, rpc_url, block_no, page, session, block_store
+        )
+
+    txs = []
+    page = 1
+    if num_txs is not None:
+        pages = planned_pages(num_txs)
+        if pages > 1:
+            with ThreadPoolExecutor(min(pages, MAX_PAGE_WORKERS)) as pool:
+                data_pages = list(pool.map(fetch_page, range(1, pages + 1)))
+        else:
+            data_pages = [fetch_page(p) for p in range(1, pages + 1)]
+        for data in data_pages:
+            if data.get("txs"):
+                txs.extend(data["txs"])
+        if not data_pages or not _has_more_pages(data_pages[-1]):
+            return txs
+        page = pages + 1
+    while True:
+        data = fetch_page(page)
+        if not data.get("txs"):
+            break
+        txs.extend(data["txs"])
+        page += 1
     return txs
 
 
@@ -98,29 +257,15 @@ def ingest_block_header(
     session: Optional[Session] = None,
     retries: int = 100,
     progress_queue: Optional[QueueT] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    block_store: Optional[BlockStore] = None,
 ) -> BlockHeader:
-    try:
-        block = get_block(rpc_url, height=block_no, session=session)
-    except (PoktRPCError, PortalRPCError):
-        if progress_queue:
-            progress_queue.put(("error", "block", block_no))
-        if retries < 0:
-            raise RetriesExceededError(
-                "Out of retries getting block {}".format(block_no)
-            )
-        return ingest_block_header(
-            block_no, rpc_url, session=session, retries=retries - 1
-        )
-    else:
-        if block.block is None and retries > 0:
-            return ingest_block_header(
-                block_no,
-                rpc_url,
-                session=session,
-                retries=retries - 1,
-                progress_queue=progress_queue,
-            )
-    return block.block.header
+    if retry_policy is None:
+        retry_policy = ingest_retry_policy(retries)
+    fetch = _reporting_errors(_get_block_header, progress_queue, "block", block_no)
+    return _call_with_retries(
+        retry_policy, fetch, rpc_url, block_no, session, block_store
+    )
 
 
 def _block_headers_to_table(headers):
@@ -172,6 +317,30 @@ def _msgs_to_tables(msgs):
     return tables
 
 
+def txs_to_tables(txs: list[dict]) -> tuple[pa.Table, dict[str, dict[str, pa.Table]]]:
+    """
+    The tx table and message tables of transactions decoded from JSON.
+
+    The transactions are decoded straight into Arrow with pokt.index.columnar, and only go through the
+    models when they don't fit its types.
+    """
+    try:
+        tx_batch, msg_batches = decode_txs(txs)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        models = [Transaction.parse_obj(tx) for tx in txs]
+        return (
+            _txs_to_table([flatten_tx(tx) for tx in models]),
+            _msgs_to_tables(flatten_tx_messages(models)),
+        )
+    msg_tables = {
+        module: {
+            type_: pa.Table.from_batches([batch]) for type_, batch in items.items()
+        }
+        for module, items in msg_batches.items()
+    }
+    return pa.Table.from_batches([tx_batch]), msg_tables
+
+
 def _append_msg_tables(msgs_dir, tables, start_block, end_block):
     for module, items in tables.items():
         for type_, table in items.items():
@@ -193,15 +362,100 @@ def ingest_block(
     rpc_url: str,
     session: Optional[Session] = None,
     progress_queue: Optional[QueueT] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    block_store: Optional[BlockStore] = None,
 ):
-    txs = ingest_txs_by_block(block_no, rpc_url, session, progress_queue=progress_queue)
-    flat_txs = [flatten_tx(tx) for tx in txs]
-    msgs = flatten_tx_messages(txs)
+    # The header comes first, so its num_txs can plan the pages of transactions to request.
     header = ingest_block_header(
-        block_no, rpc_url, session, progress_queue=progress_queue
+        block_no,
+        rpc_url,
+        session,
+        progress_queue=progress_queue,
+        retry_policy=retry_policy,
+        block_store=block_store,
     )
+    txs = ingest_tx_data_by_block(
+        block_no,
+        rpc_url,
+        session,
+        progress_queue=progress_queue,
+        retry_policy=retry_policy,
+        block_store=block_store,
+        num_txs=header.num_txs,
+    )
+    txs_table, msgs_tables = txs_to_tables(txs)
     flat_header = flatten_header(header)
-    return flat_txs, flat_header, msgs
+    return txs_table, flat_header, msgs_tables
+
+
+def _concat_msg_tables(msgs):
+    tables = {}
+    for module, items in msgs.items():
+        for type_, ts in items.items():
+            tables.setdefault(module, {})[type_] = pa.concat_tables(ts)
+    return tables
+
+
+class _BlockGroup:
+    """
+    The tables of a group of consecutive blocks, written out together to one parquet file per table.
+    """
+
+    def __init__(self, start_block: int):
+        self.start_block = start_block
+        self.headers = []
+        self.txs = []
+        self.num_txs = 0
+        self.msgs = defaultdict(lambda: defaultdict(list))
+        self._tables = None
+
+    def add(self, block_txs: pa.Table, block_header: dict, block_msgs: dict) -> None:
+        self.txs.append(block_txs)
+        self.num_txs += block_txs.num_rows
+        self.headers.append(block_header)
+        for mod, items in block_msgs.items():
+            for t, table in items.items():
+                self.msgs[mod][t].append(table)
+
+    def build(self) -> None:
+        """
+        Concatenate the tables of the blocks into the tables of the group, ahead of writing them.
+        """
+        if self._tables is None:
+            self._tables = (
+                _block_headers_to_table(self.headers) if self.headers else None,
+                pa.concat_tables(self.txs) if self.txs else None,
+                _concat_msg_tables(self.msgs) if self.msgs else None,
+            )
+
+    def write(
+        self,
+        block_parquet,
+        tx_parquet,
+        msgs_parquet,
+        end_block: int,
+        progress_queue: Optional[QueueT] = None,
+        manifest: Optional[RangeManifest] = None,
+    ) -> None:
+        self.build()
+        header_table, txs_table, msgs_tables = self._tables
+        # The blocks actually held, while the file names follow end_block.
+        last_block = self.start_block + len(self.headers) - 1
+        if header_table is not None:
+            _parquet_append(block_parquet, header_table, self.start_block, end_block)
+            if manifest is not None:
+                manifest.add(HEADERS, self.start_block, last_block)
+        if txs_table is not None:
+            _parquet_append(tx_parquet, txs_table, self.start_block, end_block)
+            if manifest is not None:
+                manifest.add(TXS, self.start_block, last_block)
+        if msgs_tables is not None:
+            _append_msg_tables(msgs_parquet, msgs_tables, self.start_block, end_block)
+        if manifest is not None and self.headers:
+            manifest.add(MSGS, self.start_block, last_block)
+        if progress_queue:
+            progress_queue.put(("block", len(self.headers)))
+            progress_queue.put(("txs", self.num_txs))
 
 
 def ingest_block_range(
@@ -214,55 +468,37 @@ def ingest_block_range(
     batch_size=1000,
     session: Optional[Session] = None,
     progress_queue: Optional[QueueT] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    block_store: Optional[BlockStore] = None,
+    manifest: Optional[RangeManifest] = None,
 ):
     if session is None:
-        session = Session()
-    txs = []
-    headers = []
-    msgs = {
-        "apps": defaultdict(list),
-        "gov": defaultdict(list),
-        "pos": defaultdict(list),
-        "pocketcore": defaultdict(list),
-    }
-    group_start = block_no = starting_block
+        session = make_session()
+    if retry_policy is None:
+        retry_policy = ingest_retry_policy()
+    group = _BlockGroup(starting_block)
+    block_no = starting_block
     for i, block_no in enumerate(range(starting_block, ending_block + 1)):
         if i != 0 and i % batch_size == 0:
-            header_table = _block_headers_to_table(headers)
-            txs_table = _txs_to_table(txs)
-            msgs_tables = _msgs_to_tables(msgs)
-            _parquet_append(block_parquet, header_table, group_start, block_no)
-            _parquet_append(tx_parquet, txs_table, group_start, block_no)
-            _append_msg_tables(msgs_parquet, msgs_tables, group_start, block_no)
-            if progress_queue:
-                progress_queue.put(("block", len(headers)))
-                progress_queue.put(("txs", len(txs)))
-            group_start = block_no
-            txs = []
-            headers = []
-            msgs = {
-                "apps": defaultdict(list),
-                "gov": defaultdict(list),
-                "pos": defaultdict(list),
-                "pocketcore": defaultdict(list),
-            }
-        block_txs, block_header, block_msgs = ingest_block(
-            block_no, rpc_url, session=session
+            # The file names are inclusive, so the group ends at the block before this one.
+            group.write(
+                block_parquet,
+                tx_parquet,
+                msgs_parquet,
+                block_no - 1,
+                progress_queue,
+                manifest,
+            )
+            group = _BlockGroup(block_no)
+        group.add(
+            *ingest_block(
+                block_no,
+                rpc_url,
+                session=session,
+                retry_policy=retry_policy,
+                block_store=block_store,
+            )
         )
-        txs.extend(block_txs)
-        headers.append(block_header)
-        for mod, items in block_msgs.items():
-            for t, ms in items.items():
-                msgs[mod][t].extend(ms)
-    if headers:
-        header_table = _block_headers_to_table(headers)
-        _parquet_append(block_parquet, header_table, group_start, block_no)
-    if txs:
-        txs_table = _txs_to_table(txs)
-        _parquet_append(tx_parquet, txs_table, group_start, block_no)
-    if msgs:
-        msgs_tables = _msgs_to_tables(msgs)
-        _append_msg_tables(msgs_parquet, msgs_tables, group_start, block_no)
-    if progress_queue:
-        progress_queue.put(("block", len(headers)))
-        progress_queue.put(("txs", len(txs)))
+    group.write(
+        block_parquet, tx_parquet, msgs_parquet, block_no, progress_queue, manifest
+    )
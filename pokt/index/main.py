@@ -1,13 +1,23 @@
-from argparse import ArgumentParser
+from argparse import ArgumentParser, ArgumentTypeError
+import asyncio
 from functools import partial
 from glob import iglob
 from multiprocessing import cpu_count, Manager, Pool, Queue
 import os
+import queue as queue_
 import re
+import threading
 from typing import Optional
 
 from pokt import PoktRPCDataProvider
+from pokt.index.async_ingest import async_ingest_block_range
 from pokt.index.ingest import ingest_block_range
+from pokt.index.manifest import RangeManifest
+from pokt.index.pipeline import pipeline_ingest_block_range
+from pokt.index.schedule import UNITS_PER_WORKER, sample_heights, weighted_bounds
+from pokt.index.store import BlockStore
+from pokt.rpc.batch import run_batch
+from pokt.rpc.ratelimit import RateLimiter, set_rate_limiter
 
 
 def chunks_bounds(start_block: int, end_block: int, batch_size: int):
@@ -21,6 +31,37 @@ def chunks_bounds(start_block: int, end_block: int, batch_size: int):
     ]
 
 
+def gap_bounds(gaps, batch_size: int):
+    return [
+        (a, min(a + batch_size - 1, end), batch_size)
+        for start, end in gaps
+        for a in range(start, end + 1, batch_size)
+    ]
+
+
+def sample_total_txs(rpc_url: str, heights, concurrency: int = 16):
+    rpc = PoktRPCDataProvider(rpc_url)
+    calls = {h: {"height": h} for h in heights if h > 0}
+    result = run_batch(rpc.get_block, calls, concurrency=concurrency)
+    if not result.ok:
+        return None
+    sampled = {h: block.block.header.total_txs for h, block in result.results.items()}
+    if None in sampled.values():
+        return None
+    sampled[0] = 0
+    return sampled
+
+
+def missing_ranges(
+    manifest: str, start_block: int, end_block: int, headers: str, txs: str
+):
+    with RangeManifest(manifest) as m:
+        if m.empty():
+            # An index written before the manifest is only known by its file names.
+            m.seed(headers, txs)
+        return m.missing(start_block, end_block)
+
+
 total_txs = 0
 total_blocks = 0
 total_errors = 0
@@ -58,8 +99,12 @@ def ingest_chunk(
     headers: str,
     txs: str,
     msgs: str,
+    block_store: Optional[str] = None,
+    manifest: Optional[str] = None,
 ):
     global total_errors
+    store = None if block_store is None else BlockStore(block_store)
+    ranges = None if manifest is None else RangeManifest(manifest)
     try:
         ingest_block_range(
             start,
@@ -70,11 +115,18 @@ def ingest_chunk(
             msgs,
             batch_size=batch_size,
             progress_queue=queue,
+            block_store=store,
+            manifest=ranges,
         )
     except Exception as e:
         print("Error encountered during: {} - {}".format(start, end))
         print(e)
         total_errors += 1
+    finally:
+        if store is not None:
+            store.close()
+        if ranges is not None:
+            ranges.close()
     return queue
 
 
@@ -115,10 +167,36 @@ def run_indexer(
     msgs: str,
     batch_size: int = 500,
     n_cores: Optional[int] = None,
+    block_store: Optional[str] = None,
+    rate_limit: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    manifest: Optional[str] = None,
+    gaps: Optional[list[tuple[int, int]]] = None,
+    schedule: str = "adaptive",
 ):
+    limiter = None
+    if rate_limit is not None or max_concurrency is not None:
+        # Every worker shares the one limiter, so the quota holds however many cores are used.
+        limiter = RateLimiter(rate_limit, max_concurrency=max_concurrency)
+        set_rate_limiter(limiter)
+    fill_gaps = gaps is not None
+    batches = gap_bounds(gaps if fill_gaps else [(start_block, end_block)], batch_size)
+    bounds = batches if fill_gaps else chunks_bounds(start_block, end_block, batch_size)
+    if schedule == "adaptive" and batches:
+        sampled_txs = sample_total_txs(rpc_url, sample_heights(batches))
+        if sampled_txs is None:
+            print("Couldn't sample the block headers, scheduling even chunks instead")
+        else:
+            n_units = (cpu_count() if n_cores is None else n_cores) * UNITS_PER_WORKER
+            bounds = weighted_bounds(batches, sampled_txs, n_units)
+            print(
+                "Scheduling {} chunks by their estimated work, ~{} transactions in all".format(
+                    len(bounds),
+                    sum(sampled_txs[b] - sampled_txs[a - 1] for a, b, _ in batches),
+                )
+            )
     man = Manager()
     progress = man.Queue()
-    bounds = chunks_bounds(start_block, end_block, batch_size)
     worker = partial(
         ingest_chunk,
         queue=progress,
@@ -126,8 +204,14 @@ def run_indexer(
         headers=headers,
         txs=txs,
         msgs=msgs,
+        block_store=block_store,
+        manifest=manifest,
     )
-    pool = Pool(n_cores)
+    if limiter is None:
+        pool = Pool(n_cores)
+    else:
+        pool = Pool(n_cores, initializer=set_rate_limiter, initargs=(limiter,))
+    # The pool hands each idle worker the next chunk, heaviest first when scheduled adaptively.
     for bound in bounds:
         pool.apply_async(worker, args=bound, callback=progress_reader)
     pool.close()
@@ -136,8 +220,147 @@ def run_indexer(
     man.shutdown()
 
 
-def async_main():
-    pass
+async def _report_progress(queue, interval: float = 0.5):
+    while True:
+        progress_reader(queue)
+        await asyncio.sleep(interval)
+
+
+async def async_main(
+    start_block: int,
+    end_block: int,
+    rpc_url: str,
+    headers: str,
+    txs: str,
+    msgs: str,
+    batch_size: int = 500,
+    concurrency: int = 64,
+    block_store: Optional[str] = None,
+    rate_limit: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    manifest: Optional[str] = None,
+    gaps: Optional[list[tuple[int, int]]] = None,
+):
+    global total_errors
+    if rate_limit is not None or max_concurrency is not None:
+        set_rate_limiter(RateLimiter(rate_limit, max_concurrency=max_concurrency))
+    progress = queue_.Queue()
+    reporter = asyncio.ensure_future(_report_progress(progress))
+    store = None if block_store is None else BlockStore(block_store)
+    ranges = None if manifest is None else RangeManifest(manifest)
+    if gaps is None:
+        gaps = [(start_block, end_block)]
+    try:
+        for start, end in gaps:
+            try:
+                await async_ingest_block_range(
+                    start,
+                    end,
+                    rpc_url,
+                    headers,
+                    txs,
+                    msgs,
+                    batch_size=batch_size,
+                    concurrency=concurrency,
+                    progress_queue=progress,
+                    block_store=store,
+                    manifest=ranges,
+                )
+            except Exception as e:
+                print("Error encountered during: {} - {}".format(start, end))
+                print(e)
+                total_errors += 1
+    finally:
+        reporter.cancel()
+        progress_reader(progress)
+        print()
+        if store is not None:
+            store.close()
+        if ranges is not None:
+            ranges.close()
+
+
+def parse_stage_workers(value: str):
+    workers = tuple(int(n) for n in value.split(","))
+    if len(workers) != 4 or min(workers) < 1:
+        raise ArgumentTypeError(
+            "Expected the workers of the fetch, decode, build and write stages, e.g. 8,2,1,1"
+        )
+    return workers
+
+
+def _report_progress_thread(queue, stop, interval: float = 0.5):
+    while not stop.wait(interval):
+        progress_reader(queue)
+
+
+def pipeline_main(
+    start_block: int,
+    end_block: int,
+    rpc_url: str,
+    headers: str,
+    txs: str,
+    msgs: str,
+    batch_size: int = 500,
+    stage_workers: tuple[int, int, int, int] = (8, 2, 1, 1),
+    block_store: Optional[str] = None,
+    rate_limit: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    manifest: Optional[str] = None,
+    gaps: Optional[list[tuple[int, int]]] = None,
+):
+    global total_errors
+    if rate_limit is not None or max_concurrency is not None:
+        set_rate_limiter(RateLimiter(rate_limit, max_concurrency=max_concurrency))
+    fetch_workers, decode_workers, build_workers, write_workers = stage_workers
+    progress = queue_.Queue()
+    stop = threading.Event()
+    reporter = threading.Thread(
+        target=_report_progress_thread, args=(progress, stop), daemon=True
+    )
+    reporter.start()
+    store = None if block_store is None else BlockStore(block_store)
+    ranges = None if manifest is None else RangeManifest(manifest)
+    if gaps is None:
+        gaps = [(start_block, end_block)]
+    stats = []
+    try:
+        for start, end in gaps:
+            try:
+                range_stats = pipeline_ingest_block_range(
+                    start,
+                    end,
+                    rpc_url,
+                    headers,
+                    txs,
+                    msgs,
+                    batch_size=batch_size,
+                    fetch_workers=fetch_workers,
+                    decode_workers=decode_workers,
+                    build_workers=build_workers,
+                    write_workers=write_workers,
+                    progress_queue=progress,
+                    block_store=store,
+                    manifest=ranges,
+                )
+                stats.append((start, end, range_stats))
+            except Exception as e:
+                print("Error encountered during: {} - {}".format(start, end))
+                print(e)
+                total_errors += 1
+    finally:
+        stop.set()
+        reporter.join()
+        progress_reader(progress)
+        print()
+        if store is not None:
+            store.close()
+        if ranges is not None:
+            ranges.close()
+    for start, end, range_stats in stats:
+        print("Stages of blocks {} - {}:".format(start, end))
+        for stage in range_stats.values():
+            print("  {}".format(stage))
 
 
 def main():
@@ -189,6 +412,53 @@ def main():
         default=250,
         help="The number of blocks to write to each parquet file. Defaults to 250.",
     )
+    parser.add_argument(
+        "--block-store",
+        type=str,
+        default=None,
+        help="A SQLite file of raw block responses, read from before requesting a block from the rpc and filled in with any blocks that were requested. Defaults to not storing responses.",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="The most rpc requests a second made across all of the cores. Defaults to no limit.",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help="The most rpc requests in flight at once across all of the cores. Defaults to no limit.",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=("process", "async", "pipeline"),
+        default="process",
+        help="Whether to index with a pool of processes, with asyncio in a single process, or with a pipeline of fetch, decode, build and write stages in a single process. Defaults to process.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=64,
+        help="The most blocks fetched at once by the async engine. Defaults to 64.",
+    )
+    parser.add_argument(
+        "--stage-workers",
+        type=parse_stage_workers,
+        default=(8, 2, 1, 1),
+        help="The threads of the fetch, decode, build and write stages of the pipeline engine. Defaults to 8,2,1,1.",
+    )
+    parser.add_argument(
+        "--schedule",
+        choices=("adaptive", "even"),
+        default="adaptive",
+        help="Whether the process engine splits the blocks into chunks of about equal work, estimated from the block headers, or of equal block counts. Defaults to adaptive.",
+    )
+    parser.add_argument(
+        "--fill-gaps",
+        action="store_true",
+        help="Only index the blocks from the start to the end that are missing from the manifest of the index directory, with the start defaulting to the first block.",
+    )
     args = parser.parse_args()
     headers = os.path.join(args.index_dir, "headers")
     txs = os.path.join(args.index_dir, "txs")
@@ -216,16 +486,91 @@ def main():
     for d in dirs:
         if not os.path.exists(d):
             os.makedirs(d)
-    start = get_last_indexed(headers, txs) if args.start is None else args.start
+    manifest = os.path.join(args.index_dir, "manifest.sqlite")
+    if args.start is not None:
+        start = args.start
+    elif args.fill_gaps:
+        start = 0
+    else:
+        start = get_last_indexed(headers, txs)
     end = get_latest_block(args.url) if args.end is None else args.end
-    n_cores = cpu_count() - 4 if args.n_cores is None else args.n_cores
     print("Writing batches of {} blocks to {}".format(args.batch_size, args.index_dir))
+    gaps = None
+    if args.fill_gaps:
+        gaps = missing_ranges(manifest, start + 1, end, headers, txs)
+        print(
+            "Filling {} missing ranges, {} blocks in all".format(
+                len(gaps), sum(b - a + 1 for a, b in gaps)
+            )
+        )
+    if args.engine == "async":
+        print(
+            "Indexing from block {} to block {} via {} with {} blocks at once".format(
+                start + 1, end, args.url, args.concurrency
+            )
+        )
+        asyncio.run(
+            async_main(
+                start + 1,
+                end,
+                args.url,
+                headers,
+                txs,
+                msgs,
+                args.batch_size,
+                args.concurrency,
+                block_store=args.block_store,
+                rate_limit=args.rate_limit,
+                max_concurrency=args.max_concurrency,
+                manifest=manifest,
+                gaps=gaps,
+            )
+        )
+        return
+    if args.engine == "pipeline":
+        print(
+            "Indexing from block {} to block {} via {} with {} stage workers".format(
+                start + 1, end, args.url, ",".join(map(str, args.stage_workers))
+            )
+        )
+        pipeline_main(
+            start + 1,
+            end,
+            args.url,
+            headers,
+            txs,
+            msgs,
+            args.batch_size,
+            args.stage_workers,
+            block_store=args.block_store,
+            rate_limit=args.rate_limit,
+            max_concurrency=args.max_concurrency,
+            manifest=manifest,
+            gaps=gaps,
+        )
+        return
+    n_cores = cpu_count() - 4 if args.n_cores is None else args.n_cores
     print(
         "Indexing from block {} to block {} via {} using {} cores".format(
             start + 1, end, args.url, n_cores
         )
     )
-    run_indexer(start + 1, end, args.url, headers, txs, msgs, args.batch_size, n_cores)
+    run_indexer(
+        start + 1,
+        end,
+        args.url,
+        headers,
+        txs,
+        msgs,
+        args.batch_size,
+        n_cores,
+        block_store=args.block_store,
+        rate_limit=args.rate_limit,
+        max_concurrency=args.max_concurrency,
+        manifest=manifest,
+        gaps=gaps,
+        schedule=args.schedule,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,151 @@
+"""
+A manifest of the block ranges already written to each table of the index.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from typing import Iterable, Sequence
+
+HEADERS = "headers"
+TXS = "txs"
+MSGS = "msgs"
+TABLES = (HEADERS, TXS, MSGS)
+
+RangeT = tuple[int, int]
+
+_FILE_NAME = re.compile(r"block_([0-9]+)-([0-9]+)\.parquet$")
+
+
+def merge_ranges(ranges: Iterable[RangeT]) -> list[RangeT]:
+    """
+    Merge inclusive block ranges that overlap or are adjacent, in order of their start.
+    """
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def range_gaps(ranges: Iterable[RangeT], start: int, end: int) -> list[RangeT]:
+    """
+    The inclusive ranges from start to end that none of ranges cover.
+    """
+    gaps = []
+    next_block = start
+    for a, b in merge_ranges(ranges):
+        if b < next_block:
+            continue
+        if a > end:
+            break
+        if a > next_block:
+            gaps.append((next_block, a - 1))
+        next_block = b + 1
+    if next_block <= end:
+        gaps.append((next_block, end))
+    return gaps
+
+
+def file_ranges(parquet_dir: str) -> list[RangeT]:
+    """
+    The ranges of blocks held by the block_<start>-<end>.parquet files of parquet_dir.
+
+    Before the manifest, a group's file was named by the first block of the next group,
+    so a file ending where another starts is taken to end the block before.
+    """
+    if not os.path.isdir(parquet_dir):
+        return []
+    names = [_FILE_NAME.match(name) for name in os.listdir(parquet_dir)]
+    bounds = [(int(m.group(1)), int(m.group(2))) for m in names if m]
+    starts = {start for start, _ in bounds}
+    return merge_ranges(
+        (start, end - 1 if end in starts and end > start else end)
+        for start, end in bounds
+    )
+
+
+class RangeManifest:
+    """
+    Parameters
+    ----------
+    path
+        The path of the SQLite file, created if it doesn't exist.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        # Indexer processes each open their own manifest, so wait on a busy file rather than failing.
+        self._con = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        with self._lock, self._con:
+            self._con.execute("PRAGMA journal_mode=WAL")
+            self._con.execute(
+                "CREATE TABLE IF NOT EXISTS ranges ("
+                "tbl TEXT NOT NULL, start_block INTEGER NOT NULL, end_block INTEGER NOT NULL, "
+                "PRIMARY KEY (tbl, start_block, end_block))"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        self._con.close()
+
+    def add(self, table: str, start_block: int, end_block: int) -> None:
+        """
+        Record the blocks from start_block to end_block, inclusive, as written to table.
+        """
+        with self._lock, self._con:
+            self._con.execute(
+                "INSERT OR IGNORE INTO ranges (tbl, start_block, end_block) VALUES (?, ?, ?)",
+                (table, start_block, end_block),
+            )
+
+    def empty(self) -> bool:
+        with self._lock:
+            return self._con.execute("SELECT 1 FROM ranges LIMIT 1").fetchone() is None
+
+    def seed(self, headers_dir: str, txs_dir: str) -> None:
+        """
+        Record the ranges of the parquet files already in the headers and transactions
+        directories, for an index written before the manifest.
+
+        The messages of a group were written along with its transactions, so they're
+        taken to cover the same ranges.
+        """
+        for table, ranges in (
+            (HEADERS, file_ranges(headers_dir)),
+            (TXS, file_ranges(txs_dir)),
+            (MSGS, file_ranges(txs_dir)),
+        ):
+            for start, end in ranges:
+                self.add(table, start, end)
+
+    def ranges(self, table: str) -> list[RangeT]:
+        """
+        The merged ranges of blocks written to table.
+        """
+        with self._lock:
+            rows = self._con.execute(
+                "SELECT start_block, end_block FROM ranges WHERE tbl = ?", (table,)
+            ).fetchall()
+        return merge_ranges(rows)
+
+    def missing(
+        self, start_block: int, end_block: int, tables: Sequence[str] = TABLES
+    ) -> list[RangeT]:
+        """
+        The ranges of blocks from start_block to end_block that are missing from any of
+        tables.
+        """
+        gaps = []
+        for table in tables:
+            gaps.extend(range_gaps(self.ranges(table), start_block, end_block))
+        return merge_ranges(gaps)
@@ -0,0 +1,416 @@
+"""
+Ingestion as a pipeline of fetch, decode, build and write stages.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from requests import Session
+
+from ..rpc.retry import RetryPolicy
+from ..rpc.utils import make_session
+from .ingest import (
+    MAX_PAGE_WORKERS,
+    QueueT,
+    _BlockGroup,
+    ingest_block_header,
+    ingest_retry_policy,
+    ingest_tx_data_by_block,
+    txs_to_tables,
+)
+from .manifest import RangeManifest
+from .schema import flatten_header
+from .store import BlockStore
+
+EmitT = Callable[[Any], bool]
+
+_DONE = object()
+# How often a worker waiting on a queue checks whether the pipeline has stopped.
+_POLL_INTERVAL = 0.1
+
+
+class StageStats:
+    """
+    The throughput and queue depth of a stage of a Pipeline.
+
+    The time its workers spend waiting for room on the queue of the next stage is
+    counted as blocked rather than busy, so a stage held back by the next shows as
+    blocked with a full queue.
+
+    Parameters
+    ----------
+    name
+        The name of the stage.
+    workers
+        The number of threads the stage runs on.
+    """
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.busy = 0.0
+        self.blocked = 0.0
+        self.max_depth = 0
+        self.started = None
+        self.finished = None
+        self._depth_total = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "{}: {} items, {:.1f}/s, {:.0%} busy, {:.0%} blocked, queue depth {:.1f} mean {} max".format(
+            self.name,
+            self.items,
+            self.throughput,
+            self.utilization,
+            self.blocked / (self.elapsed * self.workers) if self.elapsed else 0.0,
+            self.mean_depth,
+            self.max_depth,
+        )
+
+    def record(self, depth: int, busy: float, blocked: float = 0.0) -> None:
+        with self._lock:
+            self.items += 1
+            self.busy += busy
+            self.blocked += blocked
+            self._depth_total += depth
+            self.max_depth = max(self.max_depth, depth)
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        finished = time.monotonic() if self.finished is None else self.finished
+        return finished - self.started
+
+    @property
+    def throughput(self) -> float:
+        """
+        The items through the stage a second.
+        """
+        elapsed = self.elapsed
+        return self.items / elapsed if elapsed else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """
+        The share of the time of its workers the stage was busy.
+        """
+        elapsed = self.elapsed
+        return self.busy / (elapsed * self.workers) if elapsed else 0.0
+
+    @property
+    def mean_depth(self) -> float:
+        """
+        The mean depth of the queue of the stage as its items were taken.
+        """
+        return self._depth_total / self.items if self.items else 0.0
+
+
+class _Stage:
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[Any, EmitT], None],
+        workers: int,
+        queue_size: int,
+        on_close: Optional[Callable[[EmitT], None]],
+    ):
+        self.name = name
+        self.fn = fn
+        self.workers = workers
+        self.on_close = on_close
+        self.inbox = queue.Queue(queue_size)
+        self.stats = StageStats(name, workers)
+        self.running = workers
+
+
+class Pipeline:
+    """
+    Stages on their own threads, connected by bounded queues, each fed what the stage
+    before it emits.
+
+    Add the stages in order with stage, then run the pipeline over the items of the
+    first.
+    """
+
+    def __init__(self):
+        self._stages = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._error = None
+
+    @property
+    def stats(self) -> dict[str, StageStats]:
+        return {stage.name: stage.stats for stage in self._stages}
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    def stage(
+        self,
+        name: str,
+        fn: Callable[[Any, EmitT], None],
+        workers: int = 1,
+        queue_size: Optional[int] = None,
+        on_close: Optional[Callable[[EmitT], None]] = None,
+    ) -> "Pipeline":
+        """
+        Add a stage calling fn(item, emit) on each of its items, where emit(output)
+        passes output on to the next stage.
+
+        Parameters
+        ----------
+        name
+            The name of the stage in the stats.
+        fn
+            The function called on each item.
+        workers: optional
+            The threads the stage runs on, defaults to 1.
+        queue_size: optional
+            The most items waiting on the stage, defaults to twice its workers.
+        on_close: optional
+            Called with emit once all of the items have been through the stage, to pass
+            on anything it held back.
+        """
+        queue_size = 2 * workers if queue_size is None else queue_size
+        self._stages.append(_Stage(name, fn, workers, queue_size, on_close))
+        return self
+
+    def _put(self, q: queue.Queue, item: Any) -> bool:
+        while not self._stopped.is_set():
+            try:
+                q.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _get(self, q: queue.Queue) -> Any:
+        while not self._stopped.is_set():
+            try:
+                return q.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                pass
+        return _DONE
+
+    def _fail(self, error: Exception) -> None:
+        with self._lock:
+            if self._error is None:
+                self._error = error
+        self._stopped.set()
+
+    def _emitter(self, index: int) -> EmitT:
+        if index + 1 == len(self._stages):
+            return lambda item: True
+        inbox = self._stages[index + 1].inbox
+        return lambda item: self._put(inbox, item)
+
+    def _work(self, index: int) -> None:
+        stage = self._stages[index]
+        put = self._emitter(index)
+        blocked = 0.0
+
+        def emit(item):
+            nonlocal blocked
+            start = time.monotonic()
+            try:
+                return put(item)
+            finally:
+                blocked += time.monotonic() - start
+
+        try:
+            while True:
+                depth = stage.inbox.qsize()
+                item = self._get(stage.inbox)
+                if item is _DONE:
+                    break
+                blocked = 0.0
+                start = time.monotonic()
+                stage.fn(item, emit)
+                stage.stats.record(depth, time.monotonic() - start - blocked, blocked)
+            if self.stopped:
+                return
+            # Pass the end along to the other workers of the stage.
+            self._put(stage.inbox, _DONE)
+            with self._lock:
+                stage.running -= 1
+                last = stage.running == 0
+            if last:
+                if stage.on_close is not None:
+                    stage.on_close(emit)
+                stage.stats.finished = time.monotonic()
+                if index + 1 < len(self._stages):
+                    self._put(self._stages[index + 1].inbox, _DONE)
+        except Exception as e:
+            self._fail(e)
+
+    def run(self, items: Iterable[Any]) -> dict[str, StageStats]:
+        """
+        Run every item through the stages, returning the stats of each stage once
+        they're all through.
+
+        The first error raised by a stage stops the pipeline and is raised again here.
+        """
+        started = time.monotonic()
+        threads = []
+        for index, stage in enumerate(self._stages):
+            stage.stats.started = started
+            for _ in range(stage.workers):
+                thread = threading.Thread(target=self._work, args=(index,), daemon=True)
+                thread.start()
+                threads.append(thread)
+        try:
+            first = self._stages[0].inbox
+            for item in items:
+                if not self._put(first, item):
+                    break
+            self._put(first, _DONE)
+            for thread in threads:
+                thread.join()
+        finally:
+            self._stopped.set()
+        if self._error is not None:
+            raise self._error
+        return self.stats
+
+
+class _Sequencer:
+    """
+    Puts the decoded blocks back in height order, grouping them as ingest_block_range
+    does.
+    """
+
+    def __init__(
+        self,
+        starting_block: int,
+        ending_block: int,
+        batch_size: int,
+        slots: threading.Semaphore,
+    ):
+        self.next_block = starting_block
+        self.ending_block = ending_block
+        self.batch_size = batch_size
+        self.slots = slots
+        self.waiting = {}
+        self.group = _BlockGroup(starting_block)
+        self._lock = threading.Lock()
+
+    def add(self, block_no: int, block: tuple, emit: EmitT) -> None:
+        with self._lock:
+            self.waiting[block_no] = block
+            while self.next_block in self.waiting:
+                block = self.waiting.pop(self.next_block)
+                if len(self.group.headers) == self.batch_size:
+                    emit((self.group, self.next_block - 1))
+                    self.group = _BlockGroup(self.next_block)
+                self.group.add(*block)
+                self.next_block += 1
+                self.slots.release()
+
+    def close(self, emit: EmitT) -> None:
+        emit((self.group, self.ending_block))
+
+
+def pipeline_ingest_block_range(
+    starting_block: int,
+    ending_block: int,
+    rpc_url: str,
+    block_parquet,
+    tx_parquet,
+    msgs_parquet,
+    batch_size=1000,
+    fetch_workers: int = 8,
+    decode_workers: int = 2,
+    build_workers: int = 1,
+    write_workers: int = 1,
+    window: Optional[int] = None,
+    session: Optional[Session] = None,
+    progress_queue: Optional[QueueT] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    block_store: Optional[BlockStore] = None,
+    manifest: Optional[RangeManifest] = None,
+) -> dict[str, StageStats]:
+    """
+    Ingest the blocks from starting_block to ending_block into the parquet directories,
+    as ingest_block_range does, through the fetch, decode, build and write stages.
+
+    Parameters
+    ----------
+    fetch_workers: optional
+        The blocks fetched at once, defaults to 8.
+    decode_workers: optional
+        The blocks decoded at once, defaults to 2.
+    build_workers: optional
+        The groups built at once, defaults to 1.
+    write_workers: optional
+        The groups written at once, defaults to 1.
+    window: optional
+        The most blocks fetched or decoded ahead of the next block in height order,
+        defaults to four times the fetch and decode workers.
+
+    Returns the stats of each stage by its name.
+    """
+    if session is None:
+        # Each block being fetched requests up to MAX_PAGE_WORKERS pages at once.
+        session = make_session(pool_maxsize=fetch_workers * MAX_PAGE_WORKERS)
+    if retry_policy is None:
+        retry_policy = ingest_retry_policy()
+    if window is None:
+        window = 4 * (fetch_workers + decode_workers)
+    # Blocks wait in the sequencer until the blocks before them are decoded, so only so many are let in.
+    slots = threading.Semaphore(window)
+    sequencer = _Sequencer(starting_block, ending_block, batch_size, slots)
+    pipeline = Pipeline()
+
+    def heights():
+        for block_no in range(starting_block, ending_block + 1):
+            while not slots.acquire(timeout=_POLL_INTERVAL):
+                if pipeline.stopped:
+                    return
+            yield block_no
+
+    def fetch(block_no, emit):
+        header = ingest_block_header(
+            block_no,
+            rpc_url,
+            session,
+            progress_queue=progress_queue,
+            retry_policy=retry_policy,
+            block_store=block_store,
+        )
+        txs = ingest_tx_data_by_block(
+            block_no,
+            rpc_url,
+            session,
+            progress_queue=progress_queue,
+            retry_policy=retry_policy,
+            block_store=block_store,
+            num_txs=header.num_txs,
+        )
+        emit((block_no, header, txs))
+
+    def decode(item, emit):
+        block_no, header, txs = item
+        txs_table, msgs_tables = txs_to_tables(txs)
+        sequencer.add(block_no, (txs_table, flatten_header(header), msgs_tables), emit)
+
+    def build(item, emit):
+        group, _ = item
+        group.build()
+        emit(item)
+
+    def write(item, emit):
+        group, end_block = item
+        group.write(
+            block_parquet, tx_parquet, msgs_parquet, end_block, progress_queue, manifest
+        )
+
+    pipeline.stage("fetch", fetch, fetch_workers)
+    pipeline.stage("decode", decode, decode_workers, on_close=sequencer.close)
+    pipeline.stage("build", build, build_workers)
+    pipeline.stage("write", write, write_workers)
+    return pipeline.run(heights())
@@ -0,0 +1,80 @@
+"""
+Scheduling of the blocks to index across the indexer processes by their work.
+"""
+
+from typing import Mapping
+
+BoundT = tuple[int, int, int]
+
+# The work of fetching a block, whatever its transactions, in transactions.
+BLOCK_COST = 25
+# The units of work scheduled for each worker of the pool.
+UNITS_PER_WORKER = 4
+
+
+def sample_heights(batches: list[BoundT]) -> list[int]:
+    """
+    The heights whose header total_txs estimate the transactions of each of batches.
+    """
+    heights = set()
+    for start, end, _ in batches:
+        heights.add(start - 1)
+        heights.add(end)
+    return sorted(heights)
+
+
+def batch_cost(
+    bound: BoundT, total_txs: Mapping[int, int], block_cost: int = BLOCK_COST
+) -> int:
+    """
+    The estimated work of indexing the blocks of bound, from the total_txs at the
+    heights of sample_heights.
+    """
+    start, end, _ = bound
+    return block_cost * (end - start + 1) + total_txs[end] - total_txs[start - 1]
+
+
+def weighted_bounds(
+    batches: list[BoundT],
+    total_txs: Mapping[int, int],
+    n_units: int,
+    block_cost: int = BLOCK_COST,
+) -> list[BoundT]:
+    """
+    Merge the consecutive batches into about n_units units of equal estimated work,
+    heaviest first.
+
+    Parameters
+    ----------
+    batches
+        The (start, end, batch_size) of each batch, in order.
+    total_txs
+        The total_txs of the block header at each of the sample_heights of batches.
+    n_units
+        The number of units to aim for, a batch is never split so a heavy batch may make
+        up a unit alone.
+    block_cost: optional
+        The work of fetching a block, in transactions, defaults to BLOCK_COST.
+    """
+    costs = [batch_cost(bound, total_txs, block_cost) for bound in batches]
+    target = sum(costs) / max(n_units, 1)
+    units = []
+    unit_start = None
+    unit_cost = 0
+    for i, ((start, end, batch_size), cost) in enumerate(zip(batches, costs)):
+        # Close the unit early if the batch would take it further past the target than it's short of it.
+        if unit_start is not None and unit_cost + cost - target > target - unit_cost:
+            units.append((unit_cost, (unit_start, start - 1, batch_size)))
+            unit_start = None
+            unit_cost = 0
+        if unit_start is None:
+            unit_start = start
+        unit_cost += cost
+        contiguous = i + 1 < len(batches) and batches[i + 1][0] == end + 1
+        if unit_cost >= target or not contiguous:
+            units.append((unit_cost, (unit_start, end, batch_size)))
+            unit_start = None
+            unit_cost = 0
+    # Stable, so units of equal work keep their order along the chain.
+    units.sort(key=lambda unit: unit[0], reverse=True)
+    return [bound for _, bound in units]
@@ -3,7 +3,24 @@ import os
 from typing import TypedDict, Optional, Union
 import pyarrow as pa
 
-from ..rpc.models.validation import BlockHeader, Transaction, HashRange
+from ..rpc.models.validation import (
+    BlockHeader,
+    Transaction,
+    HashRange,
+    MSG_TYPES,
+    MsgAppStake,
+    MsgAppUnjail,
+    MsgBeginAppUnstake,
+    MsgBeginValidatorUnstake,
+    MsgChangeParam,
+    MsgClaim,
+    MsgDaoTransfer,
+    MsgProof,
+    MsgSend,
+    MsgUpgrade,
+    MsgValidatorStake,
+    MsgValidatorUnjail,
+)
 
 
 def camel_to_snake(s):
@@ -602,65 +619,76 @@ RecordT = Union[
 ]
 
 
+# The table of each message model, as (module, type, flatten, schema), where the type names the table.
+_msg_tables = {
+    MsgProof: ("pocketcore", "proof", _flatten_relay_proof_msg, proof_msg_schema),
+    MsgClaim: ("pocketcore", "claim", _flatten_claim_msg, claim_msg_schema),
+    MsgValidatorStake: (
+        "pos",
+        "MsgStake",
+        _flatten_node_stake_msg,
+        node_stake_msg_schema,
+    ),
+    MsgBeginValidatorUnstake: (
+        "pos",
+        "MsgBeginUnstake",
+        _flatten_node_begin_unstake_msg,
+        node_begin_unstake_msg_schema,
+    ),
+    MsgValidatorUnjail: (
+        "pos",
+        "MsgUnjail",
+        _flatten_node_unjail_msg,
+        node_unjail_msg_schema,
+    ),
+    MsgSend: ("pos", "Send", _flatten_send_msg, send_msg_schema),
+    MsgAppStake: ("apps", "MsgAppStake", _flatten_app_stake_msg, app_stake_msg_schema),
+    MsgBeginAppUnstake: (
+        "apps",
+        "MsgAppBeginUnstake",
+        _flatten_app_begin_unstake_msg,
+        app_begin_unstake_msg_schema,
+    ),
+    MsgAppUnjail: (
+        "apps",
+        "MsgAppUnjail",
+        _flatten_app_unjail_msg,
+        app_unjail_msg_schema,
+    ),
+    MsgDaoTransfer: (
+        "gov",
+        "msg_dao_transfer",
+        _flatten_dao_transfer_msg,
+        dao_transfer_msg_schema,
+    ),
+    MsgChangeParam: (
+        "gov",
+        "msg_change_param",
+        _flatten_change_param_msg,
+        dao_change_param_msg_schema,
+    ),
+    MsgUpgrade: ("gov", "msg_upgrade", _flatten_upgrade_msg, dao_upgrade_msg_schema),
+}
+
+# Every message type string, including the "pos/8.0..." aliases, resolved to its table up front.
+MSG_TABLES = {type_: _msg_tables[model] for type_, model in MSG_TYPES.items()}
+
+_msg_schemas = {
+    (module, type_): schema for module, type_, _, schema in _msg_tables.values()
+}
+
+
 def flatten_tx_message(tx: Transaction) -> tuple[Optional[RecordT], str, str]:
     if tx.stdTx.msg is None:
         return None, "Unknown", "Unknown"
     msg_type = tx.stdTx.msg.type_
-    flat = {}
-    if msg_type == "pocketcore/proof":
-        flat = _flatten_relay_proof_msg(tx)
-    elif msg_type == "pocketcore/claim":
-        flat = _flatten_claim_msg(tx)
-    elif msg_type == "pos/MsgStake":
-        flat = _flatten_node_stake_msg(tx)
-    elif msg_type == "pos/MsgBeginUnstake":
-        flat = _flatten_node_begin_unstake_msg(tx)
-    elif msg_type == "pos/MsgUnjail":
-        flat = _flatten_node_unjail_msg(tx)
-    elif msg_type == "pos/Send":
-        flat = _flatten_send_msg(tx)
-    elif msg_type == "apps/MsgAppStake":
-        flat = _flatten_app_stake_msg(tx)
-    elif msg_type == "apps/MsgAppBeginUnstake":
-        flat = _flatten_app_begin_unstake_msg(tx)
-    elif msg_type == "apps/MsgAppUnjail":
-        flat = _flatten_app_unjail_msg(tx)
-    elif msg_type == "gov/msg_dao_transfer":
-        flat = _flatten_dao_transfer_msg(tx)
-    elif msg_type == "gov/msg_change_param":
-        flat = _flatten_change_param_msg(tx)
-    elif msg_type == "gov/msg_upgrade":
-        flat = _flatten_upgrade_msg(tx)
-    module, t = msg_type.split("/")
-    return flat, module, t
-
-
-def schema_for_msg(module: str, type_: str) -> pa.schema:
-    if module == "pos":
-        if type_ == "Send":
-            return send_msg_schema
-        elif type_ == "MsgStake":
-            return node_stake_msg_schema
-        elif type_ == "MsgBeginUnstake":
-            return node_begin_unstake_msg_schema
-        elif type_ == "MsgUnjail":
-            return node_unjail_msg_schema
-    elif module == "pocketcore":
-        if type_ == "proof":
-            return proof_msg_schema
-        elif type_ == "claim":
-            return claim_msg_schema
-    elif module == "apps":
-        if type_ == "MsgAppStake":
-            return app_stake_msg_schema
-        elif type_ == "MsgAppUnjail":
-            return app_unjail_msg_schema
-        elif type_ == "MsgAppBeginUnstake":
-            return app_begin_unstake_msg_schema
-    elif module == "gov":
-        if type_ == "msg_upgrade":
-            return dao_upgrade_msg_schema
-        elif type_ == "msg_change_param":
-            return dao_change_param_msg_schema
-        elif type_ == "msg_dao_transfer":
-            return dao_transfer_msg_schema
+    table = MSG_TABLES.get(msg_type)
+    if table is None:
+        module, t = msg_type.split("/")
+        return {}, module, t
+    module, t, flatten, _ = table
+    return flatten(tx), module, t
+
+
+def schema_for_msg(module: str, type_: str) -> Optional[pa.Schema]:
+    return _msg_schemas.get((module, type_))
@@ -0,0 +1,98 @@
+"""
+A local store of the raw block responses pulled while indexing.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import zlib
+from typing import Optional
+
+from ..rpc.jsonlib import loads
+
+BLOCK = "block"
+BLOCK_TXS = "blocktxs"
+
+
+class BlockStore:
+    """
+    Parameters
+    ----------
+    path
+        The path of the SQLite file, created if it doesn't exist.
+    compression_level: optional
+        The zlib compression level responses are stored with, defaults to 6.
+    """
+
+    def __init__(self, path: str, compression_level: int = 6):
+        self.path = path
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        # Indexer processes each open their own store, so wait on a busy file rather than failing.
+        self._con = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        with self._lock, self._con:
+            self._con.execute("PRAGMA journal_mode=WAL")
+            self._con.execute(
+                "CREATE TABLE IF NOT EXISTS blobs (digest BLOB PRIMARY KEY, data BLOB NOT NULL)"
+            )
+            self._con.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "route TEXT NOT NULL, height INTEGER NOT NULL, page INTEGER NOT NULL, "
+                "per_page INTEGER NOT NULL, digest BLOB NOT NULL, "
+                "PRIMARY KEY (route, height, page, per_page))"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        self._con.close()
+
+    def get(
+        self, route: str, height: int, page: int = 0, per_page: int = 0
+    ) -> Optional[dict]:
+        with self._lock:
+            row = self._con.execute(
+                "SELECT b.data FROM responses r JOIN blobs b ON r.digest = b.digest "
+                "WHERE r.route = ? AND r.height = ? AND r.page = ? AND r.per_page = ?",
+                (route, height, page, per_page),
+            ).fetchone()
+        if row is None:
+            return None
+        return loads(zlib.decompress(row[0]))
+
+    def put(
+        self, route: str, height: int, data: dict, page: int = 0, per_page: int = 0
+    ) -> None:
+        raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(raw).digest()
+        with self._lock, self._con:
+            self._con.execute(
+                "INSERT OR IGNORE INTO blobs (digest, data) VALUES (?, ?)",
+                (digest, zlib.compress(raw, self.compression_level)),
+            )
+            self._con.execute(
+                "INSERT OR REPLACE INTO responses (route, height, page, per_page, digest) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (route, height, page, per_page, digest),
+            )
+
+    def get_block(self, height: int) -> Optional[dict]:
+        return self.get(BLOCK, height)
+
+    def put_block(self, height: int, data: dict) -> None:
+        self.put(BLOCK, height, data)
+
+    def get_block_transactions(
+        self, height: int, page: int, per_page: int
+    ) -> Optional[dict]:
+        return self.get(BLOCK_TXS, height, page, per_page)
+
+    def put_block_transactions(
+        self, height: int, page: int, per_page: int, data: dict
+    ) -> None:
+        self.put(BLOCK_TXS, height, data, page, per_page)
@@ -0,0 +1,263 @@
+from functools import wraps
+from typing import Any, Iterable, Optional, Union, TYPE_CHECKING
+
+from ._AsyncBaseRPCProvider import _AsyncBaseRPCProvider
+
+from ..rpc.data.async_account import (
+    async_get_account,
+    async_get_accounts,
+    async_get_account_transactions,
+    async_get_balance,
+)
+from ..rpc.data.async_block import async_get_block, async_get_block_transactions
+from ..rpc.data.async_network import (
+    async_get_all_params,
+    async_get_height,
+    async_get_param,
+    async_get_state,
+    async_get_supply,
+    async_get_supported_chains,
+    async_get_upgrade,
+    async_get_version,
+)
+from ..rpc.data.async_service import (
+    async_get_app,
+    async_get_apps,
+    async_get_node,
+    async_get_nodes,
+    async_get_node_claim,
+    async_get_node_claims,
+    async_get_signing_info,
+)
+from ..rpc.data.async_transaction import async_get_transaction_by_hash
+
+
+from ..rpc.batch import BatchResult, arun_batch
+from ..rpc.pagination import aiter_items
+from ..rpc.stream import astream_blocks
+from ..views.utils import get_full_param, chain_ids_to_details
+from ..views.interfaces import ProtocolParams
+
+if TYPE_CHECKING:
+    from ..rpc.models import structs
+
+
+class AsyncPoktRPCDataProvider(_AsyncBaseRPCProvider):
+    """
+    The async counterpart to PoktRPCDataProvider, handles all methods for querying data from the Pocket Network mainnet over a single pooled aiohttp session.
+
+    Best used as an async context manager, so that the session gets closed:
+
+        async with AsyncPoktRPCDataProvider(rpc_url) as pokt_rpc:
+            height = await pokt_rpc.get_height()
+    """
+
+    @wraps(async_get_height)
+    async def get_height(self, raw: bool = False) -> Union[int, dict]:
+        if raw:
+            return await self._make_rpc_call(async_get_height, raw=True)
+        return (await self._make_rpc_call(async_get_height)).height
+
+    @wraps(async_get_block)
+    async def get_block(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_block, *args, **kwargs)
+
+    @wraps(async_get_block_transactions)
+    async def get_block_transactions(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_block_transactions, *args, **kwargs)
+
+    @wraps(async_get_account)
+    async def get_account(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_account, *args, **kwargs)
+
+    @wraps(async_get_accounts)
+    async def get_accounts(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_accounts, *args, **kwargs)
+
+    @wraps(async_get_account_transactions)
+    async def get_account_transactions(self, *args, **kwargs):
+        return await self._make_rpc_call(
+            async_get_account_transactions, *args, **kwargs
+        )
+
+    @wraps(async_get_balance)
+    async def get_balance(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_balance, *args, **kwargs)
+
+    @wraps(async_get_all_params)
+    async def get_all_params(
+        self, *args, **kwargs
+    ) -> Union[ProtocolParams, dict, "structs.AllParams"]:
+        all_params = await self._make_rpc_call(async_get_all_params, *args, **kwargs)
+        if kwargs.get("raw") or kwargs.get("struct"):
+            return all_params
+        return ProtocolParams.from_model(all_params)
+
+    @wraps(async_get_param)
+    async def get_param(self, *args, **kwargs) -> Any:
+        param_name = args[0]
+        _, full_name = get_full_param(param_name)
+        if len(args) > 1:
+            args = (full_name,) + args[1:]
+        else:
+            args = (full_name,)
+        param = await self._make_rpc_call(async_get_param, *args, **kwargs)
+        if kwargs.get("raw"):
+            return param
+        return param.param_value
+
+    @wraps(async_get_state)
+    async def get_state(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_state, *args, **kwargs)
+
+    @wraps(async_get_supply)
+    async def get_supply(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_supply, *args, **kwargs)
+
+    @wraps(async_get_supported_chains)
+    async def get_supported_chains(self, *args, **kwargs) -> Union[list, dict]:
+        chain_response = await self._make_rpc_call(
+            async_get_supported_chains, *args, **kwargs
+        )
+        if kwargs.get("raw"):
+            return chain_response
+        return chain_ids_to_details(chain_response.supported_chains)
+
+    @wraps(async_get_upgrade)
+    async def get_upgrade(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_upgrade, *args, **kwargs)
+
+    @wraps(async_get_version)
+    async def get_version(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_version, *args, **kwargs)
+
+    @wraps(async_get_transaction_by_hash)
+    async def get_transaction_by_hash(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_transaction_by_hash, *args, **kwargs)
+
+    @wraps(async_get_app)
+    async def get_app(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_app, *args, **kwargs)
+
+    @wraps(async_get_apps)
+    async def get_apps(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_apps, *args, **kwargs)
+
+    @wraps(async_get_node)
+    async def get_node(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_node, *args, **kwargs)
+
+    @wraps(async_get_nodes)
+    async def get_nodes(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_nodes, *args, **kwargs)
+
+    @wraps(async_get_node_claim)
+    async def get_node_claim(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_node_claim, *args, **kwargs)
+
+    @wraps(async_get_node_claims)
+    async def get_node_claims(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_node_claims, *args, **kwargs)
+
+    @wraps(async_get_signing_info)
+    async def get_signing_info(self, *args, **kwargs):
+        return await self._make_rpc_call(async_get_signing_info, *args, **kwargs)
+
+    async def get_balances(
+        self, addresses: Iterable[str], height: int = 0, concurrency: int = 8, **kwargs
+    ) -> BatchResult:
+        """
+        Get the balance of every address, keyed by address, making up to concurrency calls at once. Calls that fail are kept in the errors of the result.
+        """
+        return await arun_batch(
+            self.get_balance,
+            {
+                address: dict(kwargs, address=address, height=height)
+                for address in addresses
+            },
+            concurrency,
+        )
+
+    async def get_supply_at(
+        self, heights: Iterable[int], concurrency: int = 8, **kwargs
+    ) -> BatchResult:
+        """
+        Get the supply at every height, keyed by height, making up to concurrency calls at once. Calls that fail are kept in the errors of the result.
+        """
+        return await arun_batch(
+            self.get_supply,
+            {height: dict(kwargs, height=height) for height in heights},
+            concurrency,
+        )
+
+    async def get_all_params_at(
+        self, heights: Iterable[int], concurrency: int = 8, **kwargs
+    ) -> BatchResult:
+        """
+        Get the protocol params at every height, keyed by height, making up to concurrency calls at once. Calls that fail are kept in the errors of the result.
+        """
+        return await arun_batch(
+            self.get_all_params,
+            {height: dict(kwargs, height=height) for height in heights},
+            concurrency,
+        )
+
+    def iter_nodes(self, *args, prefetch: int = 4, **kwargs):
+        """
+        Asynchronously iterate over every node on every page of get_nodes, from the given page on, fetching up to prefetch pages at once.
+        """
+        return aiter_items(
+            self.call, async_get_nodes, *args, prefetch=prefetch, **kwargs
+        )
+
+    def iter_apps(self, *args, prefetch: int = 4, **kwargs):
+        """
+        Asynchronously iterate over every app on every page of get_apps, from the given page on, fetching up to prefetch pages at once.
+        """
+        return aiter_items(
+            self.call, async_get_apps, *args, prefetch=prefetch, **kwargs
+        )
+
+    def iter_accounts(self, *args, prefetch: int = 4, **kwargs):
+        """
+        Asynchronously iterate over every account on every page of get_accounts, from the given page on, fetching up to prefetch pages at once.
+        """
+        return aiter_items(
+            self.call, async_get_accounts, *args, prefetch=prefetch, **kwargs
+        )
+
+    def iter_account_transactions(self, *args, prefetch: int = 4, **kwargs):
+        """
+        Asynchronously iterate over every transaction on every page of get_account_transactions, from the given page on, fetching up to prefetch pages at once.
+        """
+        return aiter_items(
+            self.call,
+            async_get_account_transactions,
+            *args,
+            prefetch=prefetch,
+            **kwargs
+        )
+
+    def iter_signing_info(self, *args, prefetch: int = 4, **kwargs):
+        """
+        Asynchronously iterate over every signing info on every page of get_signing_info, from the given page on, fetching up to prefetch pages at once.
+        """
+        return aiter_items(
+            self.call, async_get_signing_info, *args, prefetch=prefetch, **kwargs
+        )
+
+    def iter_node_claims(self, *args, prefetch: int = 4, **kwargs):
+        """
+        Asynchronously iterate over every claim on every page of get_node_claims, from the given page on, fetching up to prefetch pages at once.
+        """
+        return aiter_items(
+            self.call, async_get_node_claims, *args, prefetch=prefetch, **kwargs
+        )
+
+    def stream_blocks(
+        self, start: int, end: Optional[int] = None, window: int = 8, **kwargs
+    ):
+        """
+        Asynchronously iterate over the (header, txs) of every block from start to end in height order, fetching up to window blocks at once, see pokt.rpc.stream.astream_blocks.
+        """
+        return astream_blocks(self.call, start, end, window, **kwargs)
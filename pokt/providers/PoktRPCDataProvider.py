@@ -1,4 +1,5 @@
 from functools import wraps
+from typing import Any, Iterable, Optional, Union, TYPE_CHECKING
 
 from ._BaseRPCProvider import _BaseRPCProvider
 
@@ -16,6 +17,7 @@ from ..rpc.data import (
     get_account,
     get_accounts,
     get_account_transactions,
+    get_balance,
     get_transaction_by_hash,
     get_app,
     get_apps,
@@ -27,9 +29,15 @@ from ..rpc.data import (
 )
 
 
+from ..rpc.batch import BatchResult, run_batch
+from ..rpc.pagination import iter_items
+from ..rpc.stream import stream_blocks
 from ..views.utils import get_full_param, chain_ids_to_details
 from ..views.interfaces import ProtocolParams
 
+if TYPE_CHECKING:
+    from ..rpc.models import structs
+
 
 class PoktRPCDataProvider(_BaseRPCProvider):
     """
@@ -37,7 +45,9 @@ class PoktRPCDataProvider(_BaseRPCProvider):
     """
 
     @wraps(get_height)
-    def get_height(self):
+    def get_height(self, raw: bool = False) -> Union[int, dict]:
+        if raw:
+            return self._make_rpc_call(get_height, raw=True)
         return self._make_rpc_call(get_height).height
 
     @wraps(get_block)
@@ -60,20 +70,31 @@ class PoktRPCDataProvider(_BaseRPCProvider):
     def get_account_transactions(self, *args, **kwargs):
         return self._make_rpc_call(get_account_transactions, *args, **kwargs)
 
+    @wraps(get_balance)
+    def get_balance(self, *args, **kwargs):
+        return self._make_rpc_call(get_balance, *args, **kwargs)
+
     @wraps(get_all_params)
-    def get_all_params(self, *args, **kwargs):
+    def get_all_params(
+        self, *args, **kwargs
+    ) -> Union[ProtocolParams, dict, "structs.AllParams"]:
         all_params = self._make_rpc_call(get_all_params, *args, **kwargs)
+        if kwargs.get("raw") or kwargs.get("struct"):
+            return all_params
         return ProtocolParams.from_model(all_params)
 
     @wraps(get_param)
-    def get_param(self, *args, **kwargs):
+    def get_param(self, *args, **kwargs) -> Any:
         param_name = args[0]
         _, full_name = get_full_param(param_name)
         if len(args) > 1:
             args = (full_name,) + args[1:]
         else:
             args = (full_name,)
-        return self._make_rpc_call(get_param, *args, **kwargs).param_value
+        param = self._make_rpc_call(get_param, *args, **kwargs)
+        if kwargs.get("raw"):
+            return param
+        return param.param_value
 
     @wraps(get_state)
     def get_state(self, *args, **kwargs):
@@ -84,8 +105,10 @@ class PoktRPCDataProvider(_BaseRPCProvider):
         return self._make_rpc_call(get_supply, *args, **kwargs)
 
     @wraps(get_supported_chains)
-    def get_supported_chains(self, *args, **kwargs):
+    def get_supported_chains(self, *args, **kwargs) -> Union[list, dict]:
         chain_response = self._make_rpc_call(get_supported_chains, *args, **kwargs)
+        if kwargs.get("raw"):
+            return chain_response
         return chain_ids_to_details(chain_response.supported_chains)
 
     @wraps(get_upgrade)
@@ -127,3 +150,92 @@ class PoktRPCDataProvider(_BaseRPCProvider):
     @wraps(get_signing_info)
     def get_signing_info(self, *args, **kwargs):
         return self._make_rpc_call(get_signing_info, *args, **kwargs)
+
+    def get_balances(
+        self, addresses: Iterable[str], height: int = 0, concurrency: int = 8, **kwargs
+    ) -> BatchResult:
+        """
+        Get the balance of every address, keyed by address, making up to concurrency calls at once. Calls that fail are kept in the errors of the result.
+        """
+        return run_batch(
+            self.get_balance,
+            {
+                address: dict(kwargs, address=address, height=height)
+                for address in addresses
+            },
+            concurrency,
+        )
+
+    def get_supply_at(
+        self, heights: Iterable[int], concurrency: int = 8, **kwargs
+    ) -> BatchResult:
+        """
+        Get the supply at every height, keyed by height, making up to concurrency calls at once. Calls that fail are kept in the errors of the result.
+        """
+        return run_batch(
+            self.get_supply,
+            {height: dict(kwargs, height=height) for height in heights},
+            concurrency,
+        )
+
+    def get_all_params_at(
+        self, heights: Iterable[int], concurrency: int = 8, **kwargs
+    ) -> BatchResult:
+        """
+        Get the protocol params at every height, keyed by height, making up to concurrency calls at once. Calls that fail are kept in the errors of the result.
+        """
+        return run_batch(
+            self.get_all_params,
+            {height: dict(kwargs, height=height) for height in heights},
+            concurrency,
+        )
+
+    def iter_nodes(self, *args, prefetch: int = 4, **kwargs):
+        """
+        Iterate over every node on every page of get_nodes, from the given page on, fetching up to prefetch pages at once.
+        """
+        return iter_items(self.call, get_nodes, *args, prefetch=prefetch, **kwargs)
+
+    def iter_apps(self, *args, prefetch: int = 4, **kwargs):
+        """
+        Iterate over every app on every page of get_apps, from the given page on, fetching up to prefetch pages at once.
+        """
+        return iter_items(self.call, get_apps, *args, prefetch=prefetch, **kwargs)
+
+    def iter_accounts(self, *args, prefetch: int = 4, **kwargs):
+        """
+        Iterate over every account on every page of get_accounts, from the given page on, fetching up to prefetch pages at once.
+        """
+        return iter_items(self.call, get_accounts, *args, prefetch=prefetch, **kwargs)
+
+    def iter_account_transactions(self, *args, prefetch: int = 4, **kwargs):
+        """
+        Iterate over every transaction on every page of get_account_transactions, from the given page on, fetching up to prefetch pages at once.
+        """
+        return iter_items(
+            self.call, get_account_transactions, *args, prefetch=prefetch, **kwargs
+        )
+
+    def iter_signing_info(self, *args, prefetch: int = 4, **kwargs):
+        """
+        Iterate over every signing info on every page of get_signing_info, from the given page on, fetching up to prefetch pages at once.
+        """
+        return iter_items(
+            self.call, get_signing_info, *args, prefetch=prefetch, **kwargs
+        )
+
+    def iter_node_claims(self, *args, prefetch: int = 4, **kwargs):
+        """
+        Iterate over every claim on every page of get_node_claims, from the given page on, fetching up to prefetch pages at once.
+        """
+        return iter_items(
+            self.call, get_node_claims, *args, prefetch=prefetch, **kwargs
+        )
+
+    def stream_blocks(
+        self, start: int, end: Optional[int] = None, window: int = 8, **kwargs
+    ):
+        """
+        Iterate over the (header, txs) of every block from start to end in height order, fetching up to window blocks at once, see pokt.rpc.stream.stream_blocks.
+        """
+        return stream_blocks(self.call, start, end, window, **kwargs)
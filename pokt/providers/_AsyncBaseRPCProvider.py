@@ -0,0 +1,167 @@
+from typing import Optional, Sequence, Union
+
+import aiohttp
+
+from ..rpc import DEFAULT_TIMEOUT
+from ..rpc.balancer import EndpointPool
+from ..rpc.cache import ResponseCache
+from ..rpc.hedge import HedgePolicy
+from ..rpc.retry import RetryPolicy
+from ..rpc.singleflight import AsyncSingleFlight
+
+
+class _AsyncBaseRPCProvider:
+    """
+    Owns a single long lived aiohttp session, so that every call made through the provider reuses
+    the pooled, kept alive connections of its connector instead of opening a new session per request.
+
+    Parameters
+    ----------
+    provider_url
+        The URL to make the RPC calls to, or a list of URLs (or an EndpointPool) to balance the calls across, routing each to the fastest healthy endpoint.
+    limit: optional
+        The total number of simultaneous connections in the pool, defaults to 100.
+    limit_per_host: optional
+        The number of simultaneous connections to a single host, defaults to 32.
+    keepalive_timeout: optional
+        The number of seconds an idle connection is kept open for reuse, defaults to 60.
+    ttl_dns_cache: optional
+        The number of seconds resolved hosts are cached for, defaults to 300.
+    connect_timeout: optional
+        The seconds to wait for a connection to be established, defaults to 10.
+    read_timeout: optional
+        The seconds to wait between bytes of a response, defaults to 120.
+    retry_policy: optional
+        The policy calls are retried with, defaults to RetryPolicy().
+    cache: optional
+        The cache for responses, queries at an explicit height are only made once while cached, defaults to no caching.
+    single_flight: optional
+        Whether identical requests made concurrently share a single upstream request and its response, defaults to False.
+    hedge: optional
+        The policy for sending a duplicate of a slow request and taking whichever response comes first, defaults to no hedging.
+    """
+
+    def __init__(
+        self,
+        provider_url: Union[str, Sequence[str], EndpointPool],
+        limit: int = 100,
+        limit_per_host: int = 32,
+        keepalive_timeout: float = 60,
+        ttl_dns_cache: Optional[int] = 300,
+        connect_timeout: float = DEFAULT_TIMEOUT[0],
+        read_timeout: float = DEFAULT_TIMEOUT[1],
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: bool = False,
+        hedge: Optional[HedgePolicy] = None,
+    ):
+        if isinstance(provider_url, str):
+            self._url = provider_url
+            self._endpoints = None
+        else:
+            if not isinstance(provider_url, EndpointPool):
+                provider_url = EndpointPool(provider_url)
+            self._url = provider_url.endpoints[0].url
+            self._endpoints = provider_url
+        self._connector_kwargs = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "ttl_dns_cache": ttl_dns_cache,
+            "use_dns_cache": ttl_dns_cache is not None,
+        }
+        self._timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=connect_timeout, sock_read=read_timeout
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._retry_policy = RetryPolicy() if retry_policy is None else retry_policy
+        self._cache = cache
+        self._single_flight = AsyncSingleFlight() if single_flight else None
+        self._hedge = hedge
+
+    async def __aenter__(self):
+        self._open_session()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @property
+    def url(self):
+        return self._url
+
+    @property
+    def endpoints(self) -> Optional[EndpointPool]:
+        return self._endpoints
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        The provider's session, opened on first use since aiohttp sessions need to be created within the running event loop.
+        """
+        return self._open_session()
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self._retry_policy
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        return self._cache
+
+    @property
+    def hedge(self) -> Optional[HedgePolicy]:
+        return self._hedge
+
+    def _open_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(**self._connector_kwargs)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self._timeout
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def call(self, rpc_method, *args, **kwargs):
+        """
+        Await any of the async data functions with the provider's url and session, going through its cache, single flight and retry policy.
+        """
+        if self.cache is not None:
+            return await self.cache.call_async(
+                self._call_coalesced, rpc_method, *args, **kwargs
+            )
+        return await self._call_coalesced(rpc_method, *args, **kwargs)
+
+    async def _make_rpc_call(self, rpc_method, *args, **kwargs):
+        return await self.call(rpc_method, *args, **kwargs)
+
+    async def _call_coalesced(self, rpc_method, *args, **kwargs):
+        if self._single_flight is not None:
+            return await self._single_flight.call(
+                self._call_upstream, rpc_method, *args, **kwargs
+            )
+        return await self._call_upstream(rpc_method, *args, **kwargs)
+
+    async def _call_upstream(self, rpc_method, *args, **kwargs):
+        if not kwargs.get("session"):
+            kwargs["session"] = self.session
+        return await self.retry_policy.call_async(
+            self._call_hedged, rpc_method, *args, **kwargs
+        )
+
+    async def _call_hedged(self, rpc_method, *args, **kwargs):
+        if self._hedge is not None:
+            return await self._hedge.call_async(
+                self._call_endpoint, rpc_method, *args, **kwargs
+            )
+        return await self._call_endpoint(rpc_method, *args, **kwargs)
+
+    async def _call_endpoint(self, rpc_method, *args, **kwargs):
+        if self._endpoints is None:
+            return await rpc_method(self.url, *args, **kwargs)
+        # Every attempt picks its endpoint afresh, so a retry, or a hedge, goes to another endpoint.
+        return await self._endpoints.call_async(rpc_method, *args, **kwargs)
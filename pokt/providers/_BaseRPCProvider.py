@@ -1,20 +1,123 @@
-from requests import Session
+from typing import Optional, Sequence, Union
+
+from ..rpc import DEFAULT_TIMEOUT
+from ..rpc.balancer import EndpointPool
+from ..rpc.cache import ResponseCache
+from ..rpc.retry import RetryPolicy
+from ..rpc.singleflight import SingleFlight
+from ..rpc.utils import make_session
 
 
 class _BaseRPCProvider:
-    def __init__(self, provider_url: str):
-        self._url = provider_url
-        self._session = Session()
+    """
+    Parameters
+    ----------
+    provider_url
+        The URL to make the RPC calls to, or a list of URLs (or an EndpointPool) to balance the calls across, routing each to the fastest healthy endpoint.
+    pool_connections: optional
+        The number of per host connection pools to cache, defaults to 10.
+    pool_maxsize: optional
+        The most connections kept open to a single host, which should be at least the number of threads sharing the provider, defaults to 10.
+    connect_timeout: optional
+        The seconds to wait for a connection to be established, defaults to 10.
+    read_timeout: optional
+        The seconds to wait between bytes of a response, defaults to 120.
+    keepalive: optional
+        Whether to enable TCP keep-alive probes on pooled connections, defaults to True.
+    keepalive_idle: optional
+        The seconds a connection is idle before the first keep-alive probe, defaults to 60.
+    retry_policy: optional
+        The policy calls are retried with, defaults to RetryPolicy().
+    cache: optional
+        The cache for responses, queries at an explicit height are only made once while cached, defaults to no caching.
+    single_flight: optional
+        Whether identical requests made concurrently share a single upstream request and its response, defaults to False.
+    """
+
+    def __init__(
+        self,
+        provider_url: Union[str, Sequence[str], EndpointPool],
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        connect_timeout: float = DEFAULT_TIMEOUT[0],
+        read_timeout: float = DEFAULT_TIMEOUT[1],
+        keepalive: bool = True,
+        keepalive_idle: int = 60,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: bool = False,
+    ):
+        if isinstance(provider_url, str):
+            self._url = provider_url
+            self._endpoints = None
+        else:
+            if not isinstance(provider_url, EndpointPool):
+                provider_url = EndpointPool(provider_url)
+            self._url = provider_url.endpoints[0].url
+            self._endpoints = provider_url
+        self._session = make_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            keepalive=keepalive,
+            keepalive_idle=keepalive_idle,
+        )
+        self._retry_policy = RetryPolicy() if retry_policy is None else retry_policy
+        self._cache = cache
+        self._single_flight = SingleFlight() if single_flight else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     @property
     def url(self):
         return self._url
 
+    @property
+    def endpoints(self) -> Optional[EndpointPool]:
+        return self._endpoints
+
     @property
     def session(self):
         return self._session
 
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self._retry_policy
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        return self._cache
+
+    def close(self):
+        self._session.close()
+
+    def call(self, rpc_method, *args, **kwargs):
+        """
+        Call any of the data functions with the provider's url and session, going through its cache, single flight and retry policy.
+        """
+        if self.cache is not None:
+            return self.cache.call(self._call_coalesced, rpc_method, *args, **kwargs)
+        return self._call_coalesced(rpc_method, *args, **kwargs)
+
     def _make_rpc_call(self, rpc_method, *args, **kwargs):
+        return self.call(rpc_method, *args, **kwargs)
+
+    def _call_coalesced(self, rpc_method, *args, **kwargs):
+        if self._single_flight is not None:
+            return self._single_flight.call(
+                self._call_upstream, rpc_method, *args, **kwargs
+            )
+        return self._call_upstream(rpc_method, *args, **kwargs)
+
+    def _call_upstream(self, rpc_method, *args, **kwargs):
         if not kwargs.get("session"):
             kwargs["session"] = self.session
-        return rpc_method(self.url, *args, **kwargs)
+        if self._endpoints is None:
+            return self.retry_policy.call(rpc_method, self.url, *args, **kwargs)
+        # Every attempt picks its endpoint afresh, so a retry fails over to another endpoint.
+        return self.retry_policy.call(self._endpoints.call, rpc_method, *args, **kwargs)
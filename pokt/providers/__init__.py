@@ -1 +1,2 @@
 from .PoktRPCDataProvider import PoktRPCDataProvider
+from .AsyncPoktRPCDataProvider import AsyncPoktRPCDataProvider
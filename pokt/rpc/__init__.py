@@ -3,4 +3,8 @@ DEFAULT_POST_HEADERS = {
     "accept": "application/json",
     "Content-Type": "application/json",
 }
+# (connect, read) timeouts in seconds for requests made without a configured session.
+DEFAULT_TIMEOUT = (10, 120)
 from .errors import *
+from .cache import ResponseCache, MemoryCache, SQLiteCache, TieredCache
+from .retry import RetryBudget, RetryPolicy
@@ -1,5 +1,4 @@
-import json
-from typing import Optional
+from typing import Any, Callable, Optional
 
 try:
     import aiohttp
@@ -8,88 +7,98 @@ except ImportError:
         "The optional dependencies for async RPC requests don't appear to be installed. These can be installed via 'pip install pypokt[async]'."
     )
 
-from . import DEFAULT_GET_HEADERS, DEFAULT_POST_HEADERS, PortalRPCError, PoktRPCError
+from . import DEFAULT_GET_HEADERS, DEFAULT_POST_HEADERS, DEFAULT_TIMEOUT
+from .breaker import guard
+from .jsonlib import dumps
+from .ratelimit import limited_async
+from .utils import _read_get_body, _read_post_body
+
+
+def make_async_session(
+    limit: int = 100,
+    limit_per_host: int = 32,
+    keepalive_timeout: float = 60,
+    connect_timeout: float = DEFAULT_TIMEOUT[0],
+    read_timeout: float = DEFAULT_TIMEOUT[1],
+) -> aiohttp.ClientSession:
+    """
+    Create an aiohttp session with a pooled connector and default timeouts, the async counterpart to make_session.
+
+    It has to be created within the running event loop.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit, limit_per_host=limit_per_host, keepalive_timeout=keepalive_timeout
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=None, sock_connect=connect_timeout, sock_read=read_timeout
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+async def _read_get_response(resp: aiohttp.ClientResponse) -> str:
+    return _read_get_body(resp.status, await resp.read())
+
+
+async def _read_post_response(
+    resp: aiohttp.ClientResponse, decode: Optional[Callable[[bytes], Any]] = None
+):
+    return _read_post_body(resp.status, await resp.read(), decode)
 
 
 async def _get_ad_hoc(route: str, **params) -> str:
     async with aiohttp.ClientSession(headers=DEFAULT_GET_HEADERS) as session:
         async with session.get(route, params=params) as resp:
-            try:
-                data = await resp.json()
-            except:
-                pass
-            else:
-                if isinstance(data, dict):
-                    error_obj = data.get("error")
-                    if error_obj:
-                        error_code = error_obj.get("code", None)
-                        if error_code is None:
-                            error_code = error_obj.get("statusCode", None)
-                        raise PortalRPCError(error_code, error_obj.get("message"))
-
-                    error_code = data.get("code", None)
-                    if error_code:
-                        raise PoktRPCError(error_code, data.get("message"))
-            return await resp.text()
+            return await _read_get_response(resp)
 
 
-async def get_async(
-    route: str, session: Optional[aiohttp.ClientSession], **params
+async def _get_async(
+    route: str, session: Optional[aiohttp.ClientSession], params: dict
 ) -> str:
     if session is None:
         return await _get_ad_hoc(route, **params)
     async with session.get(route, params=params, headers=DEFAULT_GET_HEADERS) as resp:
-        try:
-            data = await resp.json()
-        except:
-            pass
-        else:
-            if isinstance(data, dict):
-                error_obj = data.get("error")
-                if error_obj:
-                    error_code = error_obj.get("code", None)
-                    if error_code is None:
-                        error_code = error_obj.get("statusCode", None)
-                    raise PortalRPCError(error_code, error_obj.get("message"))
-
-                error_code = data.get("code", None)
-                if error_code:
-                    raise PoktRPCError(error_code, data.get("message"))
-        return await resp.text()
-
-
-async def _post_ad_hoc(route: str, **data) -> dict:
-    async with aiohttp.ClientSession(headers=DEFAULT_POST_HEADERS) as session:
-        async with session.post(route, data=json.dumps(data)) as resp:
-            data = await resp.json()
-            if isinstance(data, dict):
-                error_obj = data.get("error")
-                if error_obj:
-                    raise PortalRPCError(
-                        error_obj.get("code"), error_obj.get("message")
-                    )
+        return await _read_get_response(resp)
 
-                error_code = data.get("code", None)
-                if error_code:
-                    raise PoktRPCError(error_code, data.get("message"))
-            return data
 
+async def get_async(
+    route: str, session: Optional[aiohttp.ClientSession], **params
+) -> str:
+    with guard(route):
+        async with limited_async():
+            return await _get_async(route, session, params)
 
-async def post_async(
-    route: str, session: Optional[aiohttp.ClientSession], **data
-) -> dict:
+
+async def _post_ad_hoc(
+    route: str, data: dict, decode: Optional[Callable[[bytes], Any]] = None
+):
+    async with aiohttp.ClientSession(headers=DEFAULT_POST_HEADERS) as session:
+        async with session.post(route, data=dumps(data)) as resp:
+            return await _read_post_response(resp, decode)
+
+
+async def _post_async(
+    route: str,
+    session: Optional[aiohttp.ClientSession],
+    data: dict,
+    decode: Optional[Callable[[bytes], Any]] = None,
+):
     if session is None:
-        return await _post_ad_hoc(route, **data)
+        return await _post_ad_hoc(route, data, decode)
     async with session.post(
-        route, data=json.dumps(data), headers=DEFAULT_POST_HEADERS
+        route, data=dumps(data), headers=DEFAULT_POST_HEADERS
     ) as resp:
-        data = await resp.json()
-        if isinstance(data, dict):
-            error_obj = data.get("error")
-            if error_obj:
-                raise PortalRPCError(error_obj.get("code"), error_obj.get("message"))
-
-            error_code = data.get("code", None)
-            if error_code:
-                raise PoktRPCError(error_code, data.get("message"))
-        return data
+        return await _read_post_response(resp, decode)
+
+
+async def post_async(
+    route: str,
+    session: Optional[aiohttp.ClientSession],
+    decode: Optional[Callable[[bytes], Any]] = None,
+    **data
+):
+    """
+    Post data to route, returning the decoded response body, or what decode makes of the raw body when given.
+    """
+    with guard(route):
+        async with limited_async():
+            return await _post_async(route, session, data, decode)
@@ -0,0 +1,214 @@
+"""
+Latency aware load balancing across several RPC endpoints.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from .errors import PoktRPCError
+
+
+def _is_endpoint_failure(error: BaseException) -> bool:
+    # A Pocket RPC error is the node answering the query, not the node failing.
+    return not isinstance(error, PoktRPCError)
+
+
+class Endpoint:
+    def __init__(self, url: str, priority: int = 0):
+        self.url = url
+        self.priority = priority
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until: Optional[float] = None
+        self.probing = False
+
+    def __repr__(self):
+        return "Endpoint(url={!r}, latency={}, error_rate={:.2f}, healthy={})".format(
+            self.url, self.latency, self.error_rate, self.ejected_until is None
+        )
+
+    def score(self) -> float:
+        # Idle endpoints that haven't been measured yet sort first, in priority order, so they get measured.
+        if self.latency is None:
+            return self.in_flight - self.priority / (1 + self.priority)
+        return self.latency * (self.in_flight + 1) / max(0.1, 1 - self.error_rate)
+
+
+class EndpointPool:
+    """
+    Parameters
+    ----------
+    urls
+        The endpoint urls, in order of preference before any of them have been measured.
+    alpha: optional
+        The weight of the newest sample in the latency and error rate EWMAs, defaults to
+        0.3.
+    eject_after: optional
+        The number of consecutive failures that ejects an endpoint, defaults to 3.
+    max_error_rate: optional
+        The error rate EWMA that ejects an endpoint, defaults to 0.5.
+    eject_for: optional
+        The seconds an endpoint is ejected for the first time, doubled for every repeat
+        ejection, defaults to 5.
+    max_eject_for: optional
+        The longest an endpoint is ejected for, defaults to 300.
+    is_failure: optional
+        Decides whether an error raised by a request counts against the endpoint,
+        defaults to every error but a PoktRPCError.
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        alpha: float = 0.3,
+        eject_after: int = 3,
+        max_error_rate: float = 0.5,
+        eject_for: float = 5.0,
+        max_eject_for: float = 300.0,
+        is_failure: Callable[[BaseException], bool] = _is_endpoint_failure,
+    ):
+        urls = list(urls)
+        self.endpoints = [
+            Endpoint(url, priority=len(urls) - i) for i, url in enumerate(urls)
+        ]
+        if not self.endpoints:
+            raise ValueError("At least one endpoint url must be provided.")
+        self.alpha = alpha
+        self.eject_after = eject_after
+        self.max_error_rate = max_error_rate
+        self.eject_for = eject_for
+        self.max_eject_for = max_eject_for
+        self.is_failure = is_failure
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.endpoints)
+
+    def healthy(self) -> list[Endpoint]:
+        return [e for e in self.endpoints if e.ejected_until is None]
+
+    def acquire(self) -> Endpoint:
+        """
+        Choose the endpoint for the next request, which has to be released with
+        release().
+        """
+        with self._lock:
+            now = time.monotonic()
+            for e in self.endpoints:
+                if (
+                    e.ejected_until is not None
+                    and e.ejected_until <= now
+                    and not e.probing
+                ):
+                    e.probing = True
+                    e.in_flight += 1
+                    return e
+            candidates = self.healthy()
+            if not candidates:
+                # Everything is ejected, so go with whichever endpoint comes back soonest.
+                candidates = [min(self.endpoints, key=lambda e: e.ejected_until)]
+            if len(candidates) > 2:
+                candidates = random.sample(candidates, 2)
+            chosen = min(candidates, key=Endpoint.score)
+            chosen.in_flight += 1
+            return chosen
+
+    def release(
+        self, endpoint: Endpoint, latency: Optional[float], failed: bool
+    ) -> None:
+        """
+        Record the outcome of a request made to the endpoint.
+
+        Parameters
+        ----------
+        endpoint
+            The endpoint returned by acquire().
+        latency
+            The seconds the request took.
+        failed
+            Whether the request failed in a way that reflects on the endpoint.
+        """
+        with self._lock:
+            endpoint.in_flight -= 1
+            endpoint.requests += 1
+            sample = 1.0 if failed else 0.0
+            endpoint.error_rate += self.alpha * (sample - endpoint.error_rate)
+            if failed:
+                endpoint.failures += 1
+                endpoint.consecutive_failures += 1
+                if (
+                    endpoint.probing
+                    or endpoint.consecutive_failures >= self.eject_after
+                    or endpoint.error_rate >= self.max_error_rate
+                ):
+                    self._eject(endpoint)
+                return
+            if latency is not None:
+                if endpoint.latency is None:
+                    endpoint.latency = latency
+                else:
+                    endpoint.latency += self.alpha * (latency - endpoint.latency)
+            endpoint.consecutive_failures = 0
+            if endpoint.probing or endpoint.ejected_until is not None:
+                endpoint.ejected_until = None
+                endpoint.probing = False
+                endpoint.ejections = 0
+                endpoint.error_rate = 0.0
+
+    def abandon(self, endpoint: Endpoint) -> None:
+        """
+        Release an endpoint without recording an outcome, for a request that was
+        cancelled.
+        """
+        with self._lock:
+            endpoint.in_flight -= 1
+            endpoint.probing = False
+
+    def call(self, rpc_method: Callable, *args, **kwargs) -> Any:
+        """
+        Call rpc_method(url, *args, **kwargs) with the url of the chosen endpoint,
+        recording how it went.
+        """
+        endpoint = self.acquire()
+        start = time.monotonic()
+        try:
+            result = rpc_method(endpoint.url, *args, **kwargs)
+        except Exception as e:
+            self.release(endpoint, None, self.is_failure(e))
+            raise
+        except BaseException:
+            self.abandon(endpoint)
+            raise
+        self.release(endpoint, time.monotonic() - start, False)
+        return result
+
+    async def call_async(self, rpc_method: Callable, *args, **kwargs) -> Any:
+        """
+        Await rpc_method(url, *args, **kwargs) with the url of the chosen endpoint,
+        recording how it went.
+        """
+        endpoint = self.acquire()
+        start = time.monotonic()
+        try:
+            result = await rpc_method(endpoint.url, *args, **kwargs)
+        except Exception as e:
+            self.release(endpoint, None, self.is_failure(e))
+            raise
+        except BaseException:
+            self.abandon(endpoint)
+            raise
+        self.release(endpoint, time.monotonic() - start, False)
+        return result
+
+    def _eject(self, endpoint: Endpoint) -> None:
+        cooldown = min(self.max_eject_for, self.eject_for * 2**endpoint.ejections)
+        endpoint.ejections += 1
+        endpoint.ejected_until = time.monotonic() + cooldown
+        endpoint.probing = False
@@ -0,0 +1,104 @@
+"""
+Batches of RPC calls made with bounded concurrency.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Generic, Hashable, Mapping, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+
+class BatchResult(Generic[KeyT]):
+    """
+    The results of a batch of calls by their key, along with the errors of the calls
+    that failed.
+
+    Parameters
+    ----------
+    results
+        The result of each call that succeeded, in the order of the batch.
+    errors
+        The exception raised by each call that failed, in the order of the batch.
+    """
+
+    def __init__(self, results: dict[KeyT, Any], errors: dict[KeyT, BaseException]):
+        self.results = results
+        self.errors = errors
+
+    def __repr__(self):
+        return "BatchResult({} results, {} errors)".format(
+            len(self.results), len(self.errors)
+        )
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def raise_for_errors(self) -> None:
+        """
+        Raise the error of the first call that failed, if any did.
+        """
+        for error in self.errors.values():
+            raise error
+
+
+def run_batch(
+    fn: Callable[..., Any],
+    calls: Mapping[KeyT, dict],
+    concurrency: int = 8,
+) -> BatchResult[KeyT]:
+    """
+    Call fn with the keyword arguments of every key of calls, up to concurrency at once
+    on a thread pool.
+
+    Parameters
+    ----------
+    fn
+        The function to call, e.g. a provider's get_balance.
+    calls
+        The keyword arguments of each call by its key, e.g. {address: {"address":
+        address}}.
+    concurrency: optional
+        The most calls made at once, defaults to 8.
+    """
+    results = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {key: pool.submit(fn, **kwargs) for key, kwargs in calls.items()}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                errors[key] = e
+    return BatchResult(results, errors)
+
+
+async def arun_batch(
+    fn: Callable[..., Awaitable[Any]],
+    calls: Mapping[KeyT, dict],
+    concurrency: int = 8,
+) -> BatchResult[KeyT]:
+    """
+    The async counterpart to run_batch, awaiting up to concurrency calls at once.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(kwargs):
+        async with semaphore:
+            return await fn(**kwargs)
+
+    keys = list(calls)
+    outcomes = await asyncio.gather(
+        *(bounded(calls[key]) for key in keys), return_exceptions=True
+    )
+    results = {}
+    errors = {}
+    for key, outcome in zip(keys, outcomes):
+        if isinstance(outcome, Exception):
+            errors[key] = outcome
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results[key] = outcome
+    return BatchResult(results, errors)
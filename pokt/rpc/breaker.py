@@ -0,0 +1,236 @@
+"""
+Circuit breakers for the RPC transport.
+"""
+
+import asyncio
+from contextlib import contextmanager
+import threading
+import time
+from typing import Callable, Iterator, Optional
+
+import requests
+
+from .errors import CircuitOpenError, PoktHTTPError, PortalRPCError
+
+try:
+    import aiohttp
+
+    _CONNECTION_ERRORS: tuple = (
+        requests.ConnectionError,
+        requests.Timeout,
+        aiohttp.ClientConnectionError,
+        asyncio.TimeoutError,
+        TimeoutError,
+        ConnectionError,
+    )
+except ImportError:
+    _CONNECTION_ERRORS = (
+        requests.ConnectionError,
+        requests.Timeout,
+        asyncio.TimeoutError,
+        TimeoutError,
+        ConnectionError,
+    )
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+def _is_server_error(status) -> bool:
+    try:
+        return int(status) >= 500 or int(status) == 408
+    except (TypeError, ValueError):
+        return False
+
+
+def _is_breaker_failure(error: BaseException) -> bool:
+    # Only the endpoint failing to answer counts, not an answer to a bad query or one that didn't decode.
+    if isinstance(error, PoktHTTPError):
+        return _is_server_error(error.status)
+    if isinstance(error, PortalRPCError):
+        return _is_server_error(error.code)
+    return isinstance(error, _CONNECTION_ERRORS)
+
+
+class CircuitBreaker:
+    """
+    Parameters
+    ----------
+    failure_threshold: optional
+        The number of consecutive failures that opens the circuit, defaults to 5.
+    reset_timeout: optional
+        The seconds the circuit stays open before letting a trial request through,
+        defaults to 30.
+    half_open_max_calls: optional
+        The number of trial requests let through at once while half-open, defaults to 1.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if (
+                self._state == OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                return HALF_OPEN
+            return self._state
+
+    def before_call(self, endpoint: str = "") -> None:
+        """
+        Raise a CircuitOpenError if the circuit doesn't let a request through right now.
+        """
+        with self._lock:
+            if self._state == OPEN:
+                remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+                if remaining > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(endpoint, remaining)
+                self._state = HALF_OPEN
+                self._trials = 0
+            if self._state == HALF_OPEN:
+                if self._trials >= self.half_open_max_calls:
+                    self.rejected += 1
+                    raise CircuitOpenError(endpoint, 0.0)
+                self._trials += 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trials = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._trials = 0
+
+    def release(self) -> None:
+        """
+        Give back a trial slot taken by a request that was cancelled before it finished.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+
+class CircuitBreakers:
+    """
+    A circuit breaker for every endpoint requests are made to.
+
+    Parameters
+    ----------
+    failure_threshold: optional
+        The number of consecutive failures that opens an endpoint's circuit, defaults to
+        5.
+    reset_timeout: optional
+        The seconds an endpoint's circuit stays open before letting a trial request
+        through, defaults to 30.
+    half_open_max_calls: optional
+        The number of trial requests let through at once while half-open, defaults to 1.
+    is_failure: optional
+        Decides whether an error counts against the endpoint, defaults to connection
+        errors, timeouts and 5xx/408 responses or Portal errors.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] = _is_breaker_failure,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint_for(route: str) -> str:
+        """
+        The endpoint a route is made to, the route without its trailing API path.
+        """
+        return route.rsplit("/v1/", 1)[0]
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(
+                    self.failure_threshold,
+                    self.reset_timeout,
+                    self.half_open_max_calls,
+                )
+            return breaker
+
+    @contextmanager
+    def guard(self, route: str) -> Iterator[None]:
+        """
+        Guard a request made to route with its endpoint's breaker, failing fast while
+        the circuit is open.
+        """
+        endpoint = self.endpoint_for(route)
+        breaker = self.breaker(endpoint)
+        breaker.before_call(endpoint)
+        try:
+            yield
+        except Exception as e:
+            if self.is_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+
+
+_circuit_breakers: Optional[CircuitBreakers] = CircuitBreakers()
+
+
+def set_circuit_breakers(breakers: Optional[CircuitBreakers]) -> None:
+    """
+    Set the circuit breakers guarding every request made by the transport, or turn them
+    off with None.
+    """
+    global _circuit_breakers
+    _circuit_breakers = breakers
+
+
+def get_circuit_breakers() -> Optional[CircuitBreakers]:
+    return _circuit_breakers
+
+
+@contextmanager
+def guard(route: str) -> Iterator[None]:
+    """
+    Guard a request made to route with the current circuit breakers, if any.
+    """
+    breakers = _circuit_breakers
+    if breakers is None:
+        yield
+        return
+    with breakers.guard(route):
+        yield
@@ -0,0 +1,295 @@
+"""
+Response caching for the RPC providers.
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from .utils import request_key
+
+
+class CacheBackend(ABC):
+    """
+    The interface for a store of pickled responses, keyed by string.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        The value stored for key, or None if there isn't one or it has expired.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """
+        Store value for key, expiring after ttl seconds if given.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove every stored value.
+        """
+
+
+class MemoryCache(CacheBackend):
+    """
+    An in memory LRU cache, evicting the least recently used entries once it holds more
+    than max_bytes.
+
+    Parameters
+    ----------
+    max_bytes: optional
+        The most bytes of pickled responses held, defaults to 256MB.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[Optional[float], bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires < time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        if len(value) > self.max_bytes:
+            return
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (expires, value)
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+
+class SQLiteCache(CacheBackend):
+    """
+    A persistent cache stored in a single SQLite file.
+
+    Expired entries are deleted when they're looked up, and all of them at most once
+    every purge_interval as entries are set.
+
+    Parameters
+    ----------
+    path
+        The path of the SQLite database file, created if it doesn't exist.
+    purge_interval: optional
+        The least seconds between deleting every expired entry, defaults to 60.
+    """
+
+    def __init__(self, path: str, purge_interval: float = 60):
+        self.path = path
+        self.purge_interval = purge_interval
+        self._lock = threading.Lock()
+        self._con = sqlite3.connect(path, check_same_thread=False)
+        self._last_purge = time.monotonic()
+        with self._lock, self._con:
+            self._con.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL, value BLOB)"
+            )
+            self._con.execute(
+                "CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires)"
+            )
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._con.execute(
+                "SELECT expires, value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        expires, value = row
+        if expires is not None and expires < time.time():
+            with self._lock, self._con:
+                self._con.execute(
+                    "DELETE FROM responses WHERE key = ? AND expires < ?",
+                    (key, time.time()),
+                )
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        expires = None if ttl is None else time.time() + ttl
+        with self._lock, self._con:
+            self._con.execute(
+                "INSERT OR REPLACE INTO responses (key, expires, value) VALUES (?, ?, ?)",
+                (key, expires, value),
+            )
+        if time.monotonic() - self._last_purge >= self.purge_interval:
+            self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """
+        Delete every expired entry, returning how many were deleted.
+        """
+        with self._lock, self._con:
+            self._last_purge = time.monotonic()
+            cursor = self._con.execute(
+                "DELETE FROM responses WHERE expires < ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._con:
+            self._con.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        self._con.close()
+
+
+class TieredCache(CacheBackend):
+    """
+    Looks a key up through each tier in order, copying hits into the faster tiers before
+    it.
+
+    Entries with a TTL are short lived, and so are only kept in the first tier.
+    """
+
+    def __init__(self, *tiers: CacheBackend):
+        self.tiers = tiers
+
+    def get(self, key: str) -> Optional[bytes]:
+        for i, tier in enumerate(self.tiers):
+            value = tier.get(key)
+            if value is not None:
+                for faster in self.tiers[:i]:
+                    faster.set(key, value)
+                return value
+        return None
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        if ttl is not None:
+            self.tiers[0].set(key, value, ttl)
+            return
+        for tier in self.tiers:
+            tier.set(key, value)
+
+    def clear(self) -> None:
+        for tier in self.tiers:
+            tier.clear()
+
+
+class ResponseCache:
+    """
+    Caches the responses of the RPC data functions, keyed by the query and its canonical
+    arguments.
+
+    Parameters
+    ----------
+    backend: optional
+        Where responses are stored, defaults to a MemoryCache of max_bytes, backed by a
+        SQLiteCache when a path is given.
+    max_bytes: optional
+        The size of the default in memory tier, defaults to 256MB.
+    path: optional
+        The path of a SQLite file to persist height pinned responses to.
+    latest_ttl: optional
+        The seconds to keep responses for the latest height, or queries without a
+        height, defaults to 0 which doesn't cache them at all.
+    namespace: optional
+        A prefix for every key, for keeping the responses of separate networks apart in
+        a shared backend.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        max_bytes: int = 256 * 1024 * 1024,
+        path: Optional[str] = None,
+        latest_ttl: float = 0,
+        namespace: str = "",
+    ):
+        if backend is None:
+            backend = MemoryCache(max_bytes)
+            if path is not None:
+                backend = TieredCache(backend, SQLiteCache(path))
+        self.backend = backend
+        self.latest_ttl = latest_ttl
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, rpc_method: Callable, *args, **kwargs) -> tuple[str, int]:
+        """
+        The canonical cache key for calling rpc_method with the given arguments
+        (excluding the provider url), and the height queried.
+        """
+        key, height = request_key(rpc_method, *args, **kwargs)
+        return self.namespace + key, height
+
+    def _ttl(self, height: int) -> Optional[float]:
+        return None if height > 0 else self.latest_ttl
+
+    def _lookup(self, rpc_method, args, kwargs) -> tuple[Optional[str], Any, Any]:
+        key, height = self.key_for(rpc_method, *args, **kwargs)
+        ttl = self._ttl(height)
+        if ttl is not None and ttl <= 0:
+            return None, None, None
+        cached = self.backend.get(key)
+        if cached is None:
+            self.misses += 1
+            return key, ttl, None
+        self.hits += 1
+        return key, ttl, pickle.loads(cached)
+
+    def _store(self, key: str, ttl: Optional[float], response) -> None:
+        self.backend.set(key, pickle.dumps(response, pickle.HIGHEST_PROTOCOL), ttl)
+
+    def call(self, call: Callable, rpc_method: Callable, *args, **kwargs):
+        """
+        Return the cached response of rpc_method for the arguments, or make it through
+        call(rpc_method, *args, **kwargs).
+        """
+        key, ttl, cached = self._lookup(rpc_method, args, kwargs)
+        if cached is not None:
+            return cached
+        response = call(rpc_method, *args, **kwargs)
+        if key is not None:
+            self._store(key, ttl, response)
+        return response
+
+    async def call_async(self, call: Callable, rpc_method: Callable, *args, **kwargs):
+        """
+        Return the cached response of rpc_method for the arguments, or await it through
+        call(rpc_method, *args, **kwargs).
+        """
+        key, ttl, cached = self._lookup(rpc_method, args, kwargs)
+        if cached is not None:
+            return cached
+        response = await call(rpc_method, *args, **kwargs)
+        if key is not None:
+            self._store(key, ttl, response)
+        return response
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Sequence, Union, TYPE_CHECKING
 import requests
 from ..models import (
     BaseAccountVal,
@@ -10,7 +10,12 @@ from ..models import (
     QueryAccountsResponse,
     SortOrder,
 )
-from ..utils import make_api_url, post
+from ..utils import make_api_url, post, response_decoder, struct_decoder
+from ..models.projection import prune
+from ..models.trusted import construct_trusted
+
+if TYPE_CHECKING:
+    from ..models import structs
 
 
 def get_account(
@@ -18,7 +23,9 @@ def get_account(
     address: str,
     height: int = 0,
     session: Optional[requests.Session] = None,
-) -> BaseAccountVal:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[BaseAccountVal, dict, "structs.BaseAccountVal"]:
     """
     Get the account with the given address at a specified height.
 
@@ -32,14 +39,22 @@ def get_account(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     BaseAccountVal
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryAddressHeight(height=height, address=address)
     route = make_api_url(provider_url, "/query/account")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("BaseAccountVal") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if raw or struct:
+        return resp_data
     return BaseAccountVal(**resp_data)
 
 
@@ -49,10 +64,15 @@ def get_accounts(
     page: int = 0,
     per_page: int = 100,
     session: Optional[requests.Session] = None,
-) -> QueryAccountsResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryAccountsResponse, dict, "structs.QueryAccountsResponse"]:
     request = QueryPaginatedHeightParams(height=height, page=page, per_page=per_page)
     route = make_api_url(provider_url, "/query/accounts")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QueryAccountsResponse") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if raw or struct:
+        return resp_data
     return QueryAccountsResponse(**resp_data)
 
 
@@ -61,7 +81,9 @@ def get_balance(
     address: str,
     height: int = 0,
     session: Optional[requests.Session] = None,
-) -> QueryBalanceResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryBalanceResponse, dict, "structs.QueryBalanceResponse"]:
     """
     Get the balance of the account at the given address at a specified height.
 
@@ -76,14 +98,22 @@ def get_balance(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     QueryBalanceResponse
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryAddressHeight(height=height, address=address)
     route = make_api_url(provider_url, "/query/balance")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QueryBalanceResponse") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if raw or struct:
+        return resp_data
     return QueryBalanceResponse(**resp_data)
 
 
@@ -96,7 +126,11 @@ def get_account_transactions(
     prove: bool = False,
     order: str = "desc",
     session: Optional[requests.Session] = None,
-) -> QueryAccountTXsResponse:
+    raw: bool = False,
+    struct: bool = False,
+    exclude: Optional[Sequence[str]] = None,
+    trusted: bool = False,
+) -> Union[QueryAccountTXsResponse, dict, "structs.QueryAccountTXsResponse"]:
     """
     Get a list of transactions for a given account at a specified height.
 
@@ -120,10 +154,19 @@ def get_account_transactions(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
+    exclude: optional
+        The dotted paths of the response fields to leave out, e.g. "txs.proof", which are skipped over while decoding when msgspec is installed, and left at their defaults in the response model, see pokt.rpc.models.projection.
+    trusted: optional
+        Whether to build the response model without validating it, for responses from a trusted node, see pokt.rpc.models.trusted, defaults to False.
 
     Returns
     -------
     QueryAccountTXsResponse
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     order = SortOrder(order)
     request = QueryAccountTXs(
@@ -135,5 +178,12 @@ def get_account_transactions(
         order=order,
     )
     route = make_api_url(provider_url, "/query/accounttxs")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = response_decoder("QueryAccountTXsResponse", struct, exclude)
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if exclude and decode is None:
+        prune(resp_data, exclude)
+    if raw or struct:
+        return resp_data
+    if trusted:
+        return construct_trusted(QueryAccountTXsResponse, resp_data)
     return QueryAccountTXsResponse(**resp_data)
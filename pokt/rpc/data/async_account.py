@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Sequence, Union, TYPE_CHECKING
 import aiohttp
 from ..models import (
     BaseAccountVal,
@@ -10,16 +10,23 @@ from ..models import (
     QueryPaginatedHeightParams,
     SortOrder,
 )
-from ..utils import make_api_url
+from ..utils import make_api_url, response_decoder, struct_decoder
+from ..models.projection import prune
+from ..models.trusted import construct_trusted
 from ..async_utils import post_async
 
+if TYPE_CHECKING:
+    from ..models import structs
+
 
 async def async_get_account(
     provider_url: str,
     address: str,
     height: int = 0,
     session: Optional[aiohttp.ClientSession] = None,
-) -> BaseAccountVal:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[BaseAccountVal, dict, "structs.BaseAccountVal"]:
     """
     Get the account with the given address at a specified height.
 
@@ -33,15 +40,25 @@ async def async_get_account(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional aiohttp client session, if none is provided, the request will be handled by creating a new aiohttp client session just for this request.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
-    Account
+    BaseAccountVal
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryAddressHeight(height=height, address=address)
     route = make_api_url(provider_url, "/query/account")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
-    return Account(**resp_data)
+    decode = struct_decoder("BaseAccountVal") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
+    return BaseAccountVal(**resp_data)
 
 
 async def async_get_accounts(
@@ -50,10 +67,17 @@ async def async_get_accounts(
     page: int = 0,
     per_page: int = 100,
     session: Optional[aiohttp.ClientSession] = None,
-) -> QueryAccountsResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryAccountsResponse, dict, "structs.QueryAccountsResponse"]:
     request = QueryPaginatedHeightParams(height=height, page=page, per_page=per_page)
     route = make_api_url(provider_url, "/query/accounts")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QueryAccountsResponse") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
     return QueryAccountsResponse(**resp_data)
 
 
@@ -62,7 +86,9 @@ async def async_get_balance(
     address: str,
     height: int = 0,
     session: Optional[aiohttp.ClientSession] = None,
-) -> QueryBalanceResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryBalanceResponse, dict, "structs.QueryBalanceResponse"]:
     """
     Get the balance of the account at the given address at a specified height.
 
@@ -77,14 +103,24 @@ async def async_get_balance(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional aiohttp client session, if none is provided, the request will be handled by creating a new aiohttp client session just for this request.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     QueryBalanceResponse
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryAddressHeight(height=height, address=address)
     route = make_api_url(provider_url, "/query/balance")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QueryBalanceResponse") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
     return QueryBalanceResponse(**resp_data)
 
 
@@ -97,7 +133,11 @@ async def async_get_account_transactions(
     prove: bool = False,
     order: str = "desc",
     session: Optional[aiohttp.ClientSession] = None,
-) -> QueryAccountTXsResponse:
+    raw: bool = False,
+    struct: bool = False,
+    exclude: Optional[Sequence[str]] = None,
+    trusted: bool = False,
+) -> Union[QueryAccountTXsResponse, dict, "structs.QueryAccountTXsResponse"]:
     """
     Get a list of transactions for a given account at a specified height.
 
@@ -121,10 +161,19 @@ async def async_get_account_transactions(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional aiohttp client session, if none is provided, the request will be handled by creating a new aiohttp client session just for this request.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
+    exclude: optional
+        The dotted paths of the response fields to leave out, e.g. "txs.proof", which are skipped over while decoding when msgspec is installed, and left at their defaults in the response model, see pokt.rpc.models.projection.
+    trusted: optional
+        Whether to build the response model without validating it, for responses from a trusted node, see pokt.rpc.models.trusted, defaults to False.
 
     Returns
     -------
     QueryAccountTXsResponse
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     order = SortOrder(order)
     request = QueryAccountTXs(
@@ -136,5 +185,14 @@ async def async_get_account_transactions(
         order=order,
     )
     route = make_api_url(provider_url, "/query/accounttxs")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = response_decoder("QueryAccountTXsResponse", struct, exclude)
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if exclude and decode is None:
+        prune(resp_data, exclude)
+    if raw or struct:
+        return resp_data
+    if trusted:
+        return construct_trusted(QueryAccountTXsResponse, resp_data)
     return QueryAccountTXsResponse(**resp_data)
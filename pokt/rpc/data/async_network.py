@@ -1,5 +1,5 @@
 import json
-from typing import Optional
+from typing import Optional, Union, TYPE_CHECKING
 import aiohttp
 from pydantic import parse_obj_as
 from ..models import (
@@ -15,9 +15,12 @@ from ..models import (
     StateResponse,
     Upgrade,
 )
-from ..utils import make_api_url
+from ..utils import make_api_url, struct_decoder
 from ..async_utils import post_async, get_async
 
+if TYPE_CHECKING:
+    from ..models import structs
+
 
 async def async_get_version(
     provider_url: str, session: Optional[aiohttp.ClientSession] = None
@@ -41,8 +44,11 @@ async def async_get_version(
 
 
 async def async_get_height(
-    provider_url: str, session: Optional[aiohttp.ClientSession] = None
-) -> QueryHeightResponse:
+    provider_url: str,
+    session: Optional[aiohttp.ClientSession] = None,
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryHeightResponse, dict, "structs.QueryHeightResponse"]:
     """
     Get the current height of the network.
 
@@ -52,19 +58,31 @@ async def async_get_height(
         The URL to make the RPC call to.
     session: optional
         The optional aiohttp client session, if none is provided, the request will be handled by creating a new aiohttp client session just for this request.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     QueryHeightResponse
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     route = make_api_url(provider_url, "/query/height")
-    resp_data = await post_async(route, session)
+    decode = struct_decoder("QueryHeightResponse") if struct else None
+    resp_data = await post_async(route, session, decode=decode)
+    if raw or struct:
+        return resp_data
     return QueryHeightResponse(**resp_data)
 
 
 async def async_get_state(
-    provider_url: str, height: int = 0, session: Optional[aiohttp.ClientSession] = None
-) -> StateResponse:  # Dict[AnyStr, Any]:
+    provider_url: str,
+    height: int = 0,
+    session: Optional[aiohttp.ClientSession] = None,
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[StateResponse, dict, "structs.StateResponse"]:  # Dict[AnyStr, Any]:
     """
     Get the network state at a specified height.
 
@@ -76,20 +94,34 @@ async def async_get_state(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional aiohttp client session, if none is provided, the request will be handled by creating a new aiohttp client session just for this request.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     StateResponse
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryHeight(height=height)
     route = make_api_url(provider_url, "/query/state")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("StateResponse") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
     return StateResponse(**resp_data)
 
 
 async def async_get_supply(
-    provider_url: str, height: int = 0, session: Optional[aiohttp.ClientSession] = None
-) -> QuerySupplyResponse:
+    provider_url: str,
+    height: int = 0,
+    session: Optional[aiohttp.ClientSession] = None,
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QuerySupplyResponse, dict, "structs.QuerySupplyResponse"]:
     """
     Get the supply infomration at a specified height.
 
@@ -101,20 +133,33 @@ async def async_get_supply(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional aiohttp client session, if none is provided, the request will be handled by creating a new aiohttp client session just for this request.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     QuerySupplyResponse
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryHeight(height=height)
     route = make_api_url(provider_url, "/query/supply")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QuerySupplyResponse") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
     return QuerySupplyResponse(**resp_data)
 
 
 async def async_get_supported_chains(
-    provider_url: str, height: int = 0, session: Optional[aiohttp.ClientSession] = None
-) -> QuerySupportedChainsResponse:
+    provider_url: str,
+    height: int = 0,
+    session: Optional[aiohttp.ClientSession] = None,
+    raw: bool = False,
+) -> Union[QuerySupportedChainsResponse, dict]:
     """
     Get the list of supported chain ids at a specified height.
 
@@ -127,22 +172,30 @@ async def async_get_supported_chains(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional aiohttp client session, if none is provided, the request will be handled by creating a new aiohttp client session just for this request.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
 
     Returns
     -------
     QuerySupportedChainsResponse
+        The decoded dict with raw.
     """
     request = QueryHeight(height=height)
     route = make_api_url(provider_url, "/query/supportedchains")
     resp_data = await post_async(route, session, **request.dict(by_alias=True))
     if isinstance(resp_data, str):
         resp_data = json.loads(resp_data)
+    if raw:
+        return resp_data
     return QuerySupportedChainsResponse(supported_chains=resp_data)
 
 
 async def async_get_upgrade(
-    provider_url: str, height: int = 0, session: Optional[aiohttp.ClientSession] = None
-) -> Upgrade:
+    provider_url: str,
+    height: int = 0,
+    session: Optional[aiohttp.ClientSession] = None,
+    raw: bool = False,
+) -> Union[Upgrade, dict]:
     """
     Get the upgrade information at a specified height.
 
@@ -155,16 +208,21 @@ async def async_get_upgrade(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional aiohttp client session, if none is provided, the request will be handled by creating a new aiohttp client session just for this request.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
 
     Returns
     -------
     Upgrade
+        The decoded dict with raw.
     """
     request = QueryHeight(height=height)
     route = make_api_url(provider_url, "/query/upgrade")
     resp_data = await post_async(route, session, **request.dict(by_alias=True))
     if isinstance(resp_data, str):
         resp_data = json.loads(resp_data)
+    if raw:
+        return resp_data
     return Upgrade(**resp_data)
 
 
@@ -173,7 +231,9 @@ async def async_get_param(
     param_key: str,
     height: int = 0,
     session: Optional[aiohttp.ClientSession] = None,
-) -> ParamT:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[ParamT, dict, "structs.ParamT"]:
     """
     Get the value of the desired protocol parameter at a specified height
 
@@ -187,20 +247,34 @@ async def async_get_param(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional aiohttp client session, if none is provided, the request will be handled by creating a new aiohttp client session just for this request.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     Any
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryHeightAndKey(height=height, key=param_key)
     route = make_api_url(provider_url, "/query/param")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("ParamT") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
     return parse_obj_as(SingleParam, resp_data).__root__
 
 
 async def async_get_all_params(
-    provider_url: str, height: int = 0, session: Optional[aiohttp.ClientSession] = None
-) -> AllParams:
+    provider_url: str,
+    height: int = 0,
+    session: Optional[aiohttp.ClientSession] = None,
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[AllParams, dict, "structs.AllParams"]:
     """
     Get the values of all protocol parameters at a specified height.
 
@@ -213,12 +287,22 @@ async def async_get_all_params(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional aiohttp client session, if none is provided, the request will be handled by creating a new aiohttp client session just for this request.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     AllParams
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryHeight(height=height)
     route = make_api_url(provider_url, "/query/allParams")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("AllParams") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
     return AllParams(**resp_data)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Union, TYPE_CHECKING
 import aiohttp
 from ..models import (
     Application,
@@ -19,16 +19,21 @@ from ..models import (
     StakingStatus,
     ValidatorOpts,
 )
-from ..utils import make_api_url
+from ..utils import make_api_url, struct_decoder
 from ..async_utils import post_async
 
+if TYPE_CHECKING:
+    from ..models import structs
+
 
 async def async_get_app(
     provider_url: str,
     address: str,
     height: int = 0,
     session: Optional[aiohttp.ClientSession] = None,
-) -> Application:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[Application, dict, "structs.Application"]:
     """
     Get the application by address at a specified height
 
@@ -42,14 +47,24 @@ async def async_get_app(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional aiohttp client session, if none is provided, the request will be handled by creating a new aiohttp client session just for this request.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     Application
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryAddressHeight(height=height, address=address)
     route = make_api_url(provider_url, "/query/app")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("Application") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
     return Application(**resp_data)
 
 
@@ -61,7 +76,9 @@ async def async_get_apps(
     staking_status: int = 2,
     blockchain: str = "",
     session: Optional[aiohttp.ClientSession] = None,
-) -> QueryAppsResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryAppsResponse, dict, "structs.QueryAppsResponse"]:
     if staking_status:
         staking_status = StakingStatus(staking_status)
     opts = ApplicationOpts(
@@ -72,7 +89,12 @@ async def async_get_apps(
     )
     request = QueryHeightAndApplicationsOpts(height=height, opts=opts)
     route = make_api_url(provider_url, "/query/apps")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QueryAppsResponse") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
     return QueryAppsResponse(**resp_data)
 
 
@@ -81,7 +103,9 @@ async def async_get_node(
     address: str,
     height: int = 0,
     session: Optional[aiohttp.ClientSession] = None,
-) -> Node:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[Node, dict, "structs.Node"]:
     """
     Get the node by address at a specified height
 
@@ -95,14 +119,24 @@ async def async_get_node(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional aiohttp client session, if none is provided, the request will be handled by creating a new aiohttp client session just for this request.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     Node
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryAddressHeight(height=height, address=address)
     route = make_api_url(provider_url, "/query/node")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("Node") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
     return Node(**resp_data)
 
 
@@ -115,7 +149,9 @@ async def async_get_nodes(
     jailed_status: int = 2,
     blockchain: str = "",
     session: Optional[aiohttp.ClientSession] = None,
-) -> QueryNodesResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryNodesResponse, dict, "structs.QueryNodesResponse"]:
     if staking_status:
         staking_status = StakingStatus(staking_status)
     if jailed_status:
@@ -129,7 +165,12 @@ async def async_get_nodes(
     )
     request = QueryHeightAndValidatorsOpts(height=height, opts=opts)
     route = make_api_url(provider_url, "/query/nodes")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QueryNodesResponse") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
     return QueryNodesResponse(**resp_data)
 
 
@@ -140,12 +181,19 @@ async def async_get_signing_info(
     page: int = 0,
     per_page: int = 100,
     session: Optional[aiohttp.ClientSession] = None,
-) -> QuerySigningInfoResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QuerySigningInfoResponse, dict, "structs.QuerySigningInfoResponse"]:
     request = QueryPaginatedHeightAndAddrParams(
         height=height, address=address, page=page, per_page=per_page
     )
     route = make_api_url(provider_url, "/query/signinginfo")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QuerySigningInfoResponse") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
     return QuerySigningInfoResponse(**resp_data)
 
 
@@ -158,7 +206,9 @@ async def async_get_node_claim(
     session_block_height: int,
     receipt_type: str,
     session: Optional[aiohttp.ClientSession] = None,
-) -> QueryNodeClaimResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryNodeClaimResponse, dict, "structs.QueryNodeClaimResponse"]:
     receipt_type = ReceiptType(receipt_type)
     request = QueryNodeReceipt(
         address=address,
@@ -169,7 +219,12 @@ async def async_get_node_claim(
         receipt_type=receipt_type,
     )
     route = make_api_url(provider_url, "/query/nodeclaim")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QueryNodeClaimResponse") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
     return QueryNodeClaimResponse(**resp_data)
 
 
@@ -180,10 +235,17 @@ async def async_get_node_claims(
     page: int = 1,
     per_page: int = 1000,
     session: Optional[aiohttp.ClientSession] = None,
-) -> QueryNodeClaimsResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryNodeClaimsResponse, dict, "structs.QueryNodeClaimsResponse"]:
     request = QueryPaginatedHeightAndAddrParams(
         height=height, address=address, page=page, per_page=per_page
     )
     route = make_api_url(provider_url, "/query/nodeclaims")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QueryNodeClaimsResponse") if struct else None
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if raw or struct:
+        return resp_data
     return QueryNodeClaimsResponse(**resp_data)
@@ -1,16 +1,25 @@
-from typing import Optional
+from typing import Optional, Sequence, Union, TYPE_CHECKING
 import aiohttp
 from ..models import QueryTX, Transaction
-from ..utils import make_api_url
+from ..utils import make_api_url, response_decoder
+from ..models.projection import prune
+from ..models.trusted import construct_trusted
 from ..async_utils import post_async
 
+if TYPE_CHECKING:
+    from ..models import structs
+
 
 async def async_get_transaction_by_hash(
     provider_url: str,
     tx_hash: str,
     prove: bool = False,
     session: Optional[aiohttp.ClientSession] = None,
-) -> Transaction:
+    raw: bool = False,
+    struct: bool = False,
+    exclude: Optional[Sequence[str]] = None,
+    trusted: bool = False,
+) -> Union[Transaction, dict, "structs.Transaction"]:
     """
     Get a specific transaction by hash.
 
@@ -24,12 +33,30 @@ async def async_get_transaction_by_hash(
         Whether or not to inclue to proof of the transaction, defaults to False.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
+    exclude: optional
+        The dotted paths of the response fields to leave out, e.g. "txs.proof", which are skipped over while decoding when msgspec is installed, and left at their defaults in the response model, see pokt.rpc.models.projection.
+    trusted: optional
+        Whether to build the response model without validating it, for responses from a trusted node, see pokt.rpc.models.trusted, defaults to False.
 
     Returns
     -------
     Transaction
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryTX(hash=tx_hash, prove=prove)
     route = make_api_url(provider_url, "/query/tx")
-    resp_data = await post_async(route, session, **request.dict(by_alias=True))
+    decode = response_decoder("Transaction", struct, exclude)
+    resp_data = await post_async(
+        route, session, decode=decode, **request.dict(by_alias=True)
+    )
+    if exclude and decode is None:
+        prune(resp_data, exclude)
+    if raw or struct:
+        return resp_data
+    if trusted:
+        return construct_trusted(Transaction, resp_data)
     return Transaction(**resp_data)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Sequence, Union, TYPE_CHECKING
 import requests
 from ..models import (
     SortOrder,
@@ -7,12 +7,23 @@ from ..models import (
     QueryBlockTXs,
     QueryBlockTXsResponse,
 )
-from ..utils import make_api_url, post
+from ..utils import make_api_url, post, response_decoder
+from ..models.projection import prune
+from ..models.trusted import construct_trusted
+
+if TYPE_CHECKING:
+    from ..models import structs
 
 
 def get_block(
-    provider_url: str, height: int = 0, session: Optional[requests.Session] = None
-) -> QueryBlockResponse:
+    provider_url: str,
+    height: int = 0,
+    session: Optional[requests.Session] = None,
+    raw: bool = False,
+    struct: bool = False,
+    exclude: Optional[Sequence[str]] = None,
+    trusted: bool = False,
+) -> Union[QueryBlockResponse, dict, "structs.QueryBlockResponse"]:
     """
     Get the block at a specified height.
 
@@ -25,14 +36,30 @@ def get_block(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
+    exclude: optional
+        The dotted paths of the response fields to leave out, e.g. "txs.proof", which are skipped over while decoding when msgspec is installed, and left at their defaults in the response model, see pokt.rpc.models.projection.
+    trusted: optional
+        Whether to build the response model without validating it, for responses from a trusted node, see pokt.rpc.models.trusted, defaults to False.
 
     Returns
     -------
     QueryBlockResponse
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryBlock(height=height)
     route = make_api_url(provider_url, "/query/block")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = response_decoder("QueryBlockResponse", struct, exclude)
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if exclude and decode is None:
+        prune(resp_data, exclude)
+    if raw or struct:
+        return resp_data
+    if trusted:
+        return construct_trusted(QueryBlockResponse, resp_data)
     return QueryBlockResponse(**resp_data)
 
 
@@ -44,7 +71,11 @@ def get_block_transactions(
     prove: bool = False,
     order: str = "desc",
     session: Optional[requests.Session] = None,
-) -> QueryBlockTXsResponse:
+    raw: bool = False,
+    struct: bool = False,
+    exclude: Optional[Sequence[str]] = None,
+    trusted: bool = False,
+) -> Union[QueryBlockTXsResponse, dict, "structs.QueryBlockTXsResponse"]:
     """
     Get a list of transactions from the block at the specfified height.
 
@@ -69,15 +100,31 @@ def get_block_transactions(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
+    exclude: optional
+        The dotted paths of the response fields to leave out, e.g. "txs.proof", which are skipped over while decoding when msgspec is installed, and left at their defaults in the response model, see pokt.rpc.models.projection.
+    trusted: optional
+        Whether to build the response model without validating it, for responses from a trusted node, see pokt.rpc.models.trusted, defaults to False.
 
     Returns
     -------
     QueryBlockTXsResponse
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     order = SortOrder(order)
     request = QueryBlockTXs(
         height=height, page=page, per_page=per_page, prove=prove, order=order
     )
     route = make_api_url(provider_url, "/query/blocktxs")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = response_decoder("QueryBlockTXsResponse", struct, exclude)
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if exclude and decode is None:
+        prune(resp_data, exclude)
+    if raw or struct:
+        return resp_data
+    if trusted:
+        return construct_trusted(QueryBlockTXsResponse, resp_data)
     return QueryBlockTXsResponse(**resp_data)
@@ -1,5 +1,5 @@
 import json
-from typing import Optional
+from typing import Optional, Union, TYPE_CHECKING
 import requests
 from pydantic import parse_obj_as
 from ..models import (
@@ -14,7 +14,10 @@ from ..models import (
     StateResponse,
     Upgrade,
 )
-from ..utils import make_api_url, get, post
+from ..utils import make_api_url, get, post, struct_decoder
+
+if TYPE_CHECKING:
+    from ..models import structs
 
 
 def get_version(provider_url: str, session: Optional[requests.Session] = None) -> str:
@@ -37,8 +40,11 @@ def get_version(provider_url: str, session: Optional[requests.Session] = None) -
 
 
 def get_height(
-    provider_url: str, session: Optional[requests.Session] = None
-) -> QueryHeightResponse:
+    provider_url: str,
+    session: Optional[requests.Session] = None,
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryHeightResponse, dict, "structs.QueryHeightResponse"]:
     """
     Get the current height of the network.
 
@@ -48,19 +54,31 @@ def get_height(
         The URL to make the RPC call to.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     QueryHeightResponse
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     route = make_api_url(provider_url, "/query/height")
-    resp_data = post(route, session)
+    decode = struct_decoder("QueryHeightResponse") if struct else None
+    resp_data = post(route, session, decode=decode)
+    if raw or struct:
+        return resp_data
     return QueryHeightResponse(**resp_data)
 
 
 def get_state(
-    provider_url: str, height: int = 0, session: Optional[requests.Session] = None
-) -> StateResponse:  # Dict[AnyStr, Any]:
+    provider_url: str,
+    height: int = 0,
+    session: Optional[requests.Session] = None,
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[StateResponse, dict, "structs.StateResponse"]:  # Dict[AnyStr, Any]:
     """
     Get the network state at a specified height.
 
@@ -72,20 +90,32 @@ def get_state(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     StateResponse
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryHeight(height=height)
     route = make_api_url(provider_url, "/query/state")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("StateResponse") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if raw or struct:
+        return resp_data
     return StateResponse(**resp_data)
 
 
 def get_supply(
-    provider_url: str, height: int = 0, session: Optional[requests.Session] = None
-) -> QuerySupplyResponse:
+    provider_url: str,
+    height: int = 0,
+    session: Optional[requests.Session] = None,
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QuerySupplyResponse, dict, "structs.QuerySupplyResponse"]:
     """
     Get the supply infomration at a specified height.
 
@@ -97,20 +127,31 @@ def get_supply(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     QuerySupplyResponse
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryHeight(height=height)
     route = make_api_url(provider_url, "/query/supply")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QuerySupplyResponse") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if raw or struct:
+        return resp_data
     return QuerySupplyResponse(**resp_data)
 
 
 def get_supported_chains(
-    provider_url: str, height: int = 0, session: Optional[requests.Session] = None
-) -> QuerySupportedChainsResponse:
+    provider_url: str,
+    height: int = 0,
+    session: Optional[requests.Session] = None,
+    raw: bool = False,
+) -> Union[QuerySupportedChainsResponse, dict]:
     """
     Get the list of supported chain ids at a specified height.
 
@@ -123,22 +164,30 @@ def get_supported_chains(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
 
     Returns
     -------
     QuerySupportedChainsResponse
+        The decoded dict with raw.
     """
     request = QueryHeight(height=height)
     route = make_api_url(provider_url, "/query/supportedchains")
     resp_data = post(route, session, **request.dict(by_alias=True))
     if isinstance(resp_data, str):
         resp_data = json.loads(resp_data)
+    if raw:
+        return resp_data
     return QuerySupportedChainsResponse(supported_chains=resp_data)
 
 
 def get_upgrade(
-    provider_url: str, height: int = 0, session: Optional[requests.Session] = None
-) -> Upgrade:
+    provider_url: str,
+    height: int = 0,
+    session: Optional[requests.Session] = None,
+    raw: bool = False,
+) -> Union[Upgrade, dict]:
     """
     Get the upgrade information at a specified height.
 
@@ -151,16 +200,21 @@ def get_upgrade(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
 
     Returns
     -------
     Upgrade
+        The decoded dict with raw.
     """
     request = QueryHeight(height=height)
     route = make_api_url(provider_url, "/query/upgrade")
     resp_data = post(route, session, **request.dict(by_alias=True))
     if isinstance(resp_data, str):
         resp_data = json.loads(resp_data)
+    if raw:
+        return resp_data
     return Upgrade(**resp_data)
 
 
@@ -169,7 +223,9 @@ def get_param(
     param_key: str,
     height: int = 0,
     session: Optional[requests.Session] = None,
-) -> ParamT:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[ParamT, dict, "structs.ParamT"]:
     """
     Get the value of the desired protocol parameter at a specified height
 
@@ -183,20 +239,32 @@ def get_param(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     Any
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryHeightAndKey(height=height, key=param_key)
     route = make_api_url(provider_url, "/query/param")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("ParamT") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if raw or struct:
+        return resp_data
     return parse_obj_as(SingleParam, resp_data).__root__
 
 
 def get_all_params(
-    provider_url: str, height: int = 0, session: Optional[requests.Session] = None
-) -> AllParams:
+    provider_url: str,
+    height: int = 0,
+    session: Optional[requests.Session] = None,
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[AllParams, dict, "structs.AllParams"]:
     """
     Get the values of all protocol parameters at a specified height.
 
@@ -209,12 +277,20 @@ def get_all_params(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     AllParams
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryHeight(height=height)
     route = make_api_url(provider_url, "/query/allParams")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("AllParams") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if raw or struct:
+        return resp_data
     return AllParams(**resp_data)
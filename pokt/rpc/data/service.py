@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Union, TYPE_CHECKING
 import requests
 from ..models import (
     Application,
@@ -19,7 +19,10 @@ from ..models import (
     StakingStatus,
     ValidatorOpts,
 )
-from ..utils import make_api_url, post
+from ..utils import make_api_url, post, struct_decoder
+
+if TYPE_CHECKING:
+    from ..models import structs
 
 
 def get_app(
@@ -27,7 +30,9 @@ def get_app(
     address: str,
     height: int = 0,
     session: Optional[requests.Session] = None,
-) -> Application:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[Application, dict, "structs.Application"]:
     """
     Get the application by address at a specified height
 
@@ -41,14 +46,22 @@ def get_app(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     Application
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryAddressHeight(height=height, address=address)
     route = make_api_url(provider_url, "/query/app")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("Application") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if raw or struct:
+        return resp_data
     return Application(**resp_data)
 
 
@@ -60,7 +73,9 @@ def get_apps(
     staking_status: int = 2,
     blockchain: str = "",
     session: Optional[requests.Session] = None,
-) -> QueryAppsResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryAppsResponse, dict, "structs.QueryAppsResponse"]:
     if staking_status:
         staking_status = StakingStatus(staking_status)
     opts = ApplicationOpts(
@@ -71,7 +86,10 @@ def get_apps(
     )
     request = QueryHeightAndApplicationsOpts(height=height, opts=opts)
     route = make_api_url(provider_url, "/query/apps")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QueryAppsResponse") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if raw or struct:
+        return resp_data
     return QueryAppsResponse(**resp_data)
 
 
@@ -80,7 +98,9 @@ def get_node(
     address: str,
     height: int = 0,
     session: Optional[requests.Session] = None,
-) -> Node:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[Node, dict, "structs.Node"]:
     """
     Get the node by address at a specified height
 
@@ -94,14 +114,22 @@ def get_node(
         The height to get the state at, if none is provided, defaults to the latest height.
     session: optional
         The optional requests session, if none is provided, the request will be handled by calling requests.post directly.
+    raw: optional
+        Whether to return the decoded response as is, skipping its validation into the response model, defaults to False.
+    struct: optional
+        Whether to decode the response straight into its msgspec struct from pokt.rpc.models.structs, skipping the response model, defaults to False.
 
     Returns
     -------
     Node
+        The decoded dict with raw, and the msgspec struct with struct.
     """
     request = QueryAddressHeight(height=height, address=address)
     route = make_api_url(provider_url, "/query/node")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("Node") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if raw or struct:
+        return resp_data
     return Node(**resp_data)
 
 
@@ -114,7 +142,9 @@ def get_nodes(
     jailed_status: int = 2,
     blockchain: str = "",
     session: Optional[requests.Session] = None,
-) -> QueryNodesResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryNodesResponse, dict, "structs.QueryNodesResponse"]:
     if staking_status:
         staking_status = StakingStatus(staking_status)
     if jailed_status:
@@ -128,7 +158,10 @@ def get_nodes(
     )
     request = QueryHeightAndValidatorsOpts(height=height, opts=opts)
     route = make_api_url(provider_url, "/query/nodes")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QueryNodesResponse") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if raw or struct:
+        return resp_data
     return QueryNodesResponse(**resp_data)
 
 
@@ -139,12 +172,17 @@ def get_signing_info(
     page: int = 0,
     per_page: int = 100,
     session: Optional[requests.Session] = None,
-) -> QuerySigningInfoResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QuerySigningInfoResponse, dict, "structs.QuerySigningInfoResponse"]:
     request = QueryPaginatedHeightAndAddrParams(
         height=height, address=address, page=page, per_page=per_page
     )
     route = make_api_url(provider_url, "/query/signinginfo")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QuerySigningInfoResponse") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if raw or struct:
+        return resp_data
     return QuerySigningInfoResponse(**resp_data)
 
 
@@ -157,7 +195,9 @@ def get_node_claim(
     session_block_height: int,
     receipt_type: str,
     session: Optional[requests.Session] = None,
-) -> QueryNodeClaimResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryNodeClaimResponse, dict, "structs.QueryNodeClaimResponse"]:
     receipt_type = ReceiptType(receipt_type)
     request = QueryNodeReceipt(
         address=address,
@@ -168,8 +208,11 @@ def get_node_claim(
         receipt_type=receipt_type,
     )
     route = make_api_url(provider_url, "/query/nodeclaim")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QueryNodeClaimResponse") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
     print(resp_data)
+    if raw or struct:
+        return resp_data
     return QueryNodeClaimResponse(**resp_data)
 
 
@@ -180,10 +223,15 @@ def get_node_claims(
     page: int = 1,
     per_page: int = 1000,
     session: Optional[requests.Session] = None,
-) -> QueryNodeClaimsResponse:
+    raw: bool = False,
+    struct: bool = False,
+) -> Union[QueryNodeClaimsResponse, dict, "structs.QueryNodeClaimsResponse"]:
     request = QueryPaginatedHeightAndAddrParams(
         height=height, address=address, page=page, per_page=per_page
     )
     route = make_api_url(provider_url, "/query/nodeclaims")
-    resp_data = post(route, session, **request.dict(by_alias=True))
+    decode = struct_decoder("QueryNodeClaimsResponse") if struct else None
+    resp_data = post(route, session, decode=decode, **request.dict(by_alias=True))
+    if raw or struct:
+        return resp_data
     return QueryNodeClaimsResponse(**resp_data)
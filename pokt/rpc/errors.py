@@ -1,5 +1,7 @@
 class PortalRPCError(RuntimeError):
     def __init__(self, code, message):
+        self.code = code
+        self.message = message
         msg = "The following error was returned from the Portal:\n Code: {} – Message: {}".format(
             code, message
         )
@@ -8,9 +10,38 @@ class PortalRPCError(RuntimeError):
 
 class PoktRPCError(RuntimeError):
     def __init__(self, code, message):
+        self.code = code
+        self.message = message
         msg = (
             "The following RPC error was encountered:\n Code: {} – Message: {}".format(
                 code, message
             )
         )
         super().__init__(msg)
+
+
+class PoktHTTPError(RuntimeError):
+    def __init__(self, status, message):
+        self.status = status
+        self.message = message
+        msg = "The RPC endpoint responded with an unusable response:\n Status: {} – Body: {}".format(
+            status, message
+        )
+        super().__init__(msg)
+
+
+class CircuitOpenError(RuntimeError):
+    def __init__(self, endpoint, retry_after):
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        msg = "The circuit for {} is open after repeated failures, retry in {:.1f}s".format(
+            endpoint, retry_after
+        )
+        super().__init__(msg)
+
+
+class EmptyBlockError(RuntimeError):
+    def __init__(self, height):
+        self.height = height
+        msg = "No block was returned for height {}".format(height)
+        super().__init__(msg)
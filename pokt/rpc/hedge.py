@@ -0,0 +1,136 @@
+"""
+Hedged requests for the async RPC transport.
+"""
+
+import asyncio
+from collections import deque
+import math
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from .retry import RetryBudget
+
+
+def _consume_error(task: asyncio.Future) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+class HedgePolicy:
+    """
+    Parameters
+    ----------
+    percentile: optional
+        The percentile of recent latencies for a route to wait before sending a
+        duplicate request, defaults to 95.
+    initial_delay: optional
+        The seconds to wait before sending a duplicate until min_samples latencies have
+        been seen for a route, defaults to 1.
+    min_delay: optional
+        The fewest seconds to wait before sending a duplicate, defaults to 0.05.
+    max_hedges: optional
+        The most duplicates sent for a single request, defaults to 1.
+    window: optional
+        The number of recent latencies kept per route, defaults to 200.
+    min_samples: optional
+        The number of latencies needed for a route before the percentile is used,
+        defaults to 20.
+    budget: optional
+        The budget duplicates are drawn from, defaults to RetryBudget(0.05, 5, 20), a
+        duplicate for at most one in 20 requests.
+    methods: optional
+        The names of the data functions to hedge, e.g. {"get_block",
+        "get_block_transactions"}, defaults to all of them.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        max_hedges: int = 1,
+        window: int = 200,
+        min_samples: int = 20,
+        budget: Optional[RetryBudget] = None,
+        methods: Optional[Iterable[str]] = None,
+    ):
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_hedges = max_hedges
+        self.window = window
+        self.min_samples = min_samples
+        self.budget = RetryBudget(0.05, 5, 20) if budget is None else budget
+        self.methods = None if methods is None else frozenset(methods)
+        self._latencies: dict[str, deque] = {}
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    @staticmethod
+    def _route(rpc_method: Callable) -> str:
+        route = rpc_method.__name__
+        if route.startswith("async_"):
+            route = route[len("async_") :]
+        return route
+
+    def delay(self, route: str) -> float:
+        """
+        The seconds to wait on a request to route before sending a duplicate.
+        """
+        latencies = self._latencies.get(route)
+        if latencies is None or len(latencies) < self.min_samples:
+            return max(self.min_delay, self.initial_delay)
+        ordered = sorted(latencies)
+        index = max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1)
+        return max(self.min_delay, ordered[index])
+
+    def _record(self, route: str, latency: float) -> None:
+        latencies = self._latencies.get(route)
+        if latencies is None:
+            latencies = self._latencies[route] = deque(maxlen=self.window)
+        latencies.append(latency)
+
+    async def call_async(
+        self, call: Callable, rpc_method: Callable, *args, **kwargs
+    ) -> Any:
+        """
+        Await call(rpc_method, *args, **kwargs), sending up to max_hedges duplicates
+        while it's slow and returning the first success.
+
+        If every copy fails, the last error is raised.
+        """
+        route = self._route(rpc_method)
+        if self.methods is not None and route not in self.methods:
+            return await call(rpc_method, *args, **kwargs)
+        self.budget.deposit()
+        started = time.monotonic()
+        first = asyncio.ensure_future(call(rpc_method, *args, **kwargs))
+        pending = {first}
+        hedges = 0
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                timeout = self.delay(route) if hedges < self.max_hedges else None
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        self._record(route, time.monotonic() - started)
+                        if task is not first:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+                if done:
+                    continue
+                if not self.budget.withdraw():
+                    hedges = self.max_hedges
+                    continue
+                hedges += 1
+                self.hedged += 1
+                pending.add(asyncio.ensure_future(call(rpc_method, *args, **kwargs)))
+        finally:
+            for task in pending:
+                task.add_done_callback(_consume_error)
+                task.cancel()
+        raise error
@@ -0,0 +1,130 @@
+"""
+The JSON backend used by the RPC transport.
+"""
+
+import json
+from typing import Any, Callable, Union
+
+BytesT = Union[bytes, bytearray, memoryview, str]
+
+# Integers of this magnitude or more might not fit in 64 bits.
+_WIDE = float(2**63)
+
+
+def _has_wide_float(obj: Any) -> bool:
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        for value in container.values() if type(container) is dict else container:
+            t = type(value)
+            if t is dict or t is list:
+                stack.append(value)
+            elif t is float and (value >= _WIDE or value <= -_WIDE):
+                return True
+    return False
+
+
+def _json_loads(data: BytesT) -> Any:
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+_backends: dict[str, tuple[Callable[[BytesT], Any], Callable[[Any], bytes]]] = {
+    "json": (_json_loads, _json_dumps)
+}
+
+try:
+    import orjson
+
+    def _orjson_loads(data: BytesT) -> Any:
+        try:
+            obj = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+        # Walking the result costs about as much as decoding it, which is why msgspec is preferred.
+        if type(obj) in (dict, list) and _has_wide_float(obj):
+            return json.loads(data)
+        if type(obj) is float and abs(obj) >= _WIDE:
+            return json.loads(data)
+        return obj
+
+    def _orjson_dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            return _json_dumps(obj)
+
+    _backends["orjson"] = (_orjson_loads, _orjson_dumps)
+except ImportError:
+    pass
+
+try:
+    import msgspec
+
+    _msgspec_decoder = msgspec.json.Decoder()
+    _msgspec_encoder = msgspec.json.Encoder()
+
+    def _msgspec_loads(data: BytesT) -> Any:
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError:
+            return json.loads(data)
+
+    def _msgspec_dumps(obj: Any) -> bytes:
+        try:
+            return _msgspec_encoder.encode(obj)
+        except (TypeError, msgspec.EncodeError):
+            return _json_dumps(obj)
+
+    _backends["msgspec"] = (_msgspec_loads, _msgspec_dumps)
+except ImportError:
+    pass
+
+
+def available_json_backends() -> list[str]:
+    return list(_backends)
+
+
+def set_json_backend(name: str) -> None:
+    """
+    Use the named JSON backend, one of "msgspec", "orjson" or "json", for every request
+    made by the transport.
+    """
+    global _backend, _loads, _dumps
+    if name not in _backends:
+        raise ValueError(
+            "The {} JSON backend isn't installed, available backends are: {}".format(
+                name, ", ".join(_backends)
+            )
+        )
+    _backend = name
+    _loads, _dumps = _backends[name]
+
+
+def get_json_backend() -> str:
+    return _backend
+
+
+def loads(data: BytesT) -> Any:
+    """
+    Decode a JSON document from bytes, or a str, with the current backend.
+    """
+    return _loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode obj as a compact JSON document in UTF-8 bytes with the current backend.
+    """
+    return _dumps(obj)
+
+
+_backend = "json"
+_loads, _dumps = _backends["json"]
+for _name in ("msgspec", "orjson"):
+    if _name in _backends:
+        set_json_backend(_name)
+        break
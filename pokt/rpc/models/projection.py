@@ -0,0 +1,62 @@
+"""
+Projection of the RPC responses, leaving out the fields the caller has no use for.
+"""
+
+from functools import lru_cache
+from typing import Any, Optional, Sequence
+
+ExcludeT = Sequence[str]
+
+# The parts of a transaction that only matter for proving or debugging it.
+TX_PAYLOADS = ("tx", "proof", "tx_result.log", "tx_result.events")
+
+
+@lru_cache(maxsize=None)
+def exclusion_tree(exclude: tuple[str, ...]) -> dict[str, Optional[dict]]:
+    """
+    The excluded paths as a nested dict, where excluded fields map to None.
+    """
+    tree: dict[str, Optional[dict]] = {}
+    for path in exclude:
+        node = tree
+        *parents, name = path.split(".")
+        for parent in parents:
+            child = node.setdefault(parent, {})
+            if child is None:
+                break
+            node = child
+        else:
+            node[name] = None
+    return tree
+
+
+def _prune(data: Any, tree: dict[str, Optional[dict]]) -> None:
+    if isinstance(data, list):
+        for item in data:
+            _prune(item, tree)
+    elif isinstance(data, dict):
+        for name, subtree in tree.items():
+            if subtree is None:
+                data.pop(name, None)
+            elif name in data:
+                _prune(data[name], subtree)
+
+
+def prune(data: Any, exclude: ExcludeT) -> Any:
+    """
+    Drop the excluded fields from the decoded response data in place, returning it.
+    """
+    _prune(data, exclusion_tree(tuple(exclude)))
+    return data
+
+
+def tx_exclude(
+    prefix: str = "", payloads: Sequence[str] = TX_PAYLOADS
+) -> tuple[str, ...]:
+    """
+    The paths of the payloads of the transactions under prefix, e.g. tx_exclude("txs")
+    for a page of transactions.
+    """
+    if not prefix:
+        return tuple(payloads)
+    return tuple("{}.{}".format(prefix, payload) for payload in payloads)
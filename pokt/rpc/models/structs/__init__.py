@@ -0,0 +1,253 @@
+"""
+msgspec Structs of the RPC responses, a lighter alternative to the pydantic models.
+"""
+
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Sequence,
+    Type,
+    TypedDict,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+try:
+    import msgspec
+except ImportError:
+    raise RuntimeError(
+        "The optional dependencies for decoding into structs don't appear to be installed. These can be installed via 'pip install pypokt[speedups]'."
+    )
+
+from ...utils import raise_for_rpc_error
+from ..projection import exclusion_tree, prune
+from ._generated import *
+from ._generated import RESPONSES, _Struct
+
+StructT = TypeVar("StructT")
+
+
+def convert(data: Any, type_: Type[StructT]) -> StructT:
+    """
+    Build the struct type_ from the decoded response data, coercing numeric strings to
+    numbers as the pydantic models do.
+    """
+    return msgspec.convert(data, type_, strict=False)
+
+
+def decode(body: bytes, type_: Type[StructT]) -> StructT:
+    """
+    Decode the struct type_ straight from the JSON body of a response, without building
+    the intermediate dicts and lists.
+    """
+    return msgspec.json.decode(body, type=type_, strict=False)
+
+
+TreeT = tuple[tuple[str, Optional["TreeT"]], ...]
+
+
+def _freeze(tree: dict) -> TreeT:
+    return tuple(
+        sorted((k, None if v is None else _freeze(v)) for k, v in tree.items())
+    )
+
+
+def _rebuild(struct: type, tree: TreeT, fields: dict) -> Any:
+    return _project_struct(struct, tree)(**fields)
+
+
+@lru_cache(maxsize=None)
+def _project_struct(struct: type, tree: TreeT) -> type:
+    excluded = dict(tree)
+    fields = []
+    for field in msgspec.structs.fields(struct):
+        subtree = excluded.get(field.encode_name, ())
+        if subtree is None:
+            continue
+        fields.append(
+            (
+                field.name,
+                _project(field.type, subtree),
+                msgspec.field(
+                    default=field.default,
+                    default_factory=field.default_factory,
+                    name=field.encode_name,
+                ),
+            )
+        )
+    # Keeps the properties (type_, param_key, ...) and pickles as the struct it was projected from,
+    # since the class itself can't be found by name.
+    namespace = {
+        name: value
+        for cls in reversed(struct.__mro__)
+        for name, value in vars(cls).items()
+        if isinstance(value, property)
+    }
+    namespace["__reduce__"] = lambda self: (
+        _rebuild,
+        (struct, tree, msgspec.structs.asdict(self)),
+    )
+    config = struct.__struct_config__
+    return msgspec.defstruct(
+        struct.__name__,
+        fields,
+        bases=(_Struct,),
+        module=__name__,
+        namespace=namespace,
+        tag_field=config.tag_field,
+        tag=config.tag,
+        kw_only=True,
+    )
+
+
+def _project(type_: Any, tree: TreeT) -> Any:
+    if not tree:
+        return type_
+    if isinstance(type_, type) and issubclass(type_, msgspec.Struct):
+        return _project_struct(type_, tree)
+    origin = get_origin(type_)
+    args = get_args(type_)
+    if origin is Union:
+        return Union[tuple(_project(arg, tree) for arg in args)]
+    if origin is list:
+        return list[_project(args[0], tree)]
+    if origin is dict:
+        return dict[args[0], _project(args[1], tree)]
+    return type_
+
+
+def project(type_: Any, exclude: Sequence[str]) -> Any:
+    """
+    The struct type_ without the fields at the excluded paths (see
+    pokt.rpc.models.projection), which decoding then skips over without building them.
+    """
+    return _project(type_, _freeze(exclusion_tree(tuple(exclude))))
+
+
+@lru_cache(maxsize=None)
+def _builtins_dict(struct: type, tree: TreeT) -> type:
+    excluded = dict(tree)
+    fields = {}
+    if struct.__struct_config__.tag_field is not None:
+        fields[struct.__struct_config__.tag_field] = Any
+    for field in msgspec.structs.fields(struct):
+        subtree = excluded.get(field.encode_name, ())
+        if subtree is not None:
+            fields[field.encode_name] = (
+                _builtins(field.type, subtree) if subtree else Any
+            )
+    # Not total, so the fields missing from a body are missing from its dict too.
+    return TypedDict(struct.__name__, fields, total=False)
+
+
+def _builtins(type_: Any, tree: TreeT) -> Any:
+    if isinstance(type_, type) and issubclass(type_, msgspec.Struct):
+        return _builtins_dict(type_, tree)
+    origin = get_origin(type_)
+    args = get_args(type_)
+    if origin is Union:
+        structs = [
+            arg
+            for arg in args
+            if isinstance(arg, type) and issubclass(arg, msgspec.Struct)
+        ]
+        # The dicts of a tagged union can't be told apart, so it's decoded whole.
+        if len(structs) > 1:
+            return Any
+        return Union[
+            tuple(arg if arg is type(None) else _builtins(arg, tree) for arg in args)
+        ]
+    if origin is list:
+        return list[_builtins(args[0], tree)]
+    if origin is dict:
+        return dict[args[0], _builtins(args[1], tree)]
+    return Any
+
+
+class _Errors(msgspec.Struct):
+    # The fields of the Portal and Pocket RPC errors, every other field is skipped over.
+    code: Any = None
+    error: Any = None
+    message: Any = None
+
+
+_errors_decoder = msgspec.json.Decoder(Union[_Errors, list, None])
+
+
+def _raise_for_rpc_error(body: bytes) -> None:
+    try:
+        errors = _errors_decoder.decode(body)
+    except msgspec.DecodeError:
+        return
+    if isinstance(errors, _Errors):
+        raise_for_rpc_error(msgspec.structs.asdict(errors))
+
+
+@lru_cache(maxsize=None)
+def _defaults(struct: type) -> Any:
+    try:
+        return struct()
+    except TypeError:
+        return None
+
+
+def _maybe_error(decoded: Any) -> bool:
+    # An error body has none of the fields of the response, so it decodes to the defaults.
+    if isinstance(decoded, msgspec.Struct):
+        return decoded == _defaults(type(decoded))
+    return decoded == {}
+
+
+def _decode_checked(decoder: msgspec.json.Decoder, body: bytes) -> Any:
+    # The body is only decoded again for the errors when it doesn't decode into the response.
+    try:
+        decoded = decoder.decode(body)
+    except msgspec.ValidationError:
+        _raise_for_rpc_error(body)
+        raise
+    if _maybe_error(decoded):
+        _raise_for_rpc_error(body)
+    return decoded
+
+
+@lru_cache(maxsize=None)
+def decoder(name: str, exclude: tuple[str, ...] = ()) -> Callable[[bytes], Any]:
+    """
+    A function decoding the JSON body of a response straight into the struct for the
+    named response model, e.g. "QueryBlockTXsResponse", without the excluded fields.
+
+    Like the transport, it raises the Portal or Pocket RPC error a body describes
+    instead.
+    """
+    decoder = msgspec.json.Decoder(project(RESPONSES[name], exclude), strict=False)
+
+    def decode(body: bytes) -> Any:
+        return _decode_checked(decoder, body)
+
+    return decode
+
+
+@lru_cache(maxsize=None)
+def builtins_decoder(
+    name: str, exclude: tuple[str, ...] = ()
+) -> Callable[[bytes], Any]:
+    """
+    A function decoding the JSON body of a response into dicts and lists, as the
+    transport does, but skipping over the excluded fields without building them.
+
+    The values are left as decoded, and the fields the named response model doesn't have
+    are skipped too.
+    """
+    decoder = msgspec.json.Decoder(
+        _builtins(RESPONSES[name], _freeze(exclusion_tree(exclude)))
+    )
+
+    def decode(body: bytes) -> Any:
+        # What's under a tagged union is only dropped once decoded.
+        return prune(_decode_checked(decoder, body), exclude)
+
+    return decode
@@ -0,0 +1,1202 @@
+"""
+Generated by scripts/structs_build.py from the pydantic models, don't edit by hand.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Literal, Optional, Union
+
+import msgspec
+
+
+class _Struct(msgspec.Struct, gc=False):
+    pass
+
+
+class CoinDenom(str, Enum):
+    upokt = "upokt"
+    pokt = "pokt"
+
+
+class Coin(_Struct, kw_only=True):
+    amount: Optional[str] = None
+    denom: Optional[CoinDenom] = CoinDenom.upokt
+
+
+class PubKey(_Struct, kw_only=True):
+    type_: str = msgspec.field(name="type")
+    value: str
+
+
+class BaseAccountVal(_Struct, kw_only=True):
+    address: str
+    coins: list[Coin]
+    public_key: Optional[Union[str, PubKey]] = None
+
+
+class TxResult(_Struct, kw_only=True):
+    code: Optional[int] = None
+    data: Optional[str] = None
+    log: Optional[str] = None
+    info: Optional[str] = None
+    events: Optional[list[str]] = None
+    codespace: Optional[str] = None
+    signer: Optional[str] = None
+    recipient: Optional[str] = None
+    message_type: Optional[str] = None
+
+
+class SimpleProof(_Struct, kw_only=True):
+    total: Optional[int] = None
+    index: Optional[int] = None
+    leaf_hash: Optional[str] = None
+    aunts: Optional[list[str]] = None
+
+
+class TXProof(_Struct, kw_only=True):
+    root_hash: Optional[str] = None
+    data: Optional[str] = None
+    proof: Optional[SimpleProof] = None
+
+
+class PublicKey(_Struct, kw_only=True):
+    type_: str = msgspec.field(name="type")
+    value: str
+
+
+class MsgAppStakeVal(_Struct, kw_only=True):
+    pubkey: Optional[PublicKey] = None
+    chains: Optional[list[str]] = None
+    value: Optional[int] = None
+
+
+class MsgAppStake(_Struct, kw_only=True, tag_field="type", tag="apps/MsgAppStake"):
+    value: MsgAppStakeVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class MsgAppUnjailVal(_Struct, kw_only=True):
+    address: Optional[str] = None
+
+
+class MsgAppUnjail(_Struct, kw_only=True, tag_field="type", tag="apps/MsgAppUnjail"):
+    value: MsgAppUnjailVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class MsgBeginAppUnstakeVal(_Struct, kw_only=True):
+    application_address: Optional[str] = None
+
+
+class MsgBeginAppUnstake(
+    _Struct, kw_only=True, tag_field="type", tag="apps/MsgAppBeginUnstake"
+):
+    value: MsgBeginAppUnstakeVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class MsgBeginValidatorUnstakeVal(_Struct, kw_only=True):
+    validator_address: Optional[str] = None
+    signer_address: Optional[str] = None
+
+
+class MsgBeginValidatorUnstake(
+    _Struct, kw_only=True, tag_field="type", tag="pos/8.0MsgBeginUnstake"
+):
+    value: MsgBeginValidatorUnstakeVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class MsgBeginValidatorUnstake_1(MsgBeginValidatorUnstake, tag="pos/MsgBeginUnstake"):
+    pass
+
+
+class MsgChangeParamVal(_Struct, kw_only=True):
+    address: Optional[str] = None
+    param_key: Optional[str] = None
+    param_value: Optional[Any] = None
+
+
+class MsgChangeParam(
+    _Struct, kw_only=True, tag_field="type", tag="gov/msg_change_param"
+):
+    value: MsgChangeParamVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class SessionHeader(_Struct, kw_only=True):
+    app_public_key: Optional[str] = None
+    chain: Optional[str] = None
+    session_height: Optional[int] = None
+
+
+class Range(_Struct, kw_only=True):
+    lower: Optional[str] = None
+    upper: Optional[str] = None
+
+
+class HashRange(_Struct, kw_only=True):
+    merkleHash: Optional[str] = None
+    range_: Optional[Range] = msgspec.field(default=None, name="range")
+
+
+class MsgClaimVal(_Struct, kw_only=True):
+    header: SessionHeader
+    merkle_root: Optional[HashRange] = None
+    total_proofs: Optional[int] = None
+    from_address: Optional[str] = None
+    evidence_type: Optional[int] = None
+    expiration_height: Optional[int] = None
+
+
+class MsgClaim(_Struct, kw_only=True, tag_field="type", tag="pocketcore/claim"):
+    value: MsgClaimVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class MsgDaoTransferVal(_Struct, kw_only=True):
+    from_address: Optional[str] = None
+    to_address: Optional[str] = None
+    amount: Optional[int] = None
+    action: Optional[str] = None
+
+
+class MsgDaoTransfer(
+    _Struct, kw_only=True, tag_field="type", tag="gov/msg_dao_transfer"
+):
+    value: MsgDaoTransferVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class MerkleProof(_Struct, kw_only=True):
+    index: Optional[int] = None
+    hash_ranges: Optional[list[HashRange]] = None
+    target_range: Optional[HashRange] = None
+
+
+class AAT(_Struct, kw_only=True):
+    version: Optional[str] = None
+    app_pub_key: Optional[str] = None
+    client_pub_key: Optional[str] = None
+    signature: Optional[str] = None
+
+
+class RelayProofVal(_Struct, kw_only=True):
+    request_hash: Optional[str] = None
+    entropy: Optional[int] = None
+    session_block_height: Optional[int] = None
+    servicer_pub_key: Optional[str] = None
+    blockchain: Optional[str] = None
+    aat: Optional[AAT] = None
+    signature: Optional[str] = None
+
+
+class RelayProof(_Struct, kw_only=True, tag_field="type", tag="pocketcore/relay_proof"):
+    value: RelayProofVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class RelayResponse(_Struct, kw_only=True):
+    signature: Optional[str] = None
+    payload: Optional[str] = None
+    proof: Optional[RelayProofVal] = None
+
+
+class ChallengeProofInvalidDataVal(_Struct, kw_only=True):
+    majority_responses: Optional[list[RelayResponse]] = None
+    minority_response: Optional[RelayResponse] = None
+    reporters_address: Optional[str] = None
+
+
+class ChallengeProofInvalidData(
+    _Struct, kw_only=True, tag_field="type", tag="pocketcore/challenge_proof"
+):
+    value: ChallengeProofInvalidDataVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class MsgProofVal(_Struct, kw_only=True):
+    merkle_proofs: Optional[MerkleProof] = None
+    leaf: Optional[Union[RelayProof, ChallengeProofInvalidData]] = None
+    evidence_type: Optional[int] = None
+
+
+class MsgProof(_Struct, kw_only=True, tag_field="type", tag="pocketcore/proof"):
+    value: MsgProofVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class MsgSendVal(_Struct, kw_only=True):
+    from_address: Optional[str] = None
+    to_address: Optional[str] = None
+    amount: Optional[int] = None
+
+
+class MsgSend(_Struct, kw_only=True, tag_field="type", tag="pos/Send"):
+    value: MsgSendVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class Upgrade(_Struct, kw_only=True):
+    height: int = msgspec.field(name="Height")
+    version: str = msgspec.field(name="Version")
+    old_upgrade_height: int = msgspec.field(default=1, name="OldUpgradeHeight")
+    features: Optional[list[str]] = msgspec.field(default=None, name="Features")
+
+
+class MsgUpgradeVal(_Struct, kw_only=True):
+    address: Optional[str] = None
+    upgrade: Optional[Upgrade] = None
+
+
+class MsgUpgrade(_Struct, kw_only=True, tag_field="type", tag="gov/msg_upgrade"):
+    value: MsgUpgradeVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class MsgValidatorStakeVal(_Struct, kw_only=True):
+    public_key: Optional[PublicKey] = None
+    chains: Optional[list[str]] = None
+    value: Optional[int] = None
+    service_url: Optional[str] = None
+    output_address: Optional[str] = None
+
+
+class MsgValidatorStake(_Struct, kw_only=True, tag_field="type", tag="pos/8.0MsgStake"):
+    value: MsgValidatorStakeVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class MsgValidatorStake_1(MsgValidatorStake, tag="pos/MsgStake"):
+    pass
+
+
+class MsgValidatorUnjailVal(_Struct, kw_only=True):
+    address: Optional[str] = None
+    signer_address: Optional[str] = None
+
+
+class MsgValidatorUnjail(_Struct, kw_only=True, tag_field="type", tag="pos/MsgUnjail"):
+    value: MsgValidatorUnjailVal
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class MsgValidatorUnjail_1(MsgValidatorUnjail, tag="pos/8.0MsgUnjail"):
+    pass
+
+
+class Signature(_Struct, kw_only=True):
+    pub_key: Optional[str] = None
+    signature: Optional[str] = None
+
+
+class StdTx(_Struct, kw_only=True):
+    entropy: Optional[int] = None
+    fee: Optional[list[Coin]] = None
+    memo: Optional[str] = None
+    msg: Optional[
+        Union[
+            MsgAppStake,
+            MsgAppUnjail,
+            MsgBeginAppUnstake,
+            MsgBeginValidatorUnstake,
+            MsgBeginValidatorUnstake_1,
+            MsgChangeParam,
+            MsgClaim,
+            MsgDaoTransfer,
+            MsgProof,
+            MsgSend,
+            MsgUpgrade,
+            MsgValidatorStake,
+            MsgValidatorStake_1,
+            MsgValidatorUnjail,
+            MsgValidatorUnjail_1,
+        ]
+    ] = None
+    signature: Optional[Signature] = None
+
+
+class Transaction(_Struct, kw_only=True):
+    hash_: Optional[str] = msgspec.field(default=None, name="hash")
+    height: Optional[int] = None
+    index: Optional[int] = None
+    tx_result: Optional[TxResult] = None
+    tx: Optional[str] = None
+    proof: Optional[TXProof] = None
+    stdTx: Optional[StdTx] = None
+
+
+class QueryAccountTXsResponse(_Struct, kw_only=True):
+    txs: Optional[list[Transaction]] = None
+    total_txs: Optional[str] = None
+    page_total: Optional[str] = None
+    total_count: Optional[str] = None
+
+
+class QueryAccountsResponse(_Struct, kw_only=True):
+    result: Optional[list[BaseAccountVal]] = None
+    page: Optional[int] = None
+    total_pages: Optional[int] = None
+
+
+class IntParam(
+    _Struct, kw_only=True, tag_field="param_key", tag="application/MaxApplications"
+):
+    param_value: int
+
+    @property
+    def param_key(self) -> str:
+        return self.__struct_config__.tag
+
+
+class IntParam_1(IntParam, tag="application/AppUnstakingTime"):
+    pass
+
+
+class IntParam_2(IntParam, tag="application/MaximumChains"):
+    pass
+
+
+class IntParam_3(IntParam, tag="application/StabilityAdjustment"):
+    pass
+
+
+class IntParam_4(IntParam, tag="application/BaseRelaysPerPOKT"):
+    pass
+
+
+class IntParam_5(IntParam, tag="application/ApplicationStakeMinimum"):
+    pass
+
+
+class IntParam_6(IntParam, tag="pos/DAOAllocation"):
+    pass
+
+
+class IntParam_7(IntParam, tag="pos/StakeMinimum"):
+    pass
+
+
+class IntParam_8(IntParam, tag="pos/MaximumChains"):
+    pass
+
+
+class IntParam_9(IntParam, tag="pos/RelaysToTokensMultiplier"):
+    pass
+
+
+class IntParam_10(IntParam, tag="pos/MaxJailedBlocks"):
+    pass
+
+
+class IntParam_11(IntParam, tag="pos/MaxValidators"):
+    pass
+
+
+class IntParam_12(IntParam, tag="pos/UnstakingTime"):
+    pass
+
+
+class IntParam_13(IntParam, tag="pos/DowntimeJailDuration"):
+    pass
+
+
+class IntParam_14(IntParam, tag="pos/ProposerPercentage"):
+    pass
+
+
+class IntParam_15(IntParam, tag="pos/BlocksPerSession"):
+    pass
+
+
+class IntParam_16(IntParam, tag="pos/MaxEvidenceAge"):
+    pass
+
+
+class IntParam_17(IntParam, tag="pos/SignedBlocksWindow"):
+    pass
+
+
+class IntParam_18(IntParam, tag="pos/ServicerStakeFloorMultiplier"):
+    pass
+
+
+class IntParam_19(IntParam, tag="pos/ServicerStakeWeightCeiling"):
+    pass
+
+
+class IntParam_20(IntParam, tag="pocketcore/SessionNodeCount"):
+    pass
+
+
+class IntParam_21(IntParam, tag="pocketcore/ClaimSubmissionWindow"):
+    pass
+
+
+class IntParam_22(IntParam, tag="pocketcore/ReplayAttackBurnMultiplier"):
+    pass
+
+
+class IntParam_23(IntParam, tag="pocketcore/ClaimExpiration"):
+    pass
+
+
+class IntParam_24(IntParam, tag="pocketcore/MinimumNumberOfProofs"):
+    pass
+
+
+class IntParam_25(IntParam, tag="auth/MaxMemoCharacters"):
+    pass
+
+
+class IntParam_26(IntParam, tag="auth/TxSigLimit"):
+    pass
+
+
+class StrParam(_Struct, kw_only=True, tag_field="param_key", tag="pos/StakeDenom"):
+    param_value: str
+
+    @property
+    def param_key(self) -> str:
+        return self.__struct_config__.tag
+
+
+class StrParam_1(StrParam, tag="gov/daoOwner"):
+    pass
+
+
+class FloatParam(
+    _Struct, kw_only=True, tag_field="param_key", tag="pos/SlashFractionDoubleSign"
+):
+    param_value: float
+
+    @property
+    def param_key(self) -> str:
+        return self.__struct_config__.tag
+
+
+class FloatParam_1(FloatParam, tag="pos/SlashFractionDowntime"):
+    pass
+
+
+class FloatParam_2(FloatParam, tag="pos/MinSignedPerWindow"):
+    pass
+
+
+class FloatParam_3(FloatParam, tag="pos/ServicerStakeFloorMultiplierExponent"):
+    pass
+
+
+class FloatParam_4(FloatParam, tag="pos/ServicerStakeWeightMultiplier"):
+    pass
+
+
+class BoolParam(
+    _Struct, kw_only=True, tag_field="param_key", tag="application/ParticipationRateOn"
+):
+    param_value: bool
+
+    @property
+    def param_key(self) -> str:
+        return self.__struct_config__.tag
+
+
+class SupportedBlockchainsParam(
+    _Struct, kw_only=True, tag_field="param_key", tag="pocketcore/SupportedBlockchains"
+):
+    param_value: Any
+
+    @property
+    def param_key(self) -> str:
+        return self.__struct_config__.tag
+
+
+class FeeMultiplierParam(
+    _Struct, kw_only=True, tag_field="param_key", tag="auth/FeeMultipliers"
+):
+    param_value: Any
+
+    @property
+    def param_key(self) -> str:
+        return self.__struct_config__.tag
+
+
+class ACLParam(_Struct, kw_only=True, tag_field="param_key", tag="gov/acl"):
+    param_value: Any
+
+    @property
+    def param_key(self) -> str:
+        return self.__struct_config__.tag
+
+
+class UpgradeParam(_Struct, kw_only=True, tag_field="param_key", tag="gov/upgrade"):
+    param_value: Any
+
+    @property
+    def param_key(self) -> str:
+        return self.__struct_config__.tag
+
+
+class AllParams(_Struct, kw_only=True):
+    app_params: list[
+        Union[
+            IntParam,
+            IntParam_1,
+            IntParam_2,
+            IntParam_3,
+            IntParam_4,
+            IntParam_5,
+            IntParam_6,
+            IntParam_7,
+            IntParam_8,
+            IntParam_9,
+            IntParam_10,
+            IntParam_11,
+            IntParam_12,
+            IntParam_13,
+            IntParam_14,
+            IntParam_15,
+            IntParam_16,
+            IntParam_17,
+            IntParam_18,
+            IntParam_19,
+            IntParam_20,
+            IntParam_21,
+            IntParam_22,
+            IntParam_23,
+            IntParam_24,
+            IntParam_25,
+            IntParam_26,
+            StrParam,
+            StrParam_1,
+            FloatParam,
+            FloatParam_1,
+            FloatParam_2,
+            FloatParam_3,
+            FloatParam_4,
+            BoolParam,
+            SupportedBlockchainsParam,
+            FeeMultiplierParam,
+            ACLParam,
+            UpgradeParam,
+        ]
+    ]
+    node_params: list[
+        Union[
+            IntParam,
+            IntParam_1,
+            IntParam_2,
+            IntParam_3,
+            IntParam_4,
+            IntParam_5,
+            IntParam_6,
+            IntParam_7,
+            IntParam_8,
+            IntParam_9,
+            IntParam_10,
+            IntParam_11,
+            IntParam_12,
+            IntParam_13,
+            IntParam_14,
+            IntParam_15,
+            IntParam_16,
+            IntParam_17,
+            IntParam_18,
+            IntParam_19,
+            IntParam_20,
+            IntParam_21,
+            IntParam_22,
+            IntParam_23,
+            IntParam_24,
+            IntParam_25,
+            IntParam_26,
+            StrParam,
+            StrParam_1,
+            FloatParam,
+            FloatParam_1,
+            FloatParam_2,
+            FloatParam_3,
+            FloatParam_4,
+            BoolParam,
+            SupportedBlockchainsParam,
+            FeeMultiplierParam,
+            ACLParam,
+            UpgradeParam,
+        ]
+    ]
+    pocket_params: list[
+        Union[
+            IntParam,
+            IntParam_1,
+            IntParam_2,
+            IntParam_3,
+            IntParam_4,
+            IntParam_5,
+            IntParam_6,
+            IntParam_7,
+            IntParam_8,
+            IntParam_9,
+            IntParam_10,
+            IntParam_11,
+            IntParam_12,
+            IntParam_13,
+            IntParam_14,
+            IntParam_15,
+            IntParam_16,
+            IntParam_17,
+            IntParam_18,
+            IntParam_19,
+            IntParam_20,
+            IntParam_21,
+            IntParam_22,
+            IntParam_23,
+            IntParam_24,
+            IntParam_25,
+            IntParam_26,
+            StrParam,
+            StrParam_1,
+            FloatParam,
+            FloatParam_1,
+            FloatParam_2,
+            FloatParam_3,
+            FloatParam_4,
+            BoolParam,
+            SupportedBlockchainsParam,
+            FeeMultiplierParam,
+            ACLParam,
+            UpgradeParam,
+        ]
+    ]
+    gov_params: list[
+        Union[
+            IntParam,
+            IntParam_1,
+            IntParam_2,
+            IntParam_3,
+            IntParam_4,
+            IntParam_5,
+            IntParam_6,
+            IntParam_7,
+            IntParam_8,
+            IntParam_9,
+            IntParam_10,
+            IntParam_11,
+            IntParam_12,
+            IntParam_13,
+            IntParam_14,
+            IntParam_15,
+            IntParam_16,
+            IntParam_17,
+            IntParam_18,
+            IntParam_19,
+            IntParam_20,
+            IntParam_21,
+            IntParam_22,
+            IntParam_23,
+            IntParam_24,
+            IntParam_25,
+            IntParam_26,
+            StrParam,
+            StrParam_1,
+            FloatParam,
+            FloatParam_1,
+            FloatParam_2,
+            FloatParam_3,
+            FloatParam_4,
+            BoolParam,
+            SupportedBlockchainsParam,
+            FeeMultiplierParam,
+            ACLParam,
+            UpgradeParam,
+        ]
+    ]
+    auth_params: list[
+        Union[
+            IntParam,
+            IntParam_1,
+            IntParam_2,
+            IntParam_3,
+            IntParam_4,
+            IntParam_5,
+            IntParam_6,
+            IntParam_7,
+            IntParam_8,
+            IntParam_9,
+            IntParam_10,
+            IntParam_11,
+            IntParam_12,
+            IntParam_13,
+            IntParam_14,
+            IntParam_15,
+            IntParam_16,
+            IntParam_17,
+            IntParam_18,
+            IntParam_19,
+            IntParam_20,
+            IntParam_21,
+            IntParam_22,
+            IntParam_23,
+            IntParam_24,
+            IntParam_25,
+            IntParam_26,
+            StrParam,
+            StrParam_1,
+            FloatParam,
+            FloatParam_1,
+            FloatParam_2,
+            FloatParam_3,
+            FloatParam_4,
+            BoolParam,
+            SupportedBlockchainsParam,
+            FeeMultiplierParam,
+            ACLParam,
+            UpgradeParam,
+        ]
+    ]
+
+
+class Application(_Struct, kw_only=True):
+    address: Optional[str] = None
+    public_key: Optional[str] = None
+    jailed: Optional[bool] = False
+    status: Optional[int] = None
+    chains: Optional[list[str]] = None
+    staked_tokens: Optional[str] = None
+    max_relays: Optional[int] = None
+    unstaking_time: Optional[str] = None
+
+
+class QueryAppsResponse(_Struct, kw_only=True):
+    result: Optional[list[Application]] = None
+    page: Optional[int] = None
+    total_pages: Optional[int] = None
+
+
+class QueryBalanceResponse(_Struct, kw_only=True):
+    balance: Optional[int] = None
+
+
+class Consensus(_Struct, kw_only=True):
+    block: Optional[int] = None
+    app: Optional[int] = None
+
+
+class PartSetHeader(_Struct, kw_only=True):
+    total: Optional[int] = None
+    hash_: Optional[str] = msgspec.field(default=None, name="hash")
+
+
+class BlockID(_Struct, kw_only=True):
+    hash_: Optional[str] = msgspec.field(default=None, name="hash")
+    parts: Optional[PartSetHeader] = None
+
+
+class BlockHeader(_Struct, kw_only=True):
+    version: Optional[Consensus] = None
+    chain_id: Optional[str] = None
+    height: Optional[int] = None
+    time: Optional[str] = None
+    num_txs: Optional[int] = None
+    total_txs: Optional[int] = None
+    last_block_id: Optional[BlockID] = None
+    last_commit_hash: Optional[str] = None
+    data_hash: Optional[str] = None
+    validators_hash: Optional[str] = None
+    next_validators_hash: Optional[str] = None
+    consensus_hash: Optional[str] = None
+    app_hash: Optional[str] = None
+    last_results_hash: Optional[str] = None
+    evidence_hash: Optional[str] = None
+    proposer_address: Optional[str] = None
+
+
+class BlockData(_Struct, kw_only=True):
+    txs: Optional[list[str]] = None
+
+
+class CommitSignature(_Struct, kw_only=True):
+    type_: Optional[str] = msgspec.field(default=None, name="type")
+    height: Optional[int] = None
+    round_: Optional[int] = msgspec.field(default=None, name="round")
+    block_id: Optional[BlockID] = None
+    timestamp: Optional[str] = None
+    validator_address: Optional[str] = None
+    validator_index: Optional[int] = None
+    signature: Optional[str] = None
+
+
+class Commit(_Struct, kw_only=True):
+    block_id: Optional[BlockID] = None
+    commit_signature: Optional[CommitSignature] = None
+
+
+class Block(_Struct, kw_only=True):
+    header: Optional[BlockHeader] = None
+    data: Optional[BlockData] = None
+    evidence: Any = None
+    lastCommit: Optional[Commit] = None
+
+
+class BlockMeta(_Struct, kw_only=True):
+    block_id: Optional[BlockID] = None
+    blockHeader: Optional[BlockHeader] = None
+
+
+class QueryBlockResponse(_Struct, kw_only=True):
+    block: Optional[Block] = None
+    block_meta: Optional[BlockMeta] = None
+
+
+class QueryBlockTXsResponse(_Struct, kw_only=True):
+    txs: Optional[list[Transaction]] = None
+    total_txs: Optional[str] = None
+    page_total: Optional[str] = None
+    total_count: Optional[int] = None
+
+
+class QueryHeightResponse(_Struct, kw_only=True):
+    height: int
+
+
+class Node(_Struct, kw_only=True):
+    address: Optional[str] = None
+    chains: Optional[list[str]] = None
+    jailed: Optional[bool] = False
+    public_key: Optional[str] = None
+    service_url: Optional[str] = None
+    status: Optional[int] = None
+    tokens: Optional[str] = None
+    unstaking_time: Optional[str] = None
+
+
+class QueryNodeClaimResponse(_Struct, kw_only=True):
+    type_: str = msgspec.field(name="type")
+    value: MsgClaimVal
+
+
+class QueryNodeClaimsResponse(_Struct, kw_only=True):
+    result: Optional[list[MsgClaimVal]] = None
+    page: int
+    total_pages: int
+
+
+class QueryNodesResponse(_Struct, kw_only=True):
+    result: Optional[list[Node]] = None
+    page: Optional[int] = None
+    total_pages: Optional[int] = None
+
+
+class SigningInfo(_Struct, kw_only=True):
+    address: Optional[str] = None
+    index_offset: Optional[int] = None
+    jailed_blocks_counter: Optional[int] = None
+    jailed_until: Optional[str] = None
+    missed_blocks_counter: Optional[int] = None
+    start_height: Optional[int] = None
+
+
+class QuerySigningInfoResponse(_Struct, kw_only=True):
+    result: Optional[list[SigningInfo]] = None
+    page: Optional[int] = None
+    total_pages: Optional[int] = None
+
+
+class ApplicationParams(_Struct, kw_only=True):
+    unstaking_time: Optional[str] = None
+    max_applications: Optional[int] = None
+    app_stake_minimum: Optional[int] = None
+    base_relays_per_pokt: Optional[int] = None
+    stability_adjustment: Optional[int] = None
+    participation_rate_on: Optional[bool] = None
+
+
+class ApplicationState(_Struct, kw_only=True):
+    applications: list[Application]
+    exported: bool
+    params: ApplicationParams
+
+
+class BaseAccount(_Struct, kw_only=True, tag_field="type", tag="posmint/Account"):
+    value: Any
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class ModuleAccount(
+    _Struct, kw_only=True, tag_field="type", tag="posmint/ModuleAccount"
+):
+    value: Any
+
+    @property
+    def type_(self) -> str:
+        return self.__struct_config__.tag
+
+
+class FeeMultiplier(_Struct, kw_only=True):
+    fee_multiplier: Optional[int] = None
+    default: int
+
+
+class AuthParams(_Struct, kw_only=True):
+    fee_multipliers: FeeMultiplier
+    max_memo_characters: str
+    tx_sig_limit: str
+
+
+class SupplyItem(_Struct, kw_only=True):
+    amount: str
+    denom: str
+
+
+class AuthState(_Struct, kw_only=True):
+    accounts: list[Account]
+    params: AuthParams
+    supply: list[SupplyItem]
+
+
+class ACLKey(_Struct, kw_only=True):
+    acl_key: str
+    address: str
+
+
+class GovParams(_Struct, kw_only=True):
+    acl: list[ACLKey]
+    dao_owner: str
+    upgrade: Upgrade
+
+
+class GovState(_Struct, kw_only=True):
+    DAO_Tokens: str
+    params: GovParams
+
+
+class Claim(_Struct, kw_only=True):
+    evidence_type: str
+    expiration_height: int
+    from_address: str
+
+
+class PocketCoreParams(_Struct, kw_only=True):
+    claim_expiration: str
+    minimum_number_of_proofs: int
+    proof_waiting_period: str
+    replay_attack_burn_multiplier: str
+    session_node_count: int
+    supported_blockchains: list[str]
+
+
+class PocketCoreState(_Struct, kw_only=True):
+    claims: Optional[list[Claim]] = None
+    params: PocketCoreParams
+
+
+class PosParams(_Struct, kw_only=True):
+    dao_allocation: str
+    downtime_jail_duration: str
+    max_evidence_age: str
+    max_jailed_blocks: int
+    max_validators: int
+    min_signed_per_window: str
+    proposer_allocation: str
+    relays_to_tokens_multiplier: str
+    session_block_frequency: str
+    signed_blocks_window: str
+    slash_fraction_double_sign: str
+    slash_fraction_downtime: str
+    stake_denom: str
+    stake_minimum: int
+    unstaking_time: int
+
+
+class ValidatorPowers(_Struct, kw_only=True):
+    address: str = msgspec.field(name="Address")
+    power: str = msgspec.field(name="Power")
+
+
+class Validator(_Struct, kw_only=True):
+    address: str
+    chains: list[str]
+    jailed: bool
+    output_address: str
+    public_key: str
+    service_url: str
+    status: int
+    tokens: str
+    unstaking_time: str
+
+
+class PosState(_Struct, kw_only=True):
+    exported: bool
+    missed_blocks: dict[str, Any]
+    params: PosParams
+    prevState_total_power: str
+    prevState_validator_powers: list[ValidatorPowers]
+    previous_proposer: str
+    signing_infos: dict[str, SigningInfo]
+    validators: list[Validator]
+
+
+class AppState(_Struct, kw_only=True):
+    application: ApplicationState
+    auth: AuthState
+    gov: GovState
+    pocketcore: PocketCoreState
+    pos: PosState
+
+
+class ConsensusBlockParams(_Struct, kw_only=True):
+    max_bytes: str
+    max_gas: str
+    time_iota_ms: str
+
+
+class ConsensusEvidenceParams(_Struct, kw_only=True):
+    max_age: str
+
+
+class ConsensusValidatorParams(_Struct, kw_only=True):
+    pub_key_types: list[str]
+
+
+class ConsensusParams(_Struct, kw_only=True):
+    block: ConsensusBlockParams
+    evidence: ConsensusEvidenceParams
+    validator: ConsensusValidatorParams
+
+
+class StateResponse(_Struct, kw_only=True):
+    app_hash: str
+    app_state: AppState
+    chain_id: str
+    consensus_params: ConsensusParams
+    genesis_time: str
+
+
+class QuerySupplyResponse(_Struct, kw_only=True):
+    node_staked: Optional[int] = None
+    app_staked: Optional[int] = None
+    dao: Optional[int] = None
+    total_staked: Optional[int] = None
+    total_unstaked: Optional[int] = None
+    total: Optional[int] = None
+
+
+class QuerySupportedChainsResponse(_Struct, kw_only=True):
+    supported_chains: list[str] = None
+
+
+ParamT = Union[
+    IntParam,
+    IntParam_1,
+    IntParam_2,
+    IntParam_3,
+    IntParam_4,
+    IntParam_5,
+    IntParam_6,
+    IntParam_7,
+    IntParam_8,
+    IntParam_9,
+    IntParam_10,
+    IntParam_11,
+    IntParam_12,
+    IntParam_13,
+    IntParam_14,
+    IntParam_15,
+    IntParam_16,
+    IntParam_17,
+    IntParam_18,
+    IntParam_19,
+    IntParam_20,
+    IntParam_21,
+    IntParam_22,
+    IntParam_23,
+    IntParam_24,
+    IntParam_25,
+    IntParam_26,
+    StrParam,
+    StrParam_1,
+    FloatParam,
+    FloatParam_1,
+    FloatParam_2,
+    FloatParam_3,
+    FloatParam_4,
+    BoolParam,
+    SupportedBlockchainsParam,
+    FeeMultiplierParam,
+    ACLParam,
+    UpgradeParam,
+]
+
+
+Account = Union[BaseAccount, ModuleAccount]
+
+
+RESPONSES = {
+    "AllParams": AllParams,
+    "Application": Application,
+    "BaseAccountVal": BaseAccountVal,
+    "Node": Node,
+    "ParamT": ParamT,
+    "QueryAccountTXsResponse": QueryAccountTXsResponse,
+    "QueryAccountsResponse": QueryAccountsResponse,
+    "QueryAppsResponse": QueryAppsResponse,
+    "QueryBalanceResponse": QueryBalanceResponse,
+    "QueryBlockResponse": QueryBlockResponse,
+    "QueryBlockTXsResponse": QueryBlockTXsResponse,
+    "QueryHeightResponse": QueryHeightResponse,
+    "QueryNodeClaimResponse": QueryNodeClaimResponse,
+    "QueryNodeClaimsResponse": QueryNodeClaimsResponse,
+    "QueryNodesResponse": QueryNodesResponse,
+    "QuerySigningInfoResponse": QuerySigningInfoResponse,
+    "QuerySupplyResponse": QuerySupplyResponse,
+    "QuerySupportedChainsResponse": QuerySupportedChainsResponse,
+    "StateResponse": StateResponse,
+    "Transaction": Transaction,
+    "Upgrade": Upgrade,
+}
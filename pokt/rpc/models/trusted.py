@@ -0,0 +1,160 @@
+"""
+Construction of the response models without validation, for trusted nodes.
+"""
+
+from enum import Enum
+import inspect
+from typing import Any, Callable, Literal, Optional, Type, TypeVar, get_origin
+
+from pydantic import BaseModel, ValidationError
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_builders: dict[type, Callable[[Any], Any]] = {}
+
+
+def _validating(field: ModelField, model: type) -> Callable[[Any], Any]:
+    def validate(value):
+        result, errors = field.validate(value, {}, loc=field.alias, cls=model)
+        if errors:
+            raise ValidationError([errors], model)
+        return result
+
+    return validate
+
+
+def _scalar(type_: type) -> Callable[[Any], Any]:
+    def convert(value):
+        return value if type(value) is type_ else type_(value)
+
+    return convert
+
+
+def _enum(type_: Type[Enum], use_values: bool) -> Callable[[Any], Any]:
+    def convert(value):
+        member = type_(value)
+        return member.value if use_values else member
+
+    return convert
+
+
+def _discriminated(field: ModelField, model: type) -> Callable[[Any], Any]:
+    alias = field.discriminator_alias
+    members = {
+        tag: _model_builder(sub_field.type_)
+        for tag, sub_field in field.sub_fields_mapping.items()
+    }
+
+    def build(value):
+        if not isinstance(value, dict):
+            return value
+        builder = members.get(value.get(alias))
+        if builder is None:
+            raise ValueError(
+                "{} isn't a known {} of {}.{}".format(
+                    value.get(alias), alias, model.__name__, field.name
+                )
+            )
+        return builder(value)
+
+    return build
+
+
+def _converter(field: ModelField, model: type) -> Optional[Callable[[Any], Any]]:
+    # None means the value is used as is.
+    if field.class_validators:
+        return _validating(field, model)
+    if field.discriminator_key is not None:
+        return _discriminated(field, model)
+    if field.shape == SHAPE_LIST and field.sub_fields:
+        item = _converter(field.sub_fields[0], model)
+        if item is None:
+            return list
+        return lambda value: [None if v is None else item(v) for v in value]
+    if field.shape != SHAPE_SINGLETON or field.sub_fields:
+        return _validating(field, model)
+    type_ = field.type_
+    if type_ is Any or get_origin(type_) is Literal:
+        return None
+    if isinstance(type_, type):
+        if issubclass(type_, BaseModel):
+            return _model_builder(type_)
+        if issubclass(type_, Enum):
+            return _enum(type_, model.__config__.use_enum_values)
+        if issubclass(type_, bool):
+            return _validating(field, model)
+        for scalar in (str, int, float):
+            if issubclass(type_, scalar):
+                return _scalar(scalar)
+    return _validating(field, model)
+
+
+def _needs_validation(model: Type[BaseModel]) -> bool:
+    # Field validators run on their own field, unless they look at the values of the other fields.
+    return bool(
+        model.__pre_root_validators__
+        or model.__post_root_validators__
+        or model.__custom_root_type__
+        or any(
+            "values" in inspect.signature(v.func).parameters
+            for f in model.__fields__.values()
+            for v in f.class_validators.values()
+        )
+    )
+
+
+def _model_builder(model: Type[BaseModel]) -> Callable[[Any], Any]:
+    builder = _builders.get(model)
+    if builder is not None:
+        return builder
+    if _needs_validation(model):
+        builder = _builders[model] = model.parse_obj
+        return builder
+
+    plan = []
+
+    def build(data):
+        if not isinstance(data, dict):
+            return model.parse_obj(data)
+        values = {}
+        fields_set = set()
+        for name, alias, convert, required, field in plan:
+            if alias in data:
+                value = data[alias]
+            elif name in data:
+                value = data[name]
+            elif required:
+                return model.parse_obj(data)
+            else:
+                values[name] = field.get_default()
+                continue
+            if value is not None and convert is not None:
+                value = convert(value)
+            values[name] = value
+            fields_set.add(name)
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__fields_set__", fields_set)
+        if model.__private_attributes__:
+            instance._init_private_attributes()
+        return instance
+
+    # Registered before the plan is compiled, so self-referencing models resolve to this builder.
+    _builders[model] = build
+    for name, field in model.__fields__.items():
+        plan.append(
+            (name, field.alias, _converter(field, model), field.required, field)
+        )
+    return build
+
+
+def construct_trusted(model: Type[ModelT], data: Any) -> ModelT:
+    """
+    Build model from the decoded response data without validating it, resolving nested
+    and discriminated models.
+
+    Only meant for data from a trusted source: constraints aren't checked, and a
+    malformed response may build a malformed model.
+    """
+    return _model_builder(model)(data)
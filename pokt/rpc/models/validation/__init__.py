@@ -7,6 +7,7 @@ from the provided rpc.yaml and the actual behavior are handled in
 the _overrides module, and are individually imported here to
 override the models imported from the * import from _generated.
 """
+
 from ._generated import BlockHeader
 from ._overrides import (
     Account,
@@ -25,7 +26,23 @@ from ._overrides import (
     HashRange,
     IntParam,
     JailedStatus,
+    MSG_TYPES,
+    MsgAppStake,
+    MsgAppUnjail,
+    MsgBeginAppUnstake,
+    MsgBeginValidatorUnstake,
+    MsgChangeParam,
+    MsgClaim,
+    MsgDaoTransfer,
+    MsgProof,
+    MsgSend,
     MsgSendVal,
+    MsgT,
+    MsgUpgrade,
+    MsgValidatorStake,
+    MsgValidatorUnjail,
+    ProofT,
+    discriminator_registry,
     ParamValueT,
     ProtobufTypes,
     QueryAccountsResponse,
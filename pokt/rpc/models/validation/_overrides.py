@@ -24,16 +24,33 @@ The two main instances of this are ParamValueT and MsgT acting
 as the Union types for the protocol parameter values and the messages contained in a transaction's
 stdTx field.
 
+The type strings of the messages are also precompiled into a registry (MSG_TYPES) mapping each one
+to its model, for code that dispatches on the type of a message with a single lookup rather than a
+chain of comparisons.
+
 """
 from enum import Enum
 import json
-from typing import Any, List, Literal, Optional, Union
+from typing import Any, List, Literal, Optional, Type, Union, get_args
 from typing_extensions import Annotated
 from pydantic import BaseModel, Field, conint, validator
 
 import pokt.transactions.messages.proto.tx_signer_pb2 as proto
 
 
+def discriminator_registry(
+    union: Any, discriminator: str
+) -> dict[str, Type[BaseModel]]:
+    """
+    Map every value the discriminator of a union's members can take, e.g. the type of an amino {type, value} envelope, to its model.
+    """
+    registry = {}
+    for model in get_args(union):
+        for tag in get_args(model.__fields__[discriminator].outer_type_):
+            registry[tag] = model
+    return registry
+
+
 class StakingStatus(int, Enum):
     unstaking = 1
     staked = 2
@@ -782,6 +799,8 @@ MsgT = Union[
     MsgValidatorUnjail,
 ]
 
+MSG_TYPES = discriminator_registry(MsgT, "type_")
+
 
 class TxResult(BaseModel):
     code: Optional[int] = None
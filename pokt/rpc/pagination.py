@@ -0,0 +1,181 @@
+"""
+Iteration over every page of the paginated queries.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
+
+from .data import get_height
+from .data.async_network import async_get_height
+from .utils import _signature
+
+# The field holding the items of each paginated query's response.
+PAGINATED = {
+    "get_accounts": "result",
+    "get_account_transactions": "txs",
+    "get_apps": "result",
+    "get_nodes": "result",
+    "get_node_claims": "result",
+    "get_signing_info": "result",
+}
+
+
+def _consume_error(task: asyncio.Future) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+def _name(rpc_method: Callable) -> str:
+    name = rpc_method.__name__
+    if name.startswith("async_"):
+        name = name[len("async_") :]
+    return name
+
+
+def _field(response: Any, name: str) -> Any:
+    if isinstance(response, dict):
+        return response.get(name)
+    return getattr(response, name, None)
+
+
+def _arguments(rpc_method: Callable, args: tuple, kwargs: dict) -> dict:
+    if _name(rpc_method) not in PAGINATED:
+        raise ValueError("{} isn't paginated".format(rpc_method.__name__))
+    bound = _signature(rpc_method).bind(None, *args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop("provider_url")
+    # Page 0 is the first page, as far as the RPC is concerned.
+    arguments["page"] = max(arguments["page"], 1)
+    return arguments
+
+
+def _unpinned(arguments: dict) -> bool:
+    # Pages requested at the latest height could shift as blocks are made mid-crawl.
+    return "height" in arguments and not arguments["height"]
+
+
+def total_pages(response: Any, per_page: int) -> int:
+    """
+    The number of pages of the paginated query response was a page of.
+    """
+    pages = _field(response, "total_pages")
+    if pages is not None:
+        return int(pages)
+    # The transaction queries only tell the total number of transactions.
+    count = int(_field(response, "total_count") or 0)
+    return -(-count // per_page)
+
+
+def page_items(rpc_method: Callable, response: Any) -> list:
+    """
+    The items on a page of the paginated query rpc_method.
+    """
+    return _field(response, PAGINATED[_name(rpc_method)]) or []
+
+
+def iter_pages(
+    call: Callable[..., Any], rpc_method: Callable, *args, prefetch: int = 4, **kwargs
+) -> Iterator[Any]:
+    """
+    Yield every page of the paginated query rpc_method, from the given page on,
+    requesting up to prefetch pages at once on a thread pool.
+
+    Parameters
+    ----------
+    call
+        The function to call rpc_method through with its arguments, e.g.
+        PoktRPCDataProvider.call.
+    rpc_method
+        The data function of the paginated query, e.g. get_nodes.
+    prefetch: optional
+        The most pages requested at once, defaults to 4.
+
+    Without a height, the latest height is requested first and every page is requested
+    at it.
+    """
+    arguments = _arguments(rpc_method, args, kwargs)
+    if _unpinned(arguments):
+        arguments["height"] = _field(call(get_height), "height")
+    first = call(rpc_method, **arguments)
+    yield first
+    last = total_pages(first, arguments["per_page"])
+    page = arguments["page"] + 1
+    if page > last:
+        return
+    pool = ThreadPoolExecutor(max_workers=prefetch)
+    pending = deque()
+    try:
+        while pending or page <= last:
+            while page <= last and len(pending) < prefetch:
+                pending.append(
+                    pool.submit(call, rpc_method, **dict(arguments, page=page))
+                )
+                page += 1
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_items(
+    call: Callable[..., Any], rpc_method: Callable, *args, prefetch: int = 4, **kwargs
+) -> Iterator[Any]:
+    """
+    Yield every item on every page of the paginated query rpc_method, see iter_pages.
+    """
+    for response in iter_pages(call, rpc_method, *args, prefetch=prefetch, **kwargs):
+        yield from page_items(rpc_method, response)
+
+
+async def aiter_pages(
+    call: Callable[..., Awaitable[Any]],
+    rpc_method: Callable,
+    *args,
+    prefetch: int = 4,
+    **kwargs
+) -> AsyncIterator[Any]:
+    """
+    The async counterpart to iter_pages, requesting up to prefetch pages at once as
+    tasks.
+    """
+    arguments = _arguments(rpc_method, args, kwargs)
+    if _unpinned(arguments):
+        arguments["height"] = _field(await call(async_get_height), "height")
+    first = await call(rpc_method, **arguments)
+    yield first
+    last = total_pages(first, arguments["per_page"])
+    page = arguments["page"] + 1
+    pending = deque()
+    try:
+        while pending or page <= last:
+            while page <= last and len(pending) < prefetch:
+                pending.append(
+                    asyncio.ensure_future(
+                        call(rpc_method, **dict(arguments, page=page))
+                    )
+                )
+                page += 1
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+            task.add_done_callback(_consume_error)
+
+
+async def aiter_items(
+    call: Callable[..., Awaitable[Any]],
+    rpc_method: Callable,
+    *args,
+    prefetch: int = 4,
+    **kwargs
+) -> AsyncIterator[Any]:
+    """
+    The async counterpart to iter_items.
+    """
+    async for response in aiter_pages(
+        call, rpc_method, *args, prefetch=prefetch, **kwargs
+    ):
+        for item in page_items(rpc_method, response):
+            yield item
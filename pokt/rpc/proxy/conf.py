@@ -3,25 +3,48 @@ from typing import Union, Optional
 
 from pydantic import AnyHttpUrl, BaseSettings, HttpUrl, root_validator
 
+from ...providers import AsyncPoktRPCDataProvider
+
 
 class ProxySettings(BaseSettings):
     portal_url: Optional[HttpUrl] = None
     pocket_node_url: Optional[AnyHttpUrl] = None
+    pocket_node_urls: list[AnyHttpUrl] = []
     prioritize_portal: bool = True
 
     @root_validator(pre=True)
     def must_have_some_url(cls, vals):
-        if vals.get("portal_url") is None and vals.get("pocket_node_url") is None:
+        if (
+            vals.get("portal_url") is None
+            and vals.get("pocket_node_url") is None
+            and not vals.get("pocket_node_urls")
+        ):
             raise ValueError("Either a Portal URL or Pocket Node URL must be provided")
         return vals
 
     @property
     def url(self) -> Union[AnyHttpUrl, HttpUrl]:
-        if self.prioritize_portal:
-            return self.pocket_node_url if self.portal_url is None else self.portal_url  # type: ignore
-        return self.portal_url if self.pocket_node_url is None else self.pocket_node_url  # type: ignore
+        return self.urls[0]
+
+    @property
+    def urls(self) -> list[Union[AnyHttpUrl, HttpUrl]]:
+        """
+        Every configured endpoint, in order of priority.
+        """
+        nodes = [self.pocket_node_url] if self.pocket_node_url is not None else []
+        nodes.extend(u for u in self.pocket_node_urls if u not in nodes)
+        portal = [self.portal_url] if self.portal_url is not None else []
+        return portal + nodes if self.prioritize_portal else nodes + portal
 
 
 @lru_cache
 def settings() -> ProxySettings:
     return ProxySettings()
+
+
+@lru_cache
+def rpc_provider() -> AsyncPoktRPCDataProvider:
+    urls = settings().urls
+    return AsyncPoktRPCDataProvider(
+        urls[0] if len(urls) == 1 else urls, single_flight=True
+    )
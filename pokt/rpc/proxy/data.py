@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends
 
-from .conf import ProxySettings, settings
+from .conf import rpc_provider
+
+from ...providers import AsyncPoktRPCDataProvider
 
 from ..data.async_account import (
     async_get_account,
@@ -65,70 +67,83 @@ from ..data.async_service import (
 from ..data.async_transaction import async_get_transaction_by_hash, QueryTX, Transaction
 
 
+# Routes return the raw responses, since FastAPI validates them against the response model anyway.
 router = APIRouter(prefix="/v1/query")
 
 
 @router.post("/account", response_model=BaseAccountVal, tags=["account"])
 async def account(
-    req: QueryAddressHeight, conf: ProxySettings = Depends(settings)
+    req: QueryAddressHeight,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> BaseAccountVal:
-    return await async_get_account(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(async_get_account, raw=True, **req.dict(exclude_unset=True))
 
 
 @router.post("/accounts", response_model=QueryAccountsResponse, tags=["account"])
 async def accounts(
-    req: QueryPaginatedHeightParams, conf: ProxySettings = Depends(settings)
+    req: QueryPaginatedHeightParams,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> QueryAccountsResponse:
-    return await async_get_accounts(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(async_get_accounts, raw=True, **req.dict(exclude_unset=True))
 
 
 @router.post("/balance", response_model=QueryBalanceResponse, tags=["account"])
 async def balance(
-    req: QueryAddressHeight, conf: ProxySettings = Depends(settings)
+    req: QueryAddressHeight,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> QueryBalanceResponse:
-    return await async_get_balance(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(async_get_balance, raw=True, **req.dict(exclude_unset=True))
 
 
 @router.post("/accounttxs", response_model=QueryAccountTXsResponse, tags=["account"])
 async def account_txs(
-    req: QueryAccountTXs, conf: ProxySettings = Depends(settings)
+    req: QueryAccountTXs,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> QueryAccountTXsResponse:
-    return await async_get_account_transactions(
-        conf.url, **req.dict(exclude_unset=True)
+    return await rpc.call(
+        async_get_account_transactions, raw=True, **req.dict(exclude_unset=True)
     )
 
 
 @router.post("/block", response_model=QueryBlockResponse, tags=["block"])
 async def block(
-    req: QueryBlock, conf: ProxySettings = Depends(settings)
+    req: QueryBlock,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> QueryBlockResponse:
-    return await async_get_block(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(async_get_block, raw=True, **req.dict(exclude_unset=True))
 
 
 @router.post("/blocktxs", response_model=QueryBlockTXsResponse, tags=["block"])
 async def block_txs(
-    req: QueryBlockTXs, conf: ProxySettings = Depends(settings)
+    req: QueryBlockTXs,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> QueryBlockTXsResponse:
-    return await async_get_block_transactions(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(
+        async_get_block_transactions, raw=True, **req.dict(exclude_unset=True)
+    )
 
 
 @router.post("/height", response_model=QueryHeightResponse, tags=["network"])
-async def height(conf: ProxySettings = Depends(settings)) -> QueryHeightResponse:
-    return await async_get_height(conf.url)
+async def height(
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
+) -> QueryHeightResponse:
+    return await rpc.call(async_get_height, raw=True)
 
 
 @router.post("/state", response_model=StateResponse, tags=["network"])
 async def state(
-    req: QueryHeight, conf: ProxySettings = Depends(settings)
+    req: QueryHeight,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> StateResponse:
-    return await async_get_state(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(async_get_state, raw=True, **req.dict(exclude_unset=True))
 
 
 @router.post("/supply", response_model=QuerySupplyResponse, tags=["network"])
 async def supply(
-    req: QueryHeight, conf: ProxySettings = Depends(settings)
+    req: QueryHeight,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> QuerySupplyResponse:
-    return await async_get_supply(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(async_get_supply, raw=True, **req.dict(exclude_unset=True))
 
 
 @router.post(
@@ -136,81 +151,105 @@ async def supply(
 )
 async def supported_chains(
     req: QueryHeight,
-    conf: ProxySettings = Depends(settings),
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> QuerySupportedChainsResponse:
-    return await async_get_supported_chains(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(async_get_supported_chains, **req.dict(exclude_unset=True))
 
 
 @router.post("/upgrade", response_model=Upgrade, tags=["network"])
-async def upgrade(req: QueryHeight, conf: ProxySettings = Depends(settings)) -> Upgrade:
-    return await async_get_upgrade(conf.url, **req.dict(exclude_unset=True))
+async def upgrade(
+    req: QueryHeight,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
+) -> Upgrade:
+    return await rpc.call(async_get_upgrade, raw=True, **req.dict(exclude_unset=True))
 
 
 @router.post("/param", response_model=ParamT, tags=["network"])
 async def param(
-    req: QueryHeightAndKey, conf: ProxySettings = Depends(settings)
+    req: QueryHeightAndKey,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> ParamT:
     h = req.height if req.height else 0
-    return await async_get_param(conf.url, req.key, h)
+    return await rpc.call(async_get_param, req.key, h)
 
 
 @router.post("/allParams", response_model=AllParams, tags=["network"])
 async def all_params(
     req: QueryHeight,
-    conf: ProxySettings = Depends(settings),
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> AllParams:
-    return await async_get_all_params(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(
+        async_get_all_params, raw=True, **req.dict(exclude_unset=True)
+    )
 
 
 @router.post("/app", response_model=Application, tags=["service"])
 async def single_app(
-    req: QueryAddressHeight, conf: ProxySettings = Depends(settings)
+    req: QueryAddressHeight,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> Application:
-    return await async_get_app(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(async_get_app, raw=True, **req.dict(exclude_unset=True))
 
 
 @router.post("/apps", response_model=QueryAppsResponse, tags=["service"])
 async def apps(
-    req: QueryHeightAndApplicationsOpts, conf: ProxySettings = Depends(settings)
+    req: QueryHeightAndApplicationsOpts,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> QueryAppsResponse:
-    return await async_get_apps(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(async_get_apps, raw=True, **req.dict(exclude_unset=True))
 
 
 @router.post("/node", response_model=Node, tags=["service"])
 async def node(
-    req: QueryAddressHeight, conf: ProxySettings = Depends(settings)
+    req: QueryAddressHeight,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> Node:
-    return await async_get_node(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(async_get_node, raw=True, **req.dict(exclude_unset=True))
 
 
 @router.post("/nodes", response_model=QueryNodesResponse, tags=["service"])
 async def nodes(
-    req: QueryHeightAndValidatorsOpts, conf: ProxySettings = Depends(settings)
+    req: QueryHeightAndValidatorsOpts,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> QueryNodesResponse:
-    return await async_get_nodes(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(async_get_nodes, raw=True, **req.dict(exclude_unset=True))
 
 
 @router.post("/signinginfo", response_model=QuerySigningInfoResponse, tags=["service"])
 async def signing_info(
-    req: QueryPaginatedHeightAndAddrParams, conf: ProxySettings = Depends(settings)
+    req: QueryPaginatedHeightAndAddrParams,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> QuerySigningInfoResponse:
-    return await async_get_signing_info(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(
+        async_get_signing_info, raw=True, **req.dict(exclude_unset=True)
+    )
 
 
 @router.post("/nodeclaim", response_model=QueryNodeClaimResponse, tags=["service"])
 async def node_claim(
-    req: QueryNodeReceipt, conf: ProxySettings = Depends(settings)
+    req: QueryNodeReceipt,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> QueryNodeClaimResponse:
-    return await async_get_node_claim(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(
+        async_get_node_claim, raw=True, **req.dict(exclude_unset=True)
+    )
 
 
 @router.post("/nodeclaims", response_model=QueryNodeClaimsResponse, tags=["service"])
 async def node_claims(
-    req: QueryPaginatedHeightAndAddrParams, conf: ProxySettings = Depends(settings)
+    req: QueryPaginatedHeightAndAddrParams,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
 ) -> QueryNodeClaimsResponse:
-    return await async_get_node_claims(conf.url, **req.dict(exclude_unset=True))
+    return await rpc.call(
+        async_get_node_claims, raw=True, **req.dict(exclude_unset=True)
+    )
 
 
 @router.post("/tx", response_model=Transaction, tags=["transaction"])
-async def tx(req: QueryTX, conf: ProxySettings = Depends(settings)) -> Transaction:
-    return await async_get_transaction_by_hash(conf.url, req.hash_, bool(req.prove))
+async def tx(
+    req: QueryTX,
+    rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider),
+) -> Transaction:
+    return await rpc.call(
+        async_get_transaction_by_hash, req.hash_, bool(req.prove), raw=True
+    )
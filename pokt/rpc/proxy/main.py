@@ -1,18 +1,37 @@
-from fastapi import Depends, FastAPI
+import math
+
+from fastapi import Depends, FastAPI, Request
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import JSONResponse
 
-from .conf import ProxySettings, settings
+from .conf import rpc_provider
 from .data import router as data_router
+from ...providers import AsyncPoktRPCDataProvider
 from ..data.async_network import async_get_version
+from ..errors import CircuitOpenError
 
 app = FastAPI(openapi_url="/v1/openapi.json")
 
 app.include_router(data_router)
 
 
+@app.on_event("shutdown")
+async def close_rpc_session():
+    await rpc_provider().close()
+
+
+@app.exception_handler(CircuitOpenError)
+async def circuit_open(request: Request, exc: CircuitOpenError) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"code": 503, "message": str(exc)},
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+    )
+
+
 @app.get("/v1", tags=["network"])
-async def version(conf: ProxySettings = Depends(settings)) -> str:
-    return await async_get_version(conf.url)
+async def version(rpc: AsyncPoktRPCDataProvider = Depends(rpc_provider)) -> str:
+    return await rpc.call(async_get_version)
 
 
 api_description = """
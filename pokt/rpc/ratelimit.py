@@ -0,0 +1,151 @@
+"""
+A client side rate limiter for the RPC transport, shared across processes.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+import multiprocessing
+import time
+from typing import AsyncIterator, Iterator, Optional
+
+
+class RateLimiter:
+    """
+    Parameters
+    ----------
+    rate
+        The requests allowed per second, or None to only limit the requests in flight.
+    burst: optional
+        The most requests that can be made at once after a quiet period, defaults to one
+        second's worth of requests.
+    max_concurrency: optional
+        The most requests in flight at once, defaults to no limit.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float],
+        burst: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError("The rate must be positive.")
+        self.rate = rate
+        self.burst = max(1.0, (rate or 1.0) if burst is None else burst)
+        self.max_concurrency = max_concurrency
+        self._lock = multiprocessing.Lock()
+        self._tokens = multiprocessing.RawValue("d", self.burst)
+        self._updated = multiprocessing.RawValue("d", time.monotonic())
+        self._slots = (
+            None
+            if max_concurrency is None
+            else multiprocessing.BoundedSemaphore(max_concurrency)
+        )
+
+    def _take(self) -> float:
+        # Takes a token if there is one, otherwise returns the seconds until there will be.
+        if self.rate is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(
+                self.burst, self._tokens.value + (now - self._updated.value) * self.rate
+            )
+            self._updated.value = now
+            if tokens >= 1:
+                self._tokens.value = tokens - 1
+                return 0.0
+            self._tokens.value = tokens
+            return (1 - tokens) / self.rate
+
+    def acquire(self) -> None:
+        """
+        Block until a request may be made, taking a concurrency slot that has to be
+        given back with release().
+        """
+        while True:
+            wait = self._take()
+            if not wait:
+                break
+            time.sleep(wait)
+        if self._slots is not None:
+            self._slots.acquire()
+
+    async def acquire_async(self) -> None:
+        """
+        Wait until a request may be made without blocking the event loop, taking a
+        concurrency slot that has to be given back with release().
+        """
+        while True:
+            wait = self._take()
+            if not wait:
+                break
+            await asyncio.sleep(wait)
+        if self._slots is not None:
+            while not self._slots.acquire(block=False):
+                await asyncio.sleep(0.005)
+
+    def release(self) -> None:
+        if self._slots is not None:
+            self._slots.release()
+
+    @contextmanager
+    def limit(self) -> Iterator[None]:
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def limit_async(self) -> AsyncIterator[None]:
+        await self.acquire_async()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """
+    Set the rate limiter every request made by the transport waits on, or turn it off
+    with None.
+
+    Can be passed as the initializer of a multiprocessing.Pool, with the limiter as its
+    argument, to share one limiter across the workers.
+    """
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    return _rate_limiter
+
+
+@contextmanager
+def limited() -> Iterator[None]:
+    """
+    Hold off a request until the current rate limiter, if any, lets it through.
+    """
+    limiter = _rate_limiter
+    if limiter is None:
+        yield
+        return
+    with limiter.limit():
+        yield
+
+
+@asynccontextmanager
+async def limited_async() -> AsyncIterator[None]:
+    """
+    Hold off a request until the current rate limiter, if any, lets it through.
+    """
+    limiter = _rate_limiter
+    if limiter is None:
+        yield
+        return
+    async with limiter.limit_async():
+        yield
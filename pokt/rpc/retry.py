@@ -0,0 +1,239 @@
+"""
+Retry policies for the RPC transport, with backoff, jitter, deadlines and a budget.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+
+import requests
+
+from .errors import CircuitOpenError, PoktHTTPError, PoktRPCError, PortalRPCError
+
+try:
+    import aiohttp
+
+    _CONNECTION_ERRORS: tuple = (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientPayloadError,
+        asyncio.TimeoutError,
+    )
+except ImportError:
+    _CONNECTION_ERRORS = (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        asyncio.TimeoutError,
+    )
+
+
+DEFAULT_RETRY_STATUSES = frozenset((408, 425, 429, 500, 502, 503, 504))
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the calls made through the policies sharing this
+    budget.
+
+    Every call deposits `ratio` tokens, and every retry withdraws a whole token. The
+    budget starts with enough tokens for `min_retries` retries so that a client that
+    just started can still retry.
+
+    Parameters
+    ----------
+    ratio: optional
+        The number of retries allowed per call made, defaults to 0.2 (one retry for
+        every 5 calls).
+    min_retries: optional
+        The number of retries that are always affordable, defaults to 10.
+    max_tokens: optional
+        The most tokens the budget can bank during quiet periods, defaults to 100.
+    """
+
+    def __init__(
+        self, ratio: float = 0.2, min_retries: int = 10, max_tokens: int = 100
+    ):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.max_tokens = max(max_tokens, min_retries)
+        self._tokens = float(min_retries)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.retries = 0
+        self.rejected = 0
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def deposit(self) -> None:
+        with self._lock:
+            self.calls += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.retries += 1
+                return True
+            self.rejected += 1
+            return False
+
+
+class RetryPolicy:
+    """
+    Retries RPC calls that fail for transient reasons.
+
+    Parameters
+    ----------
+    max_attempts: optional
+        The total number of attempts made for a call, including the first, defaults to
+        5.
+    backoff_base: optional
+        The backoff ceiling in seconds for the first retry, doubled for every following
+        retry, defaults to 0.25.
+    backoff_max: optional
+        The largest backoff ceiling in seconds, defaults to 10.
+    jitter: optional
+        Whether the backoff is drawn uniformly from [0, ceiling] (full jitter) instead
+        of sleeping the ceiling, defaults to True.
+    deadline: optional
+        The number of seconds a call may take across all of its attempts and backoffs,
+        defaults to no deadline.
+    retry_statuses: optional
+        The HTTP statuses, and Portal error codes, that are considered transient.
+    retry_pokt_codes: optional
+        The Pocket RPC error codes that are considered transient, defaults to none of
+        them. Passing None retries on any Pocket RPC error.
+    retry_exceptions: optional
+        Any additional exception types that should always be retried.
+    budget: optional
+        The retry budget shared by the calls made through this policy, defaults to a new
+        RetryBudget.
+    on_retry: optional
+        A callback receiving the exception, the attempt number that failed and the
+        backoff before the next attempt.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff_base: float = 0.25,
+        backoff_max: float = 10.0,
+        jitter: bool = True,
+        deadline: Optional[float] = None,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_pokt_codes: Optional[Iterable[int]] = (),
+        retry_exceptions: Iterable[type] = (),
+        budget: Optional[RetryBudget] = None,
+        on_retry: Optional[Callable[[Exception, int, float], Any]] = None,
+    ):
+        if max_attempts < 1:
+            raise ValueError("A retry policy must make at least one attempt.")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_pokt_codes = (
+            None if retry_pokt_codes is None else frozenset(retry_pokt_codes)
+        )
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.budget = RetryBudget() if budget is None else budget
+        self.on_retry = on_retry
+
+    @classmethod
+    def no_retries(cls) -> "RetryPolicy":
+        return cls(max_attempts=1)
+
+    def is_retryable(self, exc: Exception) -> bool:
+        if isinstance(exc, self.retry_exceptions):
+            return True
+        if isinstance(exc, (CircuitOpenError,) + _CONNECTION_ERRORS):
+            return True
+        if isinstance(exc, PoktHTTPError):
+            # A malformed body on a successful status is usually a proxy in front of the node misbehaving.
+            return exc.status in self.retry_statuses or exc.status < 400
+        if isinstance(exc, PortalRPCError):
+            return _as_int(exc.code) in self.retry_statuses
+        if isinstance(exc, PoktRPCError):
+            if self.retry_pokt_codes is None:
+                return True
+            return _as_int(exc.code) in self.retry_pokt_codes
+        return False
+
+    def backoff(self, attempt: int) -> float:
+        """
+        The number of seconds to wait after the given (1-indexed) failed attempt.
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            return random.uniform(0, ceiling)
+        return ceiling
+
+    def _next_delay(
+        self, exc: Exception, attempt: int, started: float
+    ) -> Optional[float]:
+        if attempt >= self.max_attempts or not self.is_retryable(exc):
+            return None
+        delay = self.backoff(attempt)
+        if self.deadline is not None:
+            if time.monotonic() + delay - started >= self.deadline:
+                return None
+        if not self.budget.withdraw():
+            return None
+        if self.on_retry is not None:
+            self.on_retry(exc, attempt, delay)
+        return delay
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """
+        Call fn with the given arguments, retrying according to the policy.
+
+        The last error is re-raised once the attempts, the deadline or the retry budget
+        run out.
+        """
+        self.budget.deposit()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(e, attempt, started)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+
+    async def call_async(self, fn: Callable, *args, **kwargs):
+        """
+        Await fn with the given arguments, retrying according to the policy.
+
+        The last error is re-raised once the attempts, the deadline or the retry budget
+        run out.
+        """
+        self.budget.deposit()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(e, attempt, started)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+
+
+def _as_int(code) -> Optional[int]:
+    try:
+        return int(code)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,107 @@
+"""
+Coalescing of identical in-flight requests.
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Hashable
+
+from .utils import request_key
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical calls made concurrently from multiple threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Call fn, unless a call with the same key is already in flight, in which case its
+        result is shared.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def call(self, call: Callable, rpc_method: Callable, *args, **kwargs) -> Any:
+        """
+        Make call(rpc_method, *args, **kwargs), coalesced with any identical request to
+        rpc_method in flight.
+        """
+        key, _ = request_key(rpc_method, *args, **kwargs)
+        return self.do(key, call, rpc_method, *args, **kwargs)
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces identical calls made concurrently from multiple coroutines.
+
+    The upstream call runs as its own task, so a caller being cancelled doesn't cancel
+    the call for the others waiting on it.
+    """
+
+    def __init__(self):
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Await fn, unless a call with the same key is already in flight, in which case
+        its result is shared.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        self._tasks.pop(key, None)
+        # Retrieve the error so it isn't reported as unhandled when every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    async def call(self, call: Callable, rpc_method: Callable, *args, **kwargs) -> Any:
+        """
+        Await call(rpc_method, *args, **kwargs), coalesced with any identical request to
+        rpc_method in flight.
+        """
+        key, _ = request_key(rpc_method, *args, **kwargs)
+        return await self.do(key, call, rpc_method, *args, **kwargs)
@@ -0,0 +1,224 @@
+"""
+Streaming of blocks, with their transactions, in height order.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional
+
+from .data import get_block, get_block_transactions, get_height
+from .data.async_block import async_get_block, async_get_block_transactions
+from .data.async_network import async_get_height
+from .errors import EmptyBlockError
+from .pagination import _consume_error, _field
+
+BlockT = tuple[Any, list]
+
+# Set by the stream itself for every page of transactions.
+_STREAM_ARGUMENTS = ("height", "page", "order")
+
+# The times an empty block is requested again before giving up on it.
+EMPTY_BLOCK_RETRIES = 3
+
+
+def _header(block: Any) -> Any:
+    return _field(_field(block, "block"), "header")
+
+
+def _no_txs(header: Any) -> bool:
+    # Raw headers carry num_txs as a string.
+    num_txs = _field(header, "num_txs")
+    return num_txs is not None and int(num_txs) == 0
+
+
+def _has_more_txs(txs: list, page_txs: list, page: Any) -> bool:
+    return bool(page_txs) and len(txs) < int(_field(page, "total_count") or 0)
+
+
+def _check_kwargs(kwargs: dict) -> None:
+    for name in _STREAM_ARGUMENTS:
+        if name in kwargs:
+            raise TypeError(
+                "{} can't be passed along, the stream sets it for each request".format(
+                    name
+                )
+            )
+
+
+def _fetch_header(
+    call: Callable[..., Any], height: int, poll_interval: float, kwargs: dict
+) -> Any:
+    for attempt in range(EMPTY_BLOCK_RETRIES + 1):
+        if attempt:
+            time.sleep(poll_interval)
+        header = _header(call(get_block, height=height, **kwargs))
+        if header is not None:
+            return header
+    raise EmptyBlockError(height)
+
+
+def _fetch_block(
+    call: Callable[..., Any],
+    height: int,
+    per_page: int,
+    poll_interval: float,
+    kwargs: dict,
+) -> BlockT:
+    header = _fetch_header(call, height, poll_interval, kwargs)
+    txs = []
+    if _no_txs(header):
+        return header, txs
+    page = 1
+    while True:
+        resp = call(
+            get_block_transactions,
+            height=height,
+            page=page,
+            per_page=per_page,
+            order="asc",
+            **kwargs
+        )
+        page_txs = _field(resp, "txs") or []
+        txs.extend(page_txs)
+        if not _has_more_txs(txs, page_txs, resp):
+            return header, txs
+        page += 1
+
+
+def stream_blocks(
+    call: Callable[..., Any],
+    start: int,
+    end: Optional[int] = None,
+    window: int = 8,
+    per_page: int = 1000,
+    poll_interval: float = 5.0,
+    **kwargs
+) -> Iterator[BlockT]:
+    """
+    Yield the (header, txs) of every block from start to end in height order, fetching
+    up to window blocks at once on a thread pool.
+
+    Parameters
+    ----------
+    call
+        The function to call the data functions through with their arguments, e.g.
+        PoktRPCDataProvider.call.
+    start
+        The height of the first block.
+    end: optional
+        The height of the last block, defaults to following the chain indefinitely.
+    window: optional
+        The most blocks fetched at once, defaults to 8.
+    per_page: optional
+        The transactions requested per page, defaults to 1000.
+    poll_interval: optional
+        The seconds between polls of the height once the stream has caught up with the
+        chain, and between requests of a block that came back empty, defaults to 5.
+
+    Any other keyword arguments (raw, struct, ...) are passed along to get_block and
+    get_block_transactions, except for height, page and order, which the stream sets
+    itself, with the transactions in ascending order. Raises EmptyBlockError if a block
+    still comes back empty after EMPTY_BLOCK_RETRIES more requests.
+    """
+    _check_kwargs(kwargs)
+    latest = end if end is not None else start - 1
+    height = start
+    pool = ThreadPoolExecutor(max_workers=window)
+    pending = deque()
+    try:
+        while end is None or height <= end or pending:
+            if end is None and height > latest and not pending:
+                latest = _field(call(get_height), "height")
+                if height > latest:
+                    time.sleep(poll_interval)
+                    continue
+            while len(pending) < window and height <= latest:
+                pending.append(
+                    pool.submit(
+                        _fetch_block, call, height, per_page, poll_interval, kwargs
+                    )
+                )
+                height += 1
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _afetch_header(
+    call: Callable[..., Awaitable[Any]], height: int, poll_interval: float, kwargs: dict
+) -> Any:
+    for attempt in range(EMPTY_BLOCK_RETRIES + 1):
+        if attempt:
+            await asyncio.sleep(poll_interval)
+        header = _header(await call(async_get_block, height=height, **kwargs))
+        if header is not None:
+            return header
+    raise EmptyBlockError(height)
+
+
+async def _afetch_block(
+    call: Callable[..., Awaitable[Any]],
+    height: int,
+    per_page: int,
+    poll_interval: float,
+    kwargs: dict,
+) -> BlockT:
+    header = await _afetch_header(call, height, poll_interval, kwargs)
+    txs = []
+    if _no_txs(header):
+        return header, txs
+    page = 1
+    while True:
+        resp = await call(
+            async_get_block_transactions,
+            height=height,
+            page=page,
+            per_page=per_page,
+            order="asc",
+            **kwargs
+        )
+        page_txs = _field(resp, "txs") or []
+        txs.extend(page_txs)
+        if not _has_more_txs(txs, page_txs, resp):
+            return header, txs
+        page += 1
+
+
+async def astream_blocks(
+    call: Callable[..., Awaitable[Any]],
+    start: int,
+    end: Optional[int] = None,
+    window: int = 8,
+    per_page: int = 1000,
+    poll_interval: float = 5.0,
+    **kwargs
+) -> AsyncIterator[BlockT]:
+    """
+    The async counterpart to stream_blocks, fetching up to window blocks at once as
+    tasks.
+    """
+    _check_kwargs(kwargs)
+    latest = end if end is not None else start - 1
+    height = start
+    pending = deque()
+    try:
+        while end is None or height <= end or pending:
+            if end is None and height > latest and not pending:
+                latest = _field(await call(async_get_height), "height")
+                if height > latest:
+                    await asyncio.sleep(poll_interval)
+                    continue
+            while len(pending) < window and height <= latest:
+                pending.append(
+                    asyncio.ensure_future(
+                        _afetch_block(call, height, per_page, poll_interval, kwargs)
+                    )
+                )
+                height += 1
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+            task.add_done_callback(_consume_error)
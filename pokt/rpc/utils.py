@@ -1,8 +1,129 @@
+from functools import lru_cache
+import inspect
 import json
-from typing import Optional
+import socket
+from typing import Any, Callable, Optional, Sequence, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 
-from . import DEFAULT_GET_HEADERS, DEFAULT_POST_HEADERS, PoktRPCError, PortalRPCError
+from . import (
+    DEFAULT_GET_HEADERS,
+    DEFAULT_POST_HEADERS,
+    DEFAULT_TIMEOUT,
+    PoktHTTPError,
+    PoktRPCError,
+    PortalRPCError,
+)
+from .breaker import guard
+from .jsonlib import dumps, loads
+from .ratelimit import limited
+
+TimeoutT = Union[float, tuple[float, float]]
+
+
+def _keepalive_socket_options(idle: int, interval: int, count: int) -> list:
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in (
+        ("TCP_KEEPIDLE", idle),
+        ("TCP_KEEPINTVL", interval),
+        ("TCP_KEEPCNT", count),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class PoolingHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter that applies a default timeout to every request sent through it, and optionally
+    enables TCP keep-alive probes on its pooled connections so idle connections dropped by a load
+    balancer are noticed instead of hanging a request.
+
+    Parameters
+    ----------
+    pool_connections: optional
+        The number of per host connection pools to cache, defaults to 10.
+    pool_maxsize: optional
+        The most connections kept open to a single host, defaults to 10.
+    pool_block: optional
+        Whether to wait for a free connection once pool_maxsize is reached, instead of opening a throwaway one, defaults to True.
+    timeout: optional
+        The (connect, read) timeout in seconds used when a request doesn't specify one, defaults to DEFAULT_TIMEOUT.
+    keepalive: optional
+        Whether to enable TCP keep-alive probes on pooled connections, defaults to True.
+    keepalive_idle: optional
+        The seconds a connection is idle before the first keep-alive probe, defaults to 60.
+    keepalive_interval: optional
+        The seconds between keep-alive probes, defaults to 10.
+    keepalive_count: optional
+        The number of failed probes before the connection is dropped, defaults to 6.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = True,
+        timeout: Optional[TimeoutT] = DEFAULT_TIMEOUT,
+        keepalive: bool = True,
+        keepalive_idle: int = 60,
+        keepalive_interval: int = 10,
+        keepalive_count: int = 6,
+    ):
+        self.timeout = timeout
+        self._socket_options = (
+            _keepalive_socket_options(
+                keepalive_idle, keepalive_interval, keepalive_count
+            )
+            if keepalive
+            else None
+        )
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self._socket_options is not None:
+            pool_kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.timeout
+        return super().send(request, timeout=timeout, **kwargs)
+
+
+def make_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = True,
+    connect_timeout: float = DEFAULT_TIMEOUT[0],
+    read_timeout: float = DEFAULT_TIMEOUT[1],
+    keepalive: bool = True,
+    keepalive_idle: int = 60,
+) -> requests.Session:
+    """
+    Create a requests session with pooled connections and default timeouts.
+
+    With pool_block set, the session can be shared by a thread pool of up to pool_maxsize threads
+    per host without opening and tearing down connections beyond the pool.
+    """
+    adapter = PoolingHTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        timeout=(connect_timeout, read_timeout),
+        keepalive=keepalive,
+        keepalive_idle=keepalive_idle,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 def make_api_url(provider_url: str, route: str, version: str = "v1") -> str:
@@ -13,46 +134,157 @@ def make_api_url(provider_url: str, route: str, version: str = "v1") -> str:
     return provider_url + version + route
 
 
-def get(route: str, session: Optional[requests.Session] = None, **params) -> str:
-    if session is None:
-        resp = requests.get(route, headers=DEFAULT_GET_HEADERS, params=params)
-    else:
-        resp = session.get(route, params=params, headers=DEFAULT_GET_HEADERS)
-    try:
-        data = resp.json()
-    except:
-        pass
-    else:
-        if isinstance(data, dict):
-            error_obj = data.get("error")
-            if error_obj:
-                error_code = error_obj.get("code", None)
-                if error_code is None:
-                    error_code = error_obj.get("statusCode", None)
-                raise PortalRPCError(error_code, error_obj.get("message"))
+@lru_cache(maxsize=None)
+def _signature(rpc_method: Callable) -> inspect.Signature:
+    return inspect.signature(rpc_method)
 
-            error_code = data.get("code", None)
-            if error_code:
-                raise PoktRPCError(error_code, data.get("message"))
-    return resp.text
 
+def request_key(rpc_method: Callable, *args, **kwargs) -> tuple[str, int]:
+    """
+    A canonical key for calling one of the data functions with the given arguments (excluding the provider url and session), along with the height queried.
 
-def post(route: str, session: Optional[requests.Session] = None, **payload) -> dict:
-    if session is None:
-        resp = requests.post(
-            route, headers=DEFAULT_POST_HEADERS, data=json.dumps(payload)
-        )
-    else:
-        resp = session.post(
-            route, data=json.dumps(payload), headers=DEFAULT_POST_HEADERS
-        )
-    data = resp.json()
+    Calls that make the same request get the same key, however their arguments were passed.
+    """
+    bound = _signature(rpc_method).bind(None, *args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop("provider_url", None)
+    arguments.pop("session", None)
+    height = arguments.get("height") or 0
+    route = rpc_method.__name__
+    if route.startswith("async_"):
+        route = route[len("async_") :]
+    body = json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+    return "{}:{}".format(route, body), height
+
+
+def raise_for_rpc_error(data) -> None:
+    """
+    Raise the matching error if the decoded response body describes a Portal or Pocket RPC error.
+    """
     if isinstance(data, dict):
         error_obj = data.get("error")
         if error_obj:
-            raise PortalRPCError(error_obj.get("code"), error_obj.get("message"))
+            error_code = error_obj.get("code", None)
+            if error_code is None:
+                error_code = error_obj.get("statusCode", None)
+            raise PortalRPCError(error_code, error_obj.get("message"))
 
         error_code = data.get("code", None)
         if error_code:
             raise PoktRPCError(error_code, data.get("message"))
+
+
+def _truncate_body(body: bytes, limit: int = 200) -> str:
+    text = body[: limit + 1].decode("utf-8", errors="replace")
+    if len(text) > limit:
+        return text[:limit] + "..."
+    return text
+
+
+def _read_get_body(status: int, body: bytes) -> str:
+    # Only bodies that look like JSON can hold an error, so plain text bodies aren't decoded at all.
+    if body.lstrip()[:1] in (b"{", b"["):
+        try:
+            data = loads(body)
+        except ValueError:
+            pass
+        else:
+            raise_for_rpc_error(data)
+    if status >= 400:
+        raise PoktHTTPError(status, _truncate_body(body))
+    return body.decode("utf-8")
+
+
+def _read_post_body(
+    status: int, body: bytes, decode: Optional[Callable[[bytes], Any]] = None
+):
+    if decode is not None:
+        try:
+            return decode(body)
+        except ValueError:
+            # Bodies that aren't JSON are reported like any other below.
+            if body.lstrip()[:1] in (b"{", b"["):
+                raise
+    try:
+        data = loads(body)
+    except ValueError:
+        raise PoktHTTPError(status, _truncate_body(body))
+    raise_for_rpc_error(data)
     return data
+
+
+def _get(route: str, session: Optional[requests.Session], params: dict) -> str:
+    if session is None:
+        resp = requests.get(
+            route, headers=DEFAULT_GET_HEADERS, params=params, timeout=DEFAULT_TIMEOUT
+        )
+    else:
+        resp = session.get(route, params=params, headers=DEFAULT_GET_HEADERS)
+    return _read_get_body(resp.status_code, resp.content)
+
+
+def get(route: str, session: Optional[requests.Session] = None, **params) -> str:
+    with guard(route), limited():
+        return _get(route, session, params)
+
+
+def _post(
+    route: str,
+    session: Optional[requests.Session],
+    payload: dict,
+    decode: Optional[Callable[[bytes], Any]] = None,
+):
+    if session is None:
+        resp = requests.post(
+            route,
+            headers=DEFAULT_POST_HEADERS,
+            data=dumps(payload),
+            timeout=DEFAULT_TIMEOUT,
+        )
+    else:
+        resp = session.post(route, data=dumps(payload), headers=DEFAULT_POST_HEADERS)
+    return _read_post_body(resp.status_code, resp.content, decode)
+
+
+def post(
+    route: str,
+    session: Optional[requests.Session] = None,
+    decode: Optional[Callable[[bytes], Any]] = None,
+    **payload
+):
+    """
+    Post payload to route, returning the decoded response body, or what decode makes of the raw body when given.
+    """
+    with guard(route), limited():
+        return _post(route, session, payload, decode)
+
+
+def struct_decoder(
+    name: str, exclude: Optional[Sequence[str]] = None
+) -> Callable[[bytes], Any]:
+    """
+    The decoder of the msgspec struct generated for the named response model, see pokt.rpc.models.structs, skipping over the excluded fields.
+    """
+    from .models.structs import decoder
+
+    return decoder(name, tuple(exclude or ()))
+
+
+def response_decoder(
+    name: str, struct: bool = False, exclude: Optional[Sequence[str]] = None
+) -> Optional[Callable[[bytes], Any]]:
+    """
+    The decoder of the named response, into its struct with struct, otherwise into dicts and lists skipping over the excluded fields.
+
+    Returns None when the body is to be decoded as is, without exclude or msgspec, and the excluded fields are then pruned once decoded.
+    """
+    if struct:
+        return struct_decoder(name, exclude)
+    if not exclude:
+        return None
+    try:
+        from .models.structs import builtins_decoder
+    except RuntimeError:
+        return None
+    return builtins_decoder(name, tuple(exclude))
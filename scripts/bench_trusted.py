@@ -0,0 +1,47 @@
+"""
+Time validating the block transactions response model against trusted construction.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pokt.rpc.data import get_block_transactions
+from pokt.rpc.models import QueryBlockTXsResponse
+from pokt.rpc.models.trusted import construct_trusted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--file", help="A block transactions response saved as JSON")
+    parser.add_argument("--url", help="The RPC url to request the block from")
+    parser.add_argument("--height", type=int, help="The height of the block")
+    parser.add_argument("--per-page", type=int, default=1000)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+    if args.file:
+        with open(args.file) as f:
+            data = json.load(f)
+    else:
+        data = get_block_transactions(
+            args.url, height=args.height, per_page=args.per_page, raw=True
+        )
+    assert construct_trusted(QueryBlockTXsResponse, data) == QueryBlockTXsResponse(
+        **data
+    )
+    validated = timeit.timeit(lambda: QueryBlockTXsResponse(**data), number=args.number)
+    trusted = timeit.timeit(
+        lambda: construct_trusted(QueryBlockTXsResponse, data), number=args.number
+    )
+    print("{} txs, {} runs".format(len(data.get("txs") or []), args.number))
+    print("validated: {:.2f} ms".format(validated / args.number * 1000))
+    print("trusted:   {:.2f} ms".format(trusted / args.number * 1000))
+    print("speedup:   {:.1f}x".format(validated / trusted))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
 #!/bin/sh
 
 datamodel-codegen --input "../spec/rpc-spec.yaml" --aliases "../spec/aliases.json" --output "../pokt/rpc/models/validation/_generated.py"
+
+python structs_build.py
@@ -0,0 +1,239 @@
+"""
+Generate the msgspec Structs of pokt/rpc/models/structs from the pydantic models.
+"""
+
+from datetime import datetime
+from enum import Enum
+import inspect
+import os
+import subprocess
+import sys
+import typing
+from typing import Any, Literal, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pokt.rpc.data as data
+from pokt.rpc.models.validation import _overrides
+
+OUTPUT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "pokt",
+    "rpc",
+    "models",
+    "structs",
+    "_generated.py",
+)
+
+HEADER = '''"""
+Generated by scripts/structs_build.py from the pydantic models, don't edit by hand.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Literal, Optional, Union
+
+import msgspec
+
+
+class _Struct(msgspec.Struct, gc=False):
+    pass
+'''
+
+
+class _Generator:
+    def __init__(self):
+        self.names: dict[type, str] = {}
+        self.blocks: list[str] = []
+        self.tags: dict[type, tuple[str, str, tuple]] = {}
+        self.aliases: dict[str, str] = {}
+
+    def _name(self, cls: type) -> str:
+        name = cls.__name__
+        taken = set(self.names.values())
+        while name in taken:
+            name += "_"
+        self.names[cls] = name
+        return name
+
+    def render(self, tp: Any) -> str:
+        if tp is None or tp is type(None):
+            return "None"
+        if tp is Any:
+            return "Any"
+        origin = get_origin(tp)
+        args = get_args(tp)
+        if origin is typing.Annotated:
+            discriminator = getattr(args[1], "discriminator", None)
+            if discriminator is None:
+                return self.render(args[0])
+            return self.tagged(get_args(args[0]), discriminator)
+        if origin is Union:
+            members = [a for a in args if a is not type(None)]
+            rendered = ", ".join(self.render(a) for a in members)
+            if len(members) < len(args):
+                if len(members) == 1:
+                    return "Optional[{}]".format(rendered)
+                return "Optional[Union[{}]]".format(rendered)
+            return "Union[{}]".format(rendered)
+        if origin is Literal:
+            return "Literal[{}]".format(", ".join(repr(a) for a in args))
+        if origin is list:
+            return "list[{}]".format(self.render(args[0]) if args else "Any")
+        if origin is dict:
+            if not args:
+                return "dict"
+            return "dict[{}, {}]".format(self.render(args[0]), self.render(args[1]))
+        if isinstance(tp, type):
+            if issubclass(tp, BaseModel):
+                return self.struct(tp)
+            if issubclass(tp, Enum):
+                return self.enum(tp)
+            if tp is datetime:
+                return "datetime"
+            for scalar in (bool, int, float, str, list, dict):
+                if issubclass(tp, scalar):
+                    return scalar.__name__
+        raise TypeError("Can't generate a struct type for {!r}".format(tp))
+
+    def tagged(self, members: tuple, discriminator: str) -> str:
+        names = []
+        for model in members:
+            field = model.__fields__[discriminator]
+            self.tags[model] = (field.alias, field.name, get_args(field.annotation))
+            name = self.struct(model)
+            tags = self.tags[model][2]
+            names.append(name)
+            names.extend("{}_{}".format(name, i) for i in range(1, len(tags)))
+        return "Union[{}]".format(", ".join(names))
+
+    def enum(self, cls: type) -> str:
+        if cls in self.names:
+            return self.names[cls]
+        name = self._name(cls)
+        bases = [b.__name__ for b in cls.__bases__ if b is not Enum] + ["Enum"]
+        lines = ["class {}({}):".format(name, ", ".join(bases))]
+        for member in cls:
+            lines.append("    {} = {!r}".format(member.name, member.value))
+        self.blocks.append("\n".join(lines))
+        return name
+
+    def default(self, field) -> str:
+        value = field.default
+        if value is None:
+            return "None"
+        if isinstance(value, Enum):
+            return "{}.{}".format(self.enum(type(value)), value.name)
+        if isinstance(value, (list, dict)):
+            return "msgspec.field(default_factory={})".format(type(value).__name__)
+        return repr(value)
+
+    def struct(self, model: type) -> str:
+        if model in self.names:
+            return self.names[model]
+        if model.__custom_root_type__:
+            name = self._name(model)
+            self.aliases[name] = self.render(model.__fields__["__root__"].annotation)
+            return name
+        name = self._name(model)
+        tag = self.tags.get(model)
+        # kw_only isn't inherited, and lets required fields follow optional ones as in the models.
+        options = ", kw_only=True"
+        if tag is not None:
+            options += ", tag_field={!r}, tag={!r}".format(tag[0], tag[2][0])
+        lines = ["class {}(_Struct{}):".format(name, options)]
+        for field in model.__fields__.values():
+            if tag is not None and field.name == tag[1]:
+                continue
+            if field.class_validators:
+                type_ = "Any"
+            elif field.discriminator_key is not None:
+                type_ = self.tagged(
+                    [a for a in get_args(field.annotation) if a is not type(None)],
+                    field.discriminator_key,
+                )
+                if field.allow_none:
+                    type_ = "Optional[{}]".format(type_)
+            else:
+                type_ = self.render(field.annotation)
+            default = None if field.required else self.default(field)
+            if field.alias != field.name:
+                if default is None:
+                    default = "msgspec.field(name={!r})".format(field.alias)
+                elif default.startswith("msgspec.field("):
+                    default = "msgspec.field(name={!r}, {}".format(
+                        field.alias, default[len("msgspec.field(") :]
+                    )
+                else:
+                    default = "msgspec.field(default={}, name={!r})".format(
+                        default, field.alias
+                    )
+            if default is None:
+                lines.append("    {}: {}".format(field.name, type_))
+            else:
+                lines.append("    {}: {} = {}".format(field.name, type_, default))
+        if tag is not None:
+            lines.append("")
+            lines.append("    @property")
+            lines.append("    def {}(self) -> str:".format(tag[1]))
+            lines.append("        return self.__struct_config__.tag")
+        if len(lines) == 1:
+            lines.append("    pass")
+        for i, extra in enumerate(tag[2][1:] if tag is not None else (), 1):
+            lines.append("")
+            lines.append("")
+            lines.append(
+                "class {0}_{1}({0}, tag={2!r}):\n    pass".format(name, i, extra)
+            )
+        self.blocks.append("\n".join(lines))
+        return name
+
+
+def _responses() -> dict[str, Any]:
+    responses = {}
+    namespace = vars(_overrides)
+    for name, func in sorted(vars(data).items()):
+        if not inspect.isfunction(func) or name.startswith("async_"):
+            continue
+        response = func.__annotations__.get("return")
+        if get_origin(response) is Union:
+            # Union[Model, dict, "structs.Model"], the struct being what's generated here.
+            response = get_args(response)[0]
+        if isinstance(response, type) and issubclass(response, BaseModel):
+            responses[response.__name__] = response
+        elif response is not None and not isinstance(response, type):
+            alias = next(n for n, v in namespace.items() if v is response)
+            responses[alias] = response
+    return responses
+
+
+def main():
+    generator = _Generator()
+    exports = []
+    for name, response in _responses().items():
+        if isinstance(response, type):
+            exports.append(generator.struct(response))
+        else:
+            generator.aliases[name] = generator.render(response)
+            exports.append(name)
+    source = [HEADER]
+    source.extend(generator.blocks)
+    source.extend(
+        "{} = {}".format(name, type_) for name, type_ in generator.aliases.items()
+    )
+    source.append(
+        "RESPONSES = {{\n{}\n}}".format(
+            "\n".join("    {0!r}: {0},".format(n) for n in sorted(set(exports)))
+        )
+    )
+    with open(OUTPUT, "w") as f:
+        f.write("\n\n\n".join(source) + "\n")
+    subprocess.run(["black", "-q", OUTPUT])
+
+
+if __name__ == "__main__":
+    main()
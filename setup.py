@@ -34,6 +34,7 @@ setup(
     ],
     extras_require={
         "dev": ["black", "datamodel-code-generator", "fastapi"],
+        "speedups": ["orjson>=3.8.0", "msgspec>=0.16.0"],
     },
     tests_require=["pytest", "python-dotenv"],
     entry_points={
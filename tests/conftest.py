@@ -1,5 +1,7 @@
+from http.server import BaseHTTPRequestHandler, HTTPServer
 import json
 import os
+import threading
 
 from dotenv import load_dotenv
 import requests
@@ -167,3 +169,37 @@ def passphrase():
     with open(passphrase_path, "r", encoding="utf-8") as f:
         passphrase = f.read().strip()
     return passphrase
+
+
+class _CannedHandler(BaseHTTPRequestHandler):
+    responses = {}
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = self.responses[self.path]
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def canned_node(request):
+    """
+    The url of a local node answering each route with its body in the CANNED_RESPONSES of the test module.
+    """
+    handler = type(
+        "Handler", (_CannedHandler,), {"responses": request.module.CANNED_RESPONSES}
+    )
+    server = HTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:{}".format(server.server_port)
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import os
+import queue
+import threading
+
+from pokt.index import async_ingest, ingest
+
+REFERENCE = os.path.join(os.path.dirname(__file__), "reference", "blocktxs.json")
+
+
+def test_async_ingest_block_range_in_order(monkeypatch):
+    with open(REFERENCE) as f:
+        reference = json.load(f)
+    written = []
+    pages = []
+
+    async def get_block(rpc_url, height=0, session=None, raw=False):
+        # Later blocks come back first.
+        await asyncio.sleep(0.001 * (20 - height))
+        header = {"height": height, "num_txs": 23 if height % 2 else 0}
+        return {"block": {"header": header}}
+
+    async def get_block_transactions(rpc_url, height=0, page=1, **kwargs):
+        pages.append((height, page))
+        if page == 1 and height % 2:
+            return reference
+        return {"txs": [], "total_count": 0}
+
+    def parquet_append(parquet_dir, table, start_block, end_block):
+        written.append((parquet_dir, table, start_block, end_block))
+
+    monkeypatch.setattr(async_ingest, "async_get_block", get_block)
+    monkeypatch.setattr(
+        async_ingest, "async_get_block_transactions", get_block_transactions
+    )
+    monkeypatch.setattr(ingest, "_parquet_append", parquet_append)
+    progress = queue.Queue()
+    asyncio.run(
+        async_ingest.async_ingest_block_range(
+            1,
+            10,
+            "http://127.0.0.1:1",
+            "headers",
+            "txs",
+            "msgs",
+            batch_size=4,
+            concurrency=3,
+            session=object(),
+            progress_queue=progress,
+        )
+    )
+    headers = [w for w in written if w[0] == "headers"]
+    assert [(start, end) for _, _, start, end in headers] == [(1, 4), (5, 8), (9, 10)]
+    heights = [h for _, table, _, _ in headers for h in table["height"].to_pylist()]
+    assert heights == list(range(1, 11))
+    txs = [table for d, table, _, _ in written if d == "txs"]
+    assert sum(table.num_rows for table in txs) == 5 * 23
+    # The pages come from each header's num_txs, so blocks without transactions request none.
+    assert sorted(pages) == [(h, 1) for h in range(1, 11, 2)]
+    assert sum(n for kind, n in progress.queue if kind == "block") == 10
+
+
+class _ThreadRecordingStore:
+    def __init__(self):
+        self.threads = []
+        self.data = {}
+
+    def _record(self):
+        self.threads.append(threading.get_ident())
+
+    def get_block(self, height):
+        self._record()
+        return self.data.get(height)
+
+    def put_block(self, height, data):
+        self._record()
+        self.data[height] = data
+
+    def get_block_transactions(self, height, page, per_page):
+        self._record()
+        return self.data.get((height, page))
+
+    def put_block_transactions(self, height, page, per_page, data):
+        self._record()
+        self.data[(height, page)] = data
+
+
+def test_async_ingest_block_keeps_blocking_work_off_the_loop(monkeypatch):
+    with open(REFERENCE) as f:
+        reference = json.load(f)
+    threads = []
+
+    async def get_block(rpc_url, height=0, session=None, raw=False):
+        return {"block": {"header": {"height": height, "num_txs": 23}}}
+
+    async def get_block_transactions(rpc_url, height=0, page=1, **kwargs):
+        return reference
+
+    def txs_to_tables(txs):
+        threads.append(threading.get_ident())
+        return ingest.txs_to_tables(txs)
+
+    monkeypatch.setattr(async_ingest, "async_get_block", get_block)
+    monkeypatch.setattr(
+        async_ingest, "async_get_block_transactions", get_block_transactions
+    )
+    monkeypatch.setattr(async_ingest, "txs_to_tables", txs_to_tables)
+    store = _ThreadRecordingStore()
+    txs_table, _, _ = asyncio.run(
+        async_ingest.async_ingest_block(
+            1, "http://127.0.0.1:1", session=object(), block_store=store
+        )
+    )
+    assert txs_table.num_rows == 23
+    assert len(store.threads) == 4 and len(threads) == 1
+    assert threading.get_ident() not in store.threads + threads
@@ -0,0 +1,49 @@
+import copy
+import json
+import os
+
+import pyarrow as pa
+
+from pokt.index.columnar import decode_txs
+from pokt.index.ingest import (
+    _msgs_to_tables,
+    _txs_to_table,
+    flatten_tx_messages,
+    txs_to_tables,
+)
+from pokt.index.schema import flatten_tx
+from pokt.rpc.models import QueryBlockTXsResponse
+
+REFERENCE = os.path.join(os.path.dirname(__file__), "reference", "blocktxs.json")
+
+
+def _reference():
+    with open(REFERENCE) as f:
+        data = json.load(f)
+    return data["txs"], QueryBlockTXsResponse(**data).txs
+
+
+def test_decode_txs_matches_models():
+    txs, models = _reference()
+    tx_batch, msg_batches = decode_txs(txs)
+    expected = _txs_to_table([flatten_tx(tx) for tx in models])
+    assert pa.Table.from_batches([tx_batch]).equals(expected)
+    expected_msgs = _msgs_to_tables(flatten_tx_messages(models))
+    for module, tables in expected_msgs.items():
+        for type_, table in tables.items():
+            batch = msg_batches[module][type_]
+            assert pa.Table.from_batches([batch]).equals(table)
+    assert sum(len(batches) for batches in msg_batches.values()) == sum(
+        len(tables) for tables in expected_msgs.values()
+    )
+
+
+def test_txs_to_tables_falls_back_to_models():
+    txs, _ = _reference()
+    txs = copy.deepcopy(txs)
+    # The models coerce the string, where the Arrow type doesn't.
+    txs[0]["tx_result"]["code"] = "0"
+    tx_table, msg_tables = txs_to_tables(txs)
+    assert tx_table.num_rows == len(txs)
+    assert tx_table.column("result_code")[0].as_py() == 0
+    assert msg_tables["pocketcore"]["proof"].num_rows == 14
@@ -0,0 +1,33 @@
+from pokt.index import ingest
+
+
+def _fake_pages(monkeypatch, total):
+    calls = []
+
+    def get_block_transactions(rpc_url, height=0, page=1, per_page=100, **kwargs):
+        calls.append(page)
+        txs = [{"hash": str(i)} for i in range(total)]
+        return {"txs": txs[(page - 1) * per_page : page * per_page]}
+
+    monkeypatch.setattr(ingest, "get_block_transactions", get_block_transactions)
+    return calls
+
+
+def test_ingest_tx_data_plans_pages(monkeypatch):
+    calls = _fake_pages(monkeypatch, 2500)
+    txs = ingest.ingest_tx_data_by_block(1, "http://127.0.0.1:1", num_txs=2500)
+    assert [tx["hash"] for tx in txs] == [str(i) for i in range(2500)]
+    assert sorted(calls) == [1, 2, 3]
+    calls.clear()
+    assert ingest.ingest_tx_data_by_block(1, "http://127.0.0.1:1", num_txs=0) == []
+    assert calls == []
+
+
+def test_ingest_tx_data_pages_past_the_header(monkeypatch):
+    calls = _fake_pages(monkeypatch, 2500)
+    # Without num_txs, or with too few, it pages until an empty page.
+    txs = ingest.ingest_tx_data_by_block(1, "http://127.0.0.1:1")
+    assert len(txs) == 2500 and calls == [1, 2, 3, 4]
+    calls.clear()
+    txs = ingest.ingest_tx_data_by_block(1, "http://127.0.0.1:1", num_txs=1000)
+    assert len(txs) == 2500 and calls == [1, 2, 3, 4]
@@ -0,0 +1,71 @@
+from pokt.index import ingest
+from pokt.index.main import gap_bounds, missing_ranges
+from pokt.index.manifest import (
+    HEADERS,
+    MSGS,
+    TXS,
+    RangeManifest,
+    file_ranges,
+    range_gaps,
+)
+from pokt.index.schema import block_header_schema
+
+
+def test_range_gaps():
+    ranges = [(5, 9), (1, 2), (3, 4), (20, 30)]
+    assert range_gaps(ranges, 1, 25) == [(10, 19)]
+    assert range_gaps(ranges, 0, 40) == [(0, 0), (10, 19), (31, 40)]
+    assert range_gaps([], 3, 7) == [(3, 7)]
+    assert gap_bounds([(10, 19), (31, 31)], 4) == [
+        (10, 13, 4),
+        (14, 17, 4),
+        (18, 19, 4),
+        (31, 31, 4),
+    ]
+
+
+def test_manifest_missing(tmp_path, monkeypatch):
+    path = str(tmp_path / "manifest.sqlite")
+    monkeypatch.setattr(ingest, "_parquet_append", lambda *args: None)
+    with RangeManifest(path) as manifest:
+        group = ingest._BlockGroup(1)
+        for height in range(1, 5):
+            header = {name: None for name in block_header_schema.names}
+            group.add(ingest.txs_to_tables([])[0], dict(header, height=height), {})
+        group.write("headers", "txs", "msgs", 4, manifest=manifest)
+        # A chunk that only got as far as its headers.
+        manifest.add(HEADERS, 5, 8)
+        manifest.add(HEADERS, 9, 12)
+        manifest.add(TXS, 9, 12)
+        manifest.add(MSGS, 9, 12)
+    with RangeManifest(path) as manifest:
+        assert manifest.ranges(HEADERS) == [(1, 12)]
+        assert manifest.ranges(TXS) == [(1, 4), (9, 12)]
+        assert manifest.missing(1, 15) == [(5, 8), (13, 15)]
+
+
+def test_missing_ranges_seeds_from_existing_files(tmp_path):
+    headers = tmp_path / "headers"
+    txs = tmp_path / "txs"
+    headers.mkdir()
+    txs.mkdir()
+    # Written before the manifest, each group named by the first block of the next.
+    for name in ("block_1-6.parquet", "block_6-10.parquet", "block_21-30.parquet"):
+        (headers / name).touch()
+        (txs / name).touch()
+    (headers / "block_11-15.parquet").touch()
+    manifest = str(tmp_path / "manifest.sqlite")
+    assert file_ranges(str(headers)) == [(1, 15), (21, 30)]
+    assert missing_ranges(manifest, 1, 40, str(headers), str(txs)) == [
+        (11, 20),
+        (31, 40),
+    ]
+    with RangeManifest(manifest) as m:
+        assert m.ranges(HEADERS) == [(1, 15), (21, 30)]
+        assert m.ranges(MSGS) == [(1, 10), (21, 30)]
+        m.add(HEADERS, 11, 20)
+        m.add(TXS, 11, 20)
+        m.add(MSGS, 11, 20)
+    # Seeded once, from then on the manifest is kept as the blocks are written.
+    (txs / "block_31-40.parquet").touch()
+    assert missing_ranges(manifest, 1, 40, str(headers), str(txs)) == [(31, 40)]
@@ -0,0 +1,102 @@
+import json
+import os
+import random
+import time
+
+import pytest
+
+from pokt.index import ingest, pipeline
+from pokt.index.pipeline import Pipeline, pipeline_ingest_block_range
+
+REFERENCE = os.path.join(os.path.dirname(__file__), "reference", "blocktxs.json")
+
+
+def test_pipeline_stages():
+    seen = []
+
+    def double(item, emit):
+        time.sleep(random.random() / 1000)
+        emit(item * 2)
+
+    def collect(item, emit):
+        seen.append(item)
+
+    pipeline = Pipeline().stage("double", double, 4).stage("collect", collect)
+    stats = pipeline.run(range(50))
+    assert sorted(seen) == [2 * i for i in range(50)]
+    assert stats["double"].items == stats["collect"].items == 50
+    assert stats["double"].max_depth <= 8 and stats["double"].throughput > 0
+
+
+def test_pipeline_raises_stage_errors():
+    def fail(item, emit):
+        if item == 7:
+            raise ValueError("bad item")
+        emit(item)
+
+    pipeline = Pipeline().stage("fail", fail, 2).stage("drop", lambda item, emit: 0)
+    with pytest.raises(ValueError, match="bad item"):
+        pipeline.run(range(1000))
+
+
+def _fake_rpc(monkeypatch):
+    with open(REFERENCE) as f:
+        reference = json.load(f)
+    written = []
+
+    def get_block(rpc_url, height=0, session=None, raw=False):
+        # Blocks come back out of order.
+        time.sleep(random.random() / 500)
+        header = {"height": height, "num_txs": 23 if height % 3 else 0}
+        return {"block": {"header": header}}
+
+    def get_block_transactions(rpc_url, height=0, page=1, **kwargs):
+        return reference
+
+    def parquet_append(parquet_dir, table, start_block, end_block):
+        written.append((parquet_dir, start_block, end_block, table.num_rows))
+
+    monkeypatch.setattr(ingest, "get_block", get_block)
+    monkeypatch.setattr(ingest, "get_block_transactions", get_block_transactions)
+    monkeypatch.setattr(ingest, "_parquet_append", parquet_append)
+    return written
+
+
+def test_pipeline_ingest_matches_ingest_block_range(monkeypatch):
+    written = _fake_rpc(monkeypatch)
+    dirs = ("headers", "txs", "msgs")
+    ingest.ingest_block_range(1, 23, "http://127.0.0.1:1", *dirs, batch_size=5)
+    expected = sorted(written)
+    written.clear()
+    stats = pipeline_ingest_block_range(
+        1, 23, "http://127.0.0.1:1", *dirs, batch_size=5, fetch_workers=6, window=8
+    )
+    assert sorted(written) == expected
+    assert [s.items for s in stats.values()] == [23, 23, 5, 5]
+
+
+def test_group_files_are_named_by_inclusive_ranges(monkeypatch):
+    written = _fake_rpc(monkeypatch)
+    dirs = ("headers", "txs", "msgs")
+    names = [(1, 5), (6, 10), (11, 15), (16, 20), (21, 23)]
+    ingest.ingest_block_range(1, 23, "http://127.0.0.1:1", *dirs, batch_size=5)
+    assert [(start, end) for d, start, end, _ in written if d == "headers"] == names
+    written.clear()
+    pipeline_ingest_block_range(1, 23, "http://127.0.0.1:1", *dirs, batch_size=5)
+    headers = sorted((start, end) for d, start, end, _ in written if d == "headers")
+    assert headers == names
+
+
+def test_pipeline_session_fits_the_fetches(monkeypatch):
+    _fake_rpc(monkeypatch)
+    sizes = []
+
+    def make_session(**kwargs):
+        sizes.append(kwargs.get("pool_maxsize"))
+        return object()
+
+    monkeypatch.setattr(pipeline, "make_session", make_session)
+    pipeline_ingest_block_range(
+        1, 3, "http://127.0.0.1:1", "headers", "txs", "msgs", fetch_workers=6
+    )
+    assert sizes == [6 * ingest.MAX_PAGE_WORKERS]
@@ -0,0 +1,21 @@
+from pokt.index.main import gap_bounds
+from pokt.index.schedule import batch_cost, sample_heights, weighted_bounds
+
+
+def test_weighted_bounds():
+    batches = gap_bounds([(1, 80), (101, 120)], 10)
+    heights = sample_heights(batches)
+    assert heights == [0, 10, 20, 30, 40, 50, 60, 70, 80, 100, 110, 120]
+    # The transactions pile up late in the chain.
+    txs_per_block = {h: 0 if h <= 60 else 100 for h in range(1, 121)}
+    total_txs = {0: 0}
+    for h in range(1, 121):
+        total_txs[h] = total_txs[h - 1] + txs_per_block[h]
+    units = weighted_bounds(batches, total_txs, 8, block_cost=10)
+    # Every block is covered once, without units crossing the gap.
+    blocks = sorted(h for start, end, _ in units for h in range(start, end + 1))
+    assert blocks == list(range(1, 81)) + list(range(101, 121))
+    costs = [batch_cost(unit, total_txs, 10) for unit in units]
+    assert costs == sorted(costs, reverse=True)
+    # The heavy late batches are units of their own, the light early ones are merged.
+    assert (1, 60, 10) in units and (101, 110, 10) in units
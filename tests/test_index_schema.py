@@ -0,0 +1,29 @@
+import json
+import os
+
+from pokt.index.ingest import _msgs_to_tables, flatten_tx_messages
+from pokt.index.schema import MSG_TABLES, flatten_tx_message, schema_for_msg
+from pokt.rpc.models import MSG_TYPES, QueryBlockTXsResponse
+
+REFERENCE = os.path.join(os.path.dirname(__file__), "reference", "blocktxs.json")
+
+
+def test_every_msg_type_has_a_table():
+    assert set(MSG_TABLES) == set(MSG_TYPES)
+    for module, type_, _, schema in MSG_TABLES.values():
+        assert schema_for_msg(module, type_) is schema
+
+
+def test_flatten_tx_messages():
+    with open(REFERENCE) as f:
+        txs = QueryBlockTXsResponse(**json.load(f)).txs
+    record, module, type_ = flatten_tx_message(txs[0])
+    assert (module, type_) == ("pocketcore", "proof")
+    assert record["request_hash"] == txs[0].stdTx.msg.value.leaf.value.request_hash
+    # The 8.0 aliases land in the same table as the messages they alias.
+    assert flatten_tx_message(txs[19])[1:] == ("pos", "MsgStake")
+    tables = _msgs_to_tables(flatten_tx_messages(txs))
+    assert tables["pocketcore"]["proof"].num_rows == 14
+    assert tables["pocketcore"]["claim"].num_rows == 4
+    assert tables["pos"]["MsgStake"].num_rows == 1
+    assert tables["pos"]["MsgUnjail"].num_rows == 1
@@ -0,0 +1,25 @@
+from pokt.index.store import BlockStore
+
+
+def test_block_store_round_trips_responses(tmp_path):
+    path = str(tmp_path / "blocks.sqlite")
+    block = {"block": {"header": {"height": "10", "num_txs": "2"}}}
+    page = {"txs": [{"hash": "ab", "height": 10}], "total_txs": 2}
+    with BlockStore(path) as store:
+        store.put_block(10, block)
+        store.put_block_transactions(10, 1, 1000, page)
+        assert store.get_block(11) is None
+        assert store.get_block_transactions(10, 2, 1000) is None
+    with BlockStore(path) as store:
+        assert store.get_block(10) == block
+        assert store.get_block_transactions(10, 1, 1000) == page
+
+
+def test_block_store_deduplicates_identical_content(tmp_path):
+    empty = {"txs": [], "total_txs": 0}
+    with BlockStore(str(tmp_path / "blocks.sqlite")) as store:
+        for height in range(1, 101):
+            store.put_block_transactions(height, 1, 1000, empty)
+        blobs = store._con.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+        assert blobs == 1
+        assert store.get_block_transactions(50, 1, 1000) == empty
@@ -0,0 +1,50 @@
+import time
+
+import pytest
+import requests
+
+from pokt.rpc import PoktRPCError
+from pokt.rpc.balancer import EndpointPool
+from pokt.rpc.retry import RetryPolicy
+
+
+def test_routes_to_the_fastest_endpoint():
+    pool = EndpointPool(["http://a", "http://b"])
+    for url, latency in (("http://a", 0.5), ("http://b", 0.05)):
+        endpoint = next(e for e in pool.endpoints if e.url == url)
+        endpoint.in_flight += 1
+        pool.release(endpoint, latency, False)
+    chosen = [pool.call(lambda url: url) for _ in range(5)]
+    assert set(chosen) == {"http://b"}
+
+
+def test_failing_endpoint_is_ejected_and_reprobed():
+    pool = EndpointPool(["http://down", "http://up"], eject_after=2, eject_for=0.1)
+    down = pool.endpoints[0]
+
+    def fetch(url):
+        if url == "http://down":
+            raise requests.ConnectionError(url)
+        return url
+
+    policy = RetryPolicy(max_attempts=3, backoff_base=0)
+    for _ in range(4):
+        assert policy.call(pool.call, fetch) == "http://up"
+    assert down.ejected_until is not None
+    assert [e.url for e in pool.healthy()] == ["http://up"]
+
+    time.sleep(0.15)
+    assert pool.call(lambda url: url) == "http://down"
+    assert pool.healthy() == pool.endpoints
+
+
+def test_pokt_errors_do_not_count_against_the_endpoint():
+    pool = EndpointPool(["http://a"], eject_after=1)
+
+    def fetch(url):
+        raise PoktRPCError(1, "invalid address")
+
+    with pytest.raises(PoktRPCError):
+        pool.call(fetch)
+    assert pool.endpoints[0].ejected_until is None
+    assert pool.endpoints[0].in_flight == 0
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+import time
+
+from pokt import AsyncPoktRPCDataProvider, PoktRPCDataProvider
+from pokt.rpc import PoktRPCError
+from pokt.rpc.batch import arun_batch, run_batch
+
+
+def test_run_batch_keeps_errors_apart():
+    lock = threading.Lock()
+    in_flight = [0]
+    most = [0]
+
+    def fn(height):
+        with lock:
+            in_flight[0] += 1
+            most[0] = max(most[0], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        if height == 3:
+            raise PoktRPCError(400, "invalid height")
+        return height * 2
+
+    result = run_batch(fn, {h: {"height": h} for h in range(10)}, concurrency=4)
+    assert list(result.results) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert result.results[9] == 18
+    assert isinstance(result.errors[3], PoktRPCError)
+    assert not result.ok and most[0] == 4
+
+
+def test_arun_batch():
+    in_flight = [0]
+    most = [0]
+
+    async def fn(address):
+        in_flight[0] += 1
+        most[0] = max(most[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return address.upper()
+
+    calls = {a: {"address": a} for a in "abcdef"}
+    result = asyncio.run(arun_batch(fn, calls, concurrency=2))
+    assert result.results == {a: a.upper() for a in "abcdef"}
+    assert result.ok and most[0] == 2
+
+
+def test_provider_batches():
+    rpc = PoktRPCDataProvider("http://127.0.0.1:1")
+    rpc.get_balance = lambda address, height, **kwargs: (address, height)
+    result = rpc.get_balances(["a", "b"], height=5)
+    assert result.results == {"a": ("a", 5), "b": ("b", 5)}
+
+    async def get_supply(height, **kwargs):
+        return height
+
+    async_rpc = AsyncPoktRPCDataProvider("http://127.0.0.1:1")
+    async_rpc.get_supply = get_supply
+    result = asyncio.run(async_rpc.get_supply_at([1, 2, 3]))
+    assert result.results == {1: 1, 2: 2, 3: 3}
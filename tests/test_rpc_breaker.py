@@ -0,0 +1,86 @@
+import time
+
+import pytest
+import requests
+
+from pokt.rpc import CircuitOpenError, PoktHTTPError, PoktRPCError, PortalRPCError
+from pokt.rpc.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreakers
+
+ROUTE = "https://mainnet.gateway.pokt.network/v1/lb/abc/v1/query/block"
+
+
+def fail(breakers, error):
+    with pytest.raises(type(error)):
+        with breakers.guard(ROUTE):
+            raise error
+
+
+def test_run_of_failures_opens_the_circuit():
+    breakers = CircuitBreakers(failure_threshold=3, reset_timeout=60)
+    for _ in range(3):
+        fail(breakers, PortalRPCError(503, "unavailable"))
+    breaker = breakers.breaker("https://mainnet.gateway.pokt.network/v1/lb/abc")
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        with breakers.guard(ROUTE.replace("block", "height")):
+            pass
+    assert breaker.rejected == 1
+
+
+def test_half_open_trial_closes_or_reopens_the_circuit():
+    breakers = CircuitBreakers(failure_threshold=1, reset_timeout=0.05)
+    fail(breakers, PortalRPCError(503, "unavailable"))
+    breaker = breakers.breaker(breakers.endpoint_for(ROUTE))
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+    fail(breakers, PortalRPCError(503, "unavailable"))
+    assert breaker.state == OPEN
+
+    time.sleep(0.06)
+    with breakers.guard(ROUTE):
+        pass
+    assert breaker.state == CLOSED
+
+
+def test_pokt_errors_do_not_open_the_circuit():
+    breakers = CircuitBreakers(failure_threshold=1)
+    fail(breakers, PoktRPCError(1, "invalid address"))
+    assert breakers.breaker(breakers.endpoint_for(ROUTE)).state == CLOSED
+
+
+def test_only_endpoint_failures_open_the_circuit():
+    breakers = CircuitBreakers(failure_threshold=1)
+    breaker = breakers.breaker(breakers.endpoint_for(ROUTE))
+    for error in (
+        PortalRPCError(404, "height not found"),
+        PoktHTTPError(400, "bad request"),
+        PoktHTTPError(429, "too many requests"),
+        PoktHTTPError(200, "not json"),
+        ValueError("undecodable body"),
+    ):
+        fail(breakers, error)
+        assert breaker.state == CLOSED
+    fail(breakers, requests.ConnectionError("refused"))
+    assert breaker.state == OPEN
+
+
+def test_server_errors_open_the_circuit():
+    breakers = CircuitBreakers(failure_threshold=1)
+    fail(breakers, PoktHTTPError(502, "bad gateway"))
+    assert breakers.breaker(breakers.endpoint_for(ROUTE)).state == OPEN
+
+
+def test_breaker_imports_without_aiohttp(monkeypatch):
+    import importlib.util
+    import sys
+
+    import pokt.rpc.breaker
+
+    monkeypatch.setitem(sys.modules, "aiohttp", None)
+    spec = importlib.util.spec_from_file_location(
+        "pokt.rpc._breaker_without_aiohttp", pokt.rpc.breaker.__file__
+    )
+    breaker = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(breaker)
+    assert breaker._is_breaker_failure(requests.ConnectionError())
+    assert not breaker._is_breaker_failure(ValueError())
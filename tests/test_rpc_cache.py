@@ -0,0 +1,97 @@
+import pytest
+
+from pokt.rpc.cache import (
+    CacheBackend,
+    MemoryCache,
+    ResponseCache,
+    SQLiteCache,
+    TieredCache,
+)
+from pokt.rpc.data import get_block, get_height
+
+
+class _Upstream:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, rpc_method, *args, **kwargs):
+        self.calls.append((rpc_method.__name__, args, kwargs))
+        return {"method": rpc_method.__name__, "args": args, "kwargs": kwargs}
+
+
+def test_height_pinned_queries_are_cached():
+    upstream = _Upstream()
+    cache = ResponseCache()
+    first = cache.call(upstream, get_block, 1000)
+    second = cache.call(upstream, get_block, height=1000)
+    assert first == second
+    assert first is not second
+    assert len(upstream.calls) == 1
+    assert cache.hits == 1
+
+
+def test_latest_queries_bypass_cache_by_default():
+    upstream = _Upstream()
+    cache = ResponseCache()
+    cache.call(upstream, get_block)
+    cache.call(upstream, get_block, 0)
+    cache.call(upstream, get_height)
+    assert len(upstream.calls) == 3
+
+
+def test_latest_queries_use_latest_ttl():
+    upstream = _Upstream()
+    cache = ResponseCache(latest_ttl=60)
+    cache.call(upstream, get_height)
+    cache.call(upstream, get_height)
+    assert len(upstream.calls) == 1
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_bytes=10)
+    cache.set("a", b"aaaa")
+    cache.set("b", b"bbbb")
+    assert cache.get("a") == b"aaaa"
+    cache.set("c", b"cccc")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.size == 8
+
+
+def test_memory_cache_expires_entries():
+    cache = MemoryCache()
+    cache.set("a", b"aaaa", ttl=-1)
+    assert cache.get("a") is None
+
+
+def test_tiered_cache_persists_and_backfills(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    disk = SQLiteCache(path)
+    tiered = TieredCache(MemoryCache(), disk)
+    tiered.set("pinned", b"forever")
+    tiered.set("latest", b"briefly", ttl=60)
+    assert disk.get("latest") is None
+    disk.close()
+
+    memory = MemoryCache()
+    reopened = TieredCache(memory, SQLiteCache(path))
+    assert reopened.get("pinned") == b"forever"
+    assert memory.get("pinned") == b"forever"
+
+
+def test_sqlite_cache_deletes_expired_entries(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"), purge_interval=0)
+    cache.set("a", b"a", ttl=-1)
+    assert cache.get("a") is None
+    assert cache._con.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 0
+    cache.set("b", b"b", ttl=-1)
+    # Setting any entry purges the expired ones once purge_interval has passed.
+    cache.set("c", b"c")
+    keys = [row[0] for row in cache._con.execute("SELECT key FROM responses")]
+    assert keys == ["c"]
+    cache.close()
+
+
+def test_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from pokt.rpc.data import get_block
+from pokt.rpc.hedge import HedgePolicy
+from pokt.rpc.retry import RetryBudget
+
+
+def test_slow_request_is_hedged_and_first_success_wins():
+    policy = HedgePolicy(initial_delay=0.05)
+    delays = [1.0, 0.01]
+    started = []
+
+    async def upstream(rpc_method, *args, **kwargs):
+        delay = delays[len(started)]
+        started.append(delay)
+        await asyncio.sleep(delay)
+        return delay
+
+    async def run():
+        return await asyncio.wait_for(policy.call_async(upstream, get_block, 1), 0.5)
+
+    assert asyncio.run(run()) == 0.01
+    assert started == [1.0, 0.01]
+    assert policy.hedged == 1
+    assert policy.hedge_wins == 1
+
+
+def test_hedges_are_capped_by_the_budget():
+    policy = HedgePolicy(initial_delay=0.01, budget=RetryBudget(0, 0, 0))
+    calls = []
+
+    async def upstream(rpc_method, *args, **kwargs):
+        calls.append(args)
+        await asyncio.sleep(0.05)
+        return "block"
+
+    assert asyncio.run(policy.call_async(upstream, get_block, 1)) == "block"
+    assert len(calls) == 1
+    assert policy.hedged == 0
+
+
+def test_error_is_raised_when_every_copy_fails():
+    policy = HedgePolicy(initial_delay=0.01, min_delay=0)
+
+    async def upstream(rpc_method, *args, **kwargs):
+        await asyncio.sleep(0.02)
+        raise ValueError("down")
+
+    with pytest.raises(ValueError):
+        asyncio.run(policy.call_async(upstream, get_block, 1))
+    assert policy.hedged == 1
+
+
+def test_delay_follows_the_latency_percentile():
+    policy = HedgePolicy(percentile=90, min_samples=10, min_delay=0)
+    for i in range(1, 11):
+        policy._record("get_block", i / 10)
+    assert policy.delay("get_block") == pytest.approx(0.9)
+    assert policy.delay("get_height") == policy.initial_delay
@@ -0,0 +1,73 @@
+import json
+import os
+
+import pytest
+
+from pokt.rpc import PoktHTTPError, PoktRPCError, jsonlib
+from pokt.rpc.jsonlib import (
+    available_json_backends,
+    dumps,
+    get_json_backend,
+    loads,
+    set_json_backend,
+)
+from pokt.rpc.utils import _read_get_body, _read_post_body
+
+REFERENCE = os.path.join(os.path.dirname(__file__), "reference", "blocktxs.json")
+
+
+@pytest.fixture(params=available_json_backends())
+def backend(request):
+    previous = get_json_backend()
+    set_json_backend(request.param)
+    yield request.param
+    set_json_backend(previous)
+
+
+def test_backends_decode_the_same(backend):
+    body = (
+        b'{"height": 10, "amount": 123456789012345678901234567890, "memo": "\xc3\xa9"}'
+    )
+    assert loads(body) == {
+        "height": 10,
+        "amount": 123456789012345678901234567890,
+        "memo": "é",
+    }
+    assert loads(dumps({"height": 10})) == {"height": 10}
+
+
+def test_malformed_body_raises_value_error(backend):
+    with pytest.raises(ValueError):
+        loads(b"<html>Bad Gateway</html>")
+    with pytest.raises(PoktHTTPError):
+        _read_post_body(502, b"<html>Bad Gateway</html>")
+
+
+def test_bodies_are_checked_for_errors(backend):
+    assert _read_get_body(200, b"RC-0.9.2") == "RC-0.9.2"
+    with pytest.raises(PoktRPCError):
+        _read_post_body(200, b'{"code": 1, "message": "invalid address"}')
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        set_json_backend("simplejson")
+
+
+def test_reference_page_decodes_with_the_fast_backend(backend, monkeypatch):
+    with open(REFERENCE, "rb") as f:
+        body = f.read()
+    expected = json.loads(body)
+    if backend != "json":
+        # The page, negative 19 digit entropies and all, never falls back to the standard library.
+        def fallback(data):
+            raise AssertionError("fell back to json.loads")
+
+        monkeypatch.setattr(jsonlib.json, "loads", fallback)
+    assert loads(body) == expected
+
+
+def test_wide_ints_fall_back_exactly(backend):
+    body = b'{"a": [18446744073709551616, -9223372036854775809, 1.5]}'
+    assert loads(body) == {"a": [18446744073709551616, -9223372036854775809, 1.5]}
+    assert loads(b"-9223372036854775809") == -9223372036854775809
@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import time
+
+from pokt.rpc.data import get_account_transactions, get_height, get_nodes
+from pokt.rpc.data.async_network import async_get_height
+from pokt.rpc.data.async_service import async_get_nodes
+from pokt.rpc.pagination import aiter_items, iter_items, iter_pages
+
+
+def test_iter_items_prefetches_in_order():
+    lock = threading.Lock()
+    in_flight = []
+    most = []
+
+    def call(rpc_method, **kwargs):
+        if rpc_method is get_height:
+            return {"height": 70000}
+        with lock:
+            in_flight.append(kwargs["page"])
+            most.append(len(in_flight))
+        # Later pages come back first.
+        time.sleep(0.01 * (10 - kwargs["page"]))
+        with lock:
+            in_flight.remove(kwargs["page"])
+        return {
+            "result": [kwargs["page"] * 10 + i for i in range(2)],
+            "page": kwargs["page"],
+            "total_pages": 7,
+        }
+
+    items = list(iter_items(call, get_nodes, per_page=2, prefetch=3))
+    assert items == [page * 10 + i for page in range(1, 8) for i in range(2)]
+    assert max(most) == 3
+
+
+def test_iter_pages_from_total_count():
+    pages = []
+
+    def call(rpc_method, **kwargs):
+        pages.append(kwargs["page"])
+        return {"txs": [], "total_count": "250"}
+
+    assert (
+        len(list(iter_pages(call, get_account_transactions, "abc", per_page=100))) == 3
+    )
+    assert sorted(pages) == [1, 2, 3]
+
+
+def test_aiter_items():
+    async def call(rpc_method, **kwargs):
+        if rpc_method is async_get_height:
+            return {"height": 70000}
+        await asyncio.sleep(0.01 * (5 - kwargs["page"]))
+        return {"result": [kwargs["page"]], "page": kwargs["page"], "total_pages": 4}
+
+    async def run():
+        return [item async for item in aiter_items(call, async_get_nodes, page=2)]
+
+    assert asyncio.run(run()) == [2, 3, 4]
+
+
+def test_iter_items_pins_the_height():
+    latest = [100]
+    heights = []
+
+    def call(rpc_method, **kwargs):
+        # A block is made between every request.
+        latest[0] += 1
+        if rpc_method is get_height:
+            return {"height": latest[0]}
+        height = kwargs["height"] or latest[0]
+        heights.append(height)
+        # Every block adds a node to the front of the list.
+        nodes = list(range(height, 0, -1))
+        page = kwargs["page"]
+        return {
+            "result": nodes[(page - 1) * 10 : page * 10],
+            "total_pages": -(-len(nodes) // 10),
+        }
+
+    nodes = list(iter_items(call, get_nodes, per_page=10))
+    assert nodes == list(range(101, 0, -1))
+    assert set(heights) == {101}
+    assert list(iter_items(call, get_nodes, per_page=10, height=50)) == list(
+        range(50, 0, -1)
+    )
+
+
+def test_aiter_items_pins_the_height():
+    async def call(rpc_method, **kwargs):
+        if rpc_method is async_get_height:
+            return {"height": 3}
+        assert kwargs["height"] == 3
+        return {"result": [kwargs["page"]], "total_pages": 2}
+
+    async def run():
+        return [item async for item in aiter_items(call, async_get_nodes)]
+
+    assert asyncio.run(run()) == [1, 2]
@@ -0,0 +1,61 @@
+import json
+import os
+import pickle
+
+import pytest
+
+from pokt.rpc.data import get_block_transactions
+from pokt.rpc.models.projection import exclusion_tree, prune, tx_exclude
+
+REFERENCE = os.path.join(os.path.dirname(__file__), "reference", "blocktxs.json")
+with open(REFERENCE, "rb") as f:
+    CANNED_RESPONSES = {"/v1/query/blocktxs": f.read()}
+
+
+def test_prune():
+    assert exclusion_tree(("a.b", "a.c.d", "e", "e.f")) == {
+        "a": {"b": None, "c": {"d": None}},
+        "e": None,
+    }
+    data = {"a": [{"b": 1, "c": {"d": 2, "g": 3}}, {"b": 4}], "e": 5, "h": 6}
+    assert prune(data, ("a.b", "a.c.d", "e")) == {"a": [{"c": {"g": 3}}, {}], "h": 6}
+
+
+def test_exclude_from_models(canned_node):
+    page = get_block_transactions(canned_node, exclude=tx_exclude("txs"))
+    full = get_block_transactions(canned_node)
+    assert len(page.txs) == len(full.txs)
+    for tx, full_tx in zip(page.txs, full.txs):
+        assert tx.tx is None and tx.proof is None
+        assert tx.tx_result.log is None and tx.tx_result.events is None
+        assert tx.tx_result.signer == full_tx.tx_result.signer
+        assert tx.stdTx == full_tx.stdTx
+
+
+def test_exclude_from_structs(canned_node):
+    pytest.importorskip("msgspec")
+    page = get_block_transactions(canned_node, struct=True, exclude=tx_exclude("txs"))
+    full = get_block_transactions(canned_node, struct=True)
+    tx = page.txs[0]
+    assert not hasattr(tx, "proof") and not hasattr(tx.tx_result, "log")
+    assert tx.stdTx == full.txs[0].stdTx
+    assert tx.stdTx.msg.type_ == "pocketcore/proof"
+    # Projected structs are made on the fly, but still pickle, as for the response cache.
+    assert pickle.loads(pickle.dumps(page)) == page
+
+
+def test_exclude_from_dicts(canned_node, monkeypatch):
+    structs = pytest.importorskip("pokt.rpc.models.structs")
+    body = CANNED_RESPONSES["/v1/query/blocktxs"]
+    exclude = tx_exclude("txs")
+    page = get_block_transactions(canned_node, raw=True, exclude=exclude)
+    assert page == prune(json.loads(body), exclude)
+    # The payloads are skipped over while decoding, rather than pruned once built.
+    monkeypatch.setattr(structs, "prune", lambda data, exclude: data)
+    tx = structs.builtins_decoder("QueryBlockTXsResponse", exclude)(body)["txs"][0]
+    assert "proof" not in tx and "log" not in tx["tx_result"]
+    monkeypatch.undo()
+    # What's under the tagged union of the messages is pruned once decoded.
+    exclude = ("txs.stdTx.msg.value.leaf",)
+    decode = structs.builtins_decoder("QueryBlockTXsResponse", exclude)
+    assert decode(body) == prune(json.loads(body), exclude)
@@ -0,0 +1,42 @@
+import asyncio
+from multiprocessing import Pool
+import time
+
+from pokt.rpc.ratelimit import RateLimiter, get_rate_limiter, set_rate_limiter
+
+
+def _timed_requests(n):
+    limiter = get_rate_limiter()
+    stamps = []
+    for _ in range(n):
+        with limiter.limit():
+            stamps.append(time.monotonic())
+    return stamps
+
+
+def test_rate_is_shared_across_pool_workers():
+    limiter = RateLimiter(50, burst=1)
+    with Pool(4, initializer=set_rate_limiter, initargs=(limiter,)) as pool:
+        results = pool.map(_timed_requests, [10] * 4)
+    stamps = sorted(s for r in results for s in r)
+    # 40 requests at 50 a second, less the single request of burst, take at least 0.78s.
+    assert stamps[-1] - stamps[0] >= 0.75
+
+
+def test_concurrency_limit():
+    limiter = RateLimiter(None, max_concurrency=2)
+    in_flight = []
+    peak = []
+
+    async def request():
+        async with limiter.limit_async():
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+
+    async def run():
+        await asyncio.gather(*(request() for _ in range(10)))
+
+    asyncio.run(run())
+    assert max(peak) == 2
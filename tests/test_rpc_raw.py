@@ -0,0 +1,38 @@
+import pytest
+
+from pokt import PoktRPCDataProvider
+from pokt.rpc.data import get_height, get_supply
+from pokt.rpc.models import QuerySupplyResponse
+
+CANNED_RESPONSES = {
+    "/v1/query/height": {"height": 70000},
+    "/v1/query/supply": {
+        "app_staked": "100",
+        "dao": "200",
+        "node_staked": "300",
+        "total": "600",
+        "total_staked": "400",
+        "total_unstaked": "200",
+    },
+}
+
+
+def test_raw_returns_the_decoded_response(canned_node):
+    assert get_supply(canned_node, raw=True) == CANNED_RESPONSES["/v1/query/supply"]
+    assert isinstance(get_supply(canned_node), QuerySupplyResponse)
+
+
+def test_provider_raw(canned_node):
+    with PoktRPCDataProvider(canned_node) as rpc:
+        assert rpc.get_height() == 70000
+        assert rpc.get_height(raw=True) == {"height": 70000}
+        assert rpc.get_supply(raw=True)["total"] == "600"
+    assert get_height(canned_node, raw=True) == {"height": 70000}
+
+
+def test_struct_decodes_into_the_struct(canned_node):
+    structs = pytest.importorskip("pokt.rpc.models.structs")
+    supply = get_supply(canned_node, struct=True)
+    assert isinstance(supply, structs.QuerySupplyResponse)
+    assert supply.total == get_supply(canned_node).total == 600
+    assert get_height(canned_node, struct=True).height == 70000
@@ -0,0 +1,70 @@
+import pytest
+
+from pokt.rpc import (
+    PoktHTTPError,
+    PoktRPCError,
+    PortalRPCError,
+    RetryBudget,
+    RetryPolicy,
+)
+
+
+def _flaky(failures):
+    calls = []
+
+    def fn(value):
+        calls.append(value)
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return value
+
+    return fn, calls
+
+
+def test_retries_transient_errors_until_success():
+    fn, calls = _flaky([PoktHTTPError(502, "Bad Gateway"), PortalRPCError(504, "")])
+    policy = RetryPolicy(backoff_base=0)
+    assert policy.call(fn, "ok") == "ok"
+    assert len(calls) == 3
+
+
+def test_does_not_retry_unclassified_errors():
+    fn, calls = _flaky([PoktRPCError(1, "invalid address")])
+    policy = RetryPolicy(backoff_base=0)
+    with pytest.raises(PoktRPCError):
+        policy.call(fn, "ok")
+    assert len(calls) == 1
+
+
+def test_max_attempts_reraises_last_error():
+    fn, calls = _flaky([PoktHTTPError(503, "")] * 10)
+    policy = RetryPolicy(max_attempts=3, backoff_base=0)
+    with pytest.raises(PoktHTTPError):
+        policy.call(fn, "ok")
+    assert len(calls) == 3
+
+
+def test_deadline_stops_retrying():
+    fn, calls = _flaky([PoktHTTPError(503, "")] * 10)
+    policy = RetryPolicy(max_attempts=10, backoff_base=5, jitter=False, deadline=1)
+    with pytest.raises(PoktHTTPError):
+        policy.call(fn, "ok")
+    assert len(calls) == 1
+
+
+def test_budget_limits_retries():
+    budget = RetryBudget(ratio=0, min_retries=1)
+    fn, calls = _flaky([PoktHTTPError(503, "")] * 10)
+    policy = RetryPolicy(max_attempts=10, backoff_base=0, budget=budget)
+    with pytest.raises(PoktHTTPError):
+        policy.call(fn, "ok")
+    assert len(calls) == 2
+    assert budget.retries == 1
+    assert budget.rejected == 1
+
+
+def test_backoff_is_capped_exponential():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+    assert [policy.backoff(a) for a in range(1, 6)] == [1, 2, 4, 5, 5]
+    jittered = RetryPolicy(backoff_base=1, backoff_max=5)
+    assert all(0 <= jittered.backoff(4) <= 5 for _ in range(100))
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import time
+
+from pokt.rpc.data import get_block, get_height
+from pokt.rpc.data.async_network import async_get_height
+from pokt.rpc.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_identical_calls_share_one_upstream_call():
+    flight = SingleFlight()
+    calls = []
+
+    def upstream(rpc_method, *args, **kwargs):
+        calls.append(rpc_method)
+        time.sleep(0.2)
+        return 42
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(flight.call(upstream, get_height))
+        )
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [42] * 8
+    assert len(calls) == 1
+    assert flight.coalesced == 7
+
+
+def test_different_requests_are_not_coalesced():
+    flight = SingleFlight()
+    calls = []
+
+    def upstream(rpc_method, *args, **kwargs):
+        calls.append(kwargs)
+        return kwargs["height"]
+
+    assert flight.call(upstream, get_block, height=1) == 1
+    assert flight.call(upstream, get_block, height=2) == 2
+    assert len(calls) == 2
+
+
+def test_async_calls_share_result_and_errors():
+    calls = []
+
+    async def upstream(rpc_method, *args, **kwargs):
+        calls.append(rpc_method)
+        await asyncio.sleep(0.05)
+        if len(calls) > 1:
+            raise RuntimeError("upstream failed")
+        return 42
+
+    async def run():
+        flight = AsyncSingleFlight()
+        first = await asyncio.gather(
+            *[flight.call(upstream, async_get_height) for _ in range(5)]
+        )
+        assert first == [42] * 5
+        second = await asyncio.gather(
+            *[flight.call(upstream, async_get_height) for _ in range(3)],
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in second)
+
+    asyncio.run(run())
+    assert len(calls) == 2
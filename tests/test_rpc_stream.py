@@ -0,0 +1,111 @@
+import asyncio
+import time
+
+import pytest
+
+from pokt.rpc import EmptyBlockError
+from pokt.rpc.data import get_block, get_block_transactions
+from pokt.rpc.stream import EMPTY_BLOCK_RETRIES, astream_blocks, stream_blocks
+
+
+def _block(height):
+    return {"block": {"header": {"height": height, "num_txs": str(height % 3)}}}
+
+
+def _txs(height, page, per_page):
+    txs = [{"height": height, "index": i} for i in range(height % 3)]
+    return {
+        "txs": txs[(page - 1) * per_page : page * per_page],
+        "total_count": len(txs),
+    }
+
+
+def test_stream_blocks_in_order():
+    calls = []
+
+    def call(rpc_method, height=0, page=1, per_page=100, **kwargs):
+        calls.append(rpc_method.__name__)
+        # Later blocks come back first.
+        time.sleep(0.002 * (20 - height))
+        if rpc_method is get_block:
+            return _block(height)
+        assert rpc_method is get_block_transactions
+        return _txs(height, page, per_page)
+
+    blocks = list(stream_blocks(call, 5, 14, window=4, per_page=1))
+    assert [header["height"] for header, _ in blocks] == list(range(5, 15))
+    for header, txs in blocks:
+        assert [tx["index"] for tx in txs] == list(range(header["height"] % 3))
+    # Blocks without transactions don't request any.
+    assert calls.count("get_block_transactions") == sum(h % 3 for h in range(5, 15))
+
+
+def test_astream_blocks_follows_the_chain():
+    latest = [3]
+
+    async def call(rpc_method, height=0, page=1, per_page=100, **kwargs):
+        if rpc_method.__name__ == "async_get_height":
+            latest[0] += 1
+            return {"height": latest[0]}
+        await asyncio.sleep(0.001 * (10 - height))
+        if rpc_method.__name__ == "async_get_block":
+            return _block(height)
+        return _txs(height, page, per_page)
+
+    async def run():
+        heights = []
+        async for header, txs in astream_blocks(call, 1, poll_interval=0):
+            heights.append(header["height"])
+            if len(heights) == 6:
+                break
+        return heights
+
+    assert asyncio.run(run()) == [1, 2, 3, 4, 5, 6]
+
+
+def test_stream_blocks_requests_empty_blocks_again():
+    requests = {}
+
+    def call(rpc_method, height=0, page=1, per_page=100, **kwargs):
+        if rpc_method is get_block:
+            requests[height] = requests.get(height, 0) + 1
+            # Block 2 is empty on its first request, block 3 on every request.
+            if height == 3 or (height == 2 and requests[height] == 1):
+                return {"block": None}
+            return _block(height)
+        return _txs(height, page, per_page)
+
+    stream = stream_blocks(call, 1, 3, window=1, poll_interval=0)
+    assert [header["height"] for header, _ in [next(stream), next(stream)]] == [1, 2]
+    with pytest.raises(EmptyBlockError):
+        next(stream)
+    assert requests == {1: 1, 2: 2, 3: EMPTY_BLOCK_RETRIES + 1}
+
+
+def test_astream_blocks_raises_on_empty_blocks():
+    async def call(rpc_method, height=0, **kwargs):
+        return {"block": None}
+
+    async def run():
+        async for _ in astream_blocks(call, 1, 2, poll_interval=0):
+            pass
+
+    with pytest.raises(EmptyBlockError):
+        asyncio.run(run())
+
+
+def test_stream_blocks_rejects_the_arguments_it_sets():
+    def call(rpc_method, **kwargs):
+        raise AssertionError("nothing should be requested")
+
+    async def acall(rpc_method, **kwargs):
+        raise AssertionError("nothing should be requested")
+
+    async def run():
+        async for _ in astream_blocks(acall, 1, 2, order="desc"):
+            pass
+
+    with pytest.raises(TypeError, match="order"):
+        next(stream_blocks(call, 1, 2, order="desc"))
+    with pytest.raises(TypeError, match="order"):
+        asyncio.run(run())
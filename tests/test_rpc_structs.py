@@ -0,0 +1,62 @@
+import json
+import os
+
+import pytest
+
+from pokt.rpc import PoktRPCError, PortalRPCError
+from pokt.rpc.models import QueryBlockTXsResponse
+
+structs = pytest.importorskip("pokt.rpc.models.structs")
+
+REFERENCE = os.path.join(os.path.dirname(__file__), "reference", "blocktxs.json")
+
+
+@pytest.fixture
+def body():
+    with open(REFERENCE, "rb") as f:
+        return f.read()
+
+
+def test_structs_decode_like_the_models(body):
+    decoded = structs.decoder("QueryBlockTXsResponse")(body)
+    validated = QueryBlockTXsResponse(**json.loads(body))
+    assert len(decoded.txs) == len(validated.txs)
+    for tx, model in zip(decoded.txs, validated.txs):
+        assert tx.hash_ == model.hash_
+        assert tx.stdTx.entropy == model.stdTx.entropy
+        assert tx.stdTx.msg.type_ == model.stdTx.msg.type_
+        assert (
+            type(tx.stdTx.msg).__name__.split("_")[0] == type(model.stdTx.msg).__name__
+        )
+    proof = decoded.txs[0].stdTx.msg.value
+    assert isinstance(proof.leaf, structs.RelayProof)
+    assert proof.merkle_proofs.target_range.range_.lower.isdigit()
+    # Numeric strings are coerced as by the models.
+    assert decoded.txs[19].stdTx.msg.value.value == 15000000000
+
+
+def test_decoder_raises_rpc_errors():
+    decode = structs.decoder("QueryBlockTXsResponse")
+    with pytest.raises(PoktRPCError):
+        decode(b'{"code": 400, "message": "invalid height"}')
+    with pytest.raises(PortalRPCError):
+        decode(b'{"error": {"code": 429, "message": "rate limited"}}')
+    # Errors are found whether or not the response has required fields.
+    with pytest.raises(PoktRPCError):
+        structs.decoder("QueryHeightResponse")(b'{"code": 1, "message": "down"}')
+    with pytest.raises(PoktRPCError):
+        structs.builtins_decoder("QueryBlockTXsResponse", ("txs.tx",))(
+            b'{"code": 400, "message": "invalid height"}'
+        )
+
+
+def test_decoder_decodes_bodies_once(monkeypatch):
+    with open(REFERENCE, "rb") as f:
+        body = f.read()
+
+    def fail(body):
+        raise AssertionError("decoded again for errors")
+
+    monkeypatch.setattr(structs, "_raise_for_rpc_error", fail)
+    assert structs.decoder("QueryBlockTXsResponse")(body).total_count == 23
+    assert structs.decoder("QueryHeightResponse")(b'{"height": 10}').height == 10
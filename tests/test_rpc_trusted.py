@@ -0,0 +1,67 @@
+import copy
+import json
+import os
+
+import pytest
+
+from pokt.index.ingest import _block_response
+from pokt.rpc.data import block, get_block_transactions
+from pokt.rpc.models import QueryBlockTXsResponse, QueryBlockResponse
+from pokt.rpc.models.trusted import construct_trusted
+
+REFERENCE = os.path.join(os.path.dirname(__file__), "reference", "blocktxs.json")
+
+
+@pytest.fixture
+def block_txs():
+    with open(REFERENCE) as f:
+        return json.load(f)
+
+
+def test_trusted_matches_validated(block_txs):
+    trusted = construct_trusted(QueryBlockTXsResponse, block_txs)
+    assert trusted == QueryBlockTXsResponse(**block_txs)
+    assert [type(tx.stdTx.msg).__name__ for tx in trusted.txs[:2]] == [
+        "MsgProof",
+        "MsgProof",
+    ]
+    assert type(trusted.txs[0].stdTx.msg.value.leaf).__name__ == "RelayProof"
+
+
+def test_trusted_rejects_unknown_msg_type(block_txs):
+    block_txs["txs"][0]["stdTx"]["msg"]["type"] = "pos/Unknown"
+    with pytest.raises(ValueError):
+        construct_trusted(QueryBlockTXsResponse, block_txs)
+
+
+def test_trusted_runs_field_validators():
+    data = {
+        "block": {"header": {"chain_id": "mainnet", "height": "10"}, "evidence": "abc"}
+    }
+    trusted = construct_trusted(QueryBlockResponse, data)
+    assert trusted == QueryBlockResponse(**data)
+    assert trusted.block.evidence.evidence == "abc"
+    assert trusted.block.header.height == 10
+
+
+def test_data_functions_build_trusted(block_txs, monkeypatch):
+    monkeypatch.setattr(block, "post", lambda *args, **kwargs: copy.deepcopy(block_txs))
+    built = []
+
+    def spy(model, data):
+        built.append(model)
+        return construct_trusted(model, data)
+
+    monkeypatch.setattr(block, "construct_trusted", spy)
+    assert get_block_transactions("http://node", trusted=True) == QueryBlockTXsResponse(
+        **block_txs
+    )
+    assert built == [QueryBlockTXsResponse]
+    get_block_transactions("http://node")
+    assert built == [QueryBlockTXsResponse]
+
+
+def test_indexer_builds_trusted_blocks():
+    assert _block_response({"block": None}).block is None
+    data = {"block": {"header": {"chain_id": "mainnet", "height": "10"}}}
+    assert _block_response(data).block.header.height == 10
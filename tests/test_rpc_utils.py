@@ -0,0 +1,43 @@
+import socket
+import threading
+
+import pytest
+import requests
+
+from pokt.rpc.utils import PoolingHTTPAdapter, make_session, post
+
+
+@pytest.fixture
+def silent_server():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen()
+    accepted = []
+
+    def accept():
+        try:
+            conn, _ = sock.accept()
+            accepted.append(conn)
+        except OSError:
+            pass
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:{}".format(sock.getsockname()[1])
+    for conn in accepted:
+        conn.close()
+    sock.close()
+
+
+def test_make_session_mounts_pooling_adapter():
+    session = make_session(pool_maxsize=32, connect_timeout=1, read_timeout=2)
+    adapter = session.get_adapter("https://mainnet.gateway.pokt.network")
+    assert isinstance(adapter, PoolingHTTPAdapter)
+    assert adapter.timeout == (1, 2)
+    assert adapter._pool_maxsize == 32
+
+
+def test_session_read_timeout_applies_by_default(silent_server):
+    session = make_session(read_timeout=0.2)
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        post(silent_server + "/v1/query/height", session)